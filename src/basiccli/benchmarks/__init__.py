@@ -0,0 +1 @@
+"""Benchmark harness and workloads for BasicCli"""
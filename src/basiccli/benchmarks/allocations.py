@@ -0,0 +1,161 @@
+import gc
+import threading
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+from ..utils.memory import current_rss_bytes
+from .harness import BenchmarkHarness, Workload
+
+SAMPLE_INTERVAL = 0.005
+
+
+def run_with_memory(
+    harness: BenchmarkHarness, name: str, workload: Workload, top: int = 0
+) -> Dict[str, Any]:
+    """Run a benchmark and attach a ``memory`` section to its result.
+
+    GC collections and the RSS delta are taken across the normal timed run.
+    Allocation figures come from one extra round under ``tracemalloc``, kept
+    separate so tracing overhead never shows up in the timings.
+    """
+    gc_before = _gc_collections()
+    rss_before = current_rss_bytes()
+
+    result = harness.run(name, workload)
+
+    rss_after = current_rss_bytes()
+    gc_after = _gc_collections()
+
+    memory = trace_allocations(workload, result["iterations"], top)
+    memory["gc_collections"] = [a - b for a, b in zip(gc_after, gc_before)]
+    memory["rss_delta"] = rss_after - rss_before
+    result["memory"] = memory
+    return result
+
+
+def trace_allocations(
+    workload: Workload, iterations: int, top: int = 0
+) -> Dict[str, Any]:
+    """Trace one round for peak bytes and retained blocks, plus one sampled
+    round for the top allocating lines when ``top`` is set.
+
+    ``retained_blocks`` is the number of traced blocks allocated during the
+    round that are still alive when it ends, taken from a snapshot diff.
+    Blocks allocated and freed within the round are not counted.
+    """
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+
+    try:
+        gc.collect()
+        baseline = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        start_traced, _ = tracemalloc.get_traced_memory()
+
+        workload(iterations)
+
+        _, peak_traced = tracemalloc.get_traced_memory()
+        retained_blocks = _retained_blocks(baseline, tracemalloc.take_snapshot())
+        del baseline
+
+        # Snapshots are objects too, so sampling gets a round of its own
+        top_allocations = _sample_top_lines(workload, iterations, top) if top else []
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+
+    return {
+        "peak_traced": max(peak_traced - start_traced, 0),
+        "retained_blocks": retained_blocks,
+        "top_allocations": top_allocations,
+    }
+
+
+def _sample_top_lines(
+    workload: Workload, iterations: int, top: int
+) -> List[Dict[str, Any]]:
+    gc.collect()
+    baseline = tracemalloc.take_snapshot()
+    sampler = _PeakSampler()
+
+    sampler.start()
+    try:
+        workload(iterations)
+    finally:
+        sampler.stop()
+
+    return _top_lines(baseline, sampler.snapshot(), top)
+
+
+class _PeakSampler:
+    """Snapshots traced memory from a background thread whenever it reaches a
+    new high, approximating what was allocated at the round's peak."""
+
+    def __init__(self) -> None:
+        self.peak = -1
+        self.peak_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._sample()  # the final state may be the peak
+
+    def snapshot(self) -> tracemalloc.Snapshot:
+        assert self.peak_snapshot is not None
+        return self.peak_snapshot
+
+    def _run(self) -> None:
+        while not self._stop.wait(SAMPLE_INTERVAL):
+            self._sample()
+
+    def _sample(self) -> None:
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self.peak:
+            self.peak = current
+            self.peak_snapshot = tracemalloc.take_snapshot()
+
+
+def _retained_blocks(
+    baseline: tracemalloc.Snapshot, after: tracemalloc.Snapshot
+) -> int:
+    return sum(diff.count_diff for diff in _compare(baseline, after, "filename"))
+
+
+def _top_lines(
+    baseline: tracemalloc.Snapshot, peak: tracemalloc.Snapshot, top: int
+) -> List[Dict[str, Any]]:
+    differences = _compare(baseline, peak, "lineno")
+
+    growth = [diff for diff in differences if diff.size_diff > 0]
+
+    return [
+        {
+            "location": f"{diff.traceback[0].filename}:{diff.traceback[0].lineno}",
+            "size": diff.size_diff,
+            "count": diff.count_diff,
+        }
+        for diff in growth[:top]
+    ]
+
+
+def _compare(
+    baseline: tracemalloc.Snapshot, later: tracemalloc.Snapshot, key_type: str
+) -> List[tracemalloc.StatisticDiff]:
+    # Leave out the snapshots and the sampler thread themselves
+    own_files = [
+        tracemalloc.Filter(False, path)
+        for path in (__file__, tracemalloc.__file__, threading.__file__)
+    ]
+    return later.filter_traces(own_files).compare_to(
+        baseline.filter_traces(own_files), key_type
+    )
+
+
+def _gc_collections() -> List[int]:
+    return [generation["collections"] for generation in gc.get_stats()]
@@ -0,0 +1,140 @@
+import platform
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from ..utils.file_handler import FileError, FileHandler
+from .stats import mean, welch_t_test
+
+DEFAULT_BASELINE_FILE = ".benchmarks/baselines.json"
+# Fewer rounds than this on either side leave the t-test without a usable
+# variance, so such comparisons fall back to the threshold alone
+MIN_TEST_ROUNDS = 3
+
+
+class BaselineError(Exception):
+    pass
+
+
+@dataclass
+class Comparison:
+    key: str
+    name: str
+    baseline_time: float
+    current_time: float
+    change: float
+    p_value: Optional[float]
+    status: str
+
+    @property
+    def tested(self) -> bool:
+        """Whether the status is backed by a significance test"""
+        return self.p_value is not None
+
+    @property
+    def is_regression(self) -> bool:
+        return self.status == "regression"
+
+
+class BaselineStore:
+    """Named benchmark baselines kept together in one JSON file"""
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_BASELINE_FILE) -> None:
+        self.path = Path(path)
+
+    def names(self) -> List[str]:
+        return sorted(self._load_all())
+
+    def save(self, name: str, results: Dict[str, Dict[str, Any]]) -> None:
+        baselines = self._load_all()
+        baselines[name] = {
+            "timestamp": time.ctime(),
+            "platform": platform.platform(),
+            "python_version": sys.version.split()[0],
+            "benchmarks": {
+                key: {
+                    "name": r["name"],
+                    "iterations": r["iterations"],
+                    "avg_time": r["avg_time"],
+                    "samples": r["samples"],
+                }
+                for key, r in results.items()
+            },
+        }
+        FileHandler.atomic_write(self.path, {"baselines": baselines}, format="json")
+
+    def load(self, name: str) -> Dict[str, Dict[str, Any]]:
+        baselines = self._load_all()
+        if name not in baselines:
+            available = ", ".join(sorted(baselines)) or "none"
+            raise BaselineError(
+                f"Unknown baseline '{name}' in {self.path} (available: {available})"
+            )
+        benchmarks: Dict[str, Dict[str, Any]] = baselines[name]["benchmarks"]
+        return benchmarks
+
+    def _load_all(self) -> Dict[str, Any]:
+        if not self.path.exists():
+            return {}
+        try:
+            baselines: Dict[str, Any] = FileHandler.read(self.path, format="json").get(
+                "baselines", {}
+            )
+            return baselines
+        except (FileError, AttributeError) as e:
+            raise BaselineError(f"Corrupt baseline file {self.path}: {e}")
+
+
+def compare_results(
+    baseline: Dict[str, Dict[str, Any]],
+    current: Dict[str, Dict[str, Any]],
+    threshold: float = 0.10,
+    alpha: float = 0.05,
+) -> List[Comparison]:
+    """Compare per-operation times of current results against a baseline.
+
+    A benchmark is a regression (or improvement) only when its mean time moved
+    by more than ``threshold`` (a fraction) and Welch's t-test on the round
+    samples gives p < ``alpha``; larger moves that fail the test are "noise".
+    With fewer than ``MIN_TEST_ROUNDS`` samples on either side there is no
+    test: ``p_value`` is None and the threshold alone decides. Benchmarks
+    missing from the baseline are skipped.
+    """
+    comparisons = []
+
+    for key, result in current.items():
+        if key not in baseline:
+            continue
+
+        base_samples = baseline[key]["samples"]
+        base_time = mean(base_samples)
+        current_time = mean(result["samples"])
+        change = (current_time - base_time) / base_time if base_time > 0 else 0.0
+        p_value: Optional[float] = None
+        if min(len(base_samples), len(result["samples"])) >= MIN_TEST_ROUNDS:
+            _, p_value = welch_t_test(base_samples, result["samples"])
+
+        if abs(change) <= threshold:
+            status = "unchanged"
+        elif p_value is not None and p_value >= alpha:
+            status = "noise"
+        elif change > 0:
+            status = "regression"
+        else:
+            status = "improvement"
+
+        comparisons.append(
+            Comparison(
+                key=key,
+                name=result["name"],
+                baseline_time=base_time,
+                current_time=current_time,
+                change=change,
+                p_value=p_value,
+                status=status,
+            )
+        )
+
+    return comparisons
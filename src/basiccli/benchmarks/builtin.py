@@ -0,0 +1,92 @@
+"""Built-in benchmark workloads, registered in display order"""
+
+import json
+import tempfile
+import time
+from typing import Iterator
+
+from .harness import Workload
+from .registry import benchmark
+
+
+@benchmark("string_manipulation", "String Manipulation", tags=["cpu"], default_size=1)
+def string_manipulation(size: int) -> Workload:
+    def workload(iterations: int) -> None:
+        for i in range(iterations):
+            text = f"Hello World {i}" * size
+            text = text.upper()
+            text = text[::-1]  # reverse
+            text = "".join("*" if c in "AEIOU" else c for c in text)
+            "-".join(text)
+
+    return workload
+
+
+@benchmark("list_operations", "List Operations", tags=["cpu"], default_size=100)
+def list_operations(size: int) -> Workload:
+    def workload(iterations: int) -> None:
+        for _ in range(iterations):
+            arr = list(range(1, size + 1))
+            arr = [n * 2 for n in arr]
+            arr = [n for n in arr if n % 3 == 0]
+            arr = sorted(arr, reverse=True)
+            sum(arr)
+
+    return workload
+
+
+@benchmark("file_io", "File I/O", tags=["io"], default_size=100)
+def file_io(size: int) -> Iterator[Workload]:
+    with tempfile.NamedTemporaryFile(mode="w+", delete=True) as temp_file:
+
+        def workload(iterations: int) -> None:
+            for i in range(iterations):
+                temp_file.seek(0)
+                temp_file.write(f"Line {i}: {'x' * size}\n")
+                temp_file.flush()
+                temp_file.seek(0)
+                temp_file.read()
+
+        yield workload
+
+
+@benchmark("json_parsing", "JSON Parsing", tags=["cpu", "json"], default_size=10)
+def json_parsing(size: int) -> Workload:
+    sample_data = {
+        "users": [
+            {
+                "id": i,
+                "name": f"User {i}",
+                "email": f"user{i}@example.com",
+                "metadata": {
+                    "created_at": time.ctime(),
+                    "tags": ["python", "ptd", "cli", "benchmark"],
+                },
+            }
+            for i in range(1, size + 1)
+        ]
+    }
+
+    json_string = json.dumps(sample_data)
+
+    def workload(iterations: int) -> None:
+        for _ in range(iterations):
+            parsed = json.loads(json_string)
+            json.dumps(parsed)
+
+    return workload
+
+
+@benchmark("dict_operations", "Dict Operations", tags=["cpu"], default_size=100)
+def dict_operations(size: int) -> Workload:
+    def workload(iterations: int) -> None:
+        for _ in range(iterations):
+            data = {}
+            for i in range(size):
+                data[f"key_{i}"] = i * 2
+            sorted(data.keys())
+            sum(data.values())
+            data.update({"extra": 999})
+            {k: v for k, v in data.items() if isinstance(v, int) and v > 50}
+
+    return workload
@@ -0,0 +1,241 @@
+"""FileHandler I/O benchmarks (opt-in: select with ``--tag file_handler``).
+
+Every benchmark is sizeable, with the size being the fixture size in bytes.
+Fixtures are written as a stream, so the checksum and copy benchmarks take
+``--sweep --sweep-factor 16`` from 64 KB up to 4 GB. Structured reads and
+writes hold the whole document in memory, so their sweeps stop at
+``MAX_STRUCTURED_SIZE`` (256 MB) and skip larger sizes. Results include MB/s.
+Cold-cache variants evict the fixture from the page cache with
+``posix_fadvise(POSIX_FADV_DONTNEED)`` before every operation; the eviction
+call itself is inside the timed loop but costs far less than the read."""
+
+import json
+import os
+import tempfile
+import textwrap
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import yaml
+
+from ..utils.file_handler import FileHandler
+from ..utils.parse_cache import ParseCache
+from .harness import Workload, with_bytes_per_op
+from .registry import benchmark
+
+DEFAULT_SIZE = 64 * 1024
+# Parsed records take several times their file size, so bound structured runs
+MAX_STRUCTURED_SIZE = 256 * 1024 * 1024
+FORMATS = ["json", "yaml", "csv"]
+# Approximate serialized size of one generated record in each format
+RECORD_BYTES = {"json": 135, "yaml": 95, "csv": 55}
+
+COLD_CACHE_SUPPORTED = hasattr(os, "posix_fadvise")
+
+Setup = Callable[[int], Iterator[Workload]]
+
+
+def iter_records(size: int, format: str = "json") -> Iterator[Dict[str, Any]]:
+    for i in range(max(1, size // RECORD_BYTES[format])):
+        yield {
+            "id": i,
+            "name": f"user-{i:08d}",
+            "email": f"user{i}@example.com",
+            "score": round(i * 1.5, 2),
+            "active": i % 2 == 0,
+        }
+
+
+def make_records(size: int, format: str = "json") -> List[Dict[str, Any]]:
+    check_structured_size(size)
+    return list(iter_records(size, format))
+
+
+def check_structured_size(size: int) -> None:
+    if size > MAX_STRUCTURED_SIZE:
+        raise ValueError(
+            f"Structured file_handler benchmarks are limited to "
+            f"{MAX_STRUCTURED_SIZE} bytes, got {size}"
+        )
+
+
+def write_fixture(path: Path, size: int, format: str) -> int:
+    """Write a fixture of roughly ``size`` bytes and flush it to disk, so the
+    page cache holds only clean pages that DONTNEED can drop"""
+    if format == "bytes":
+        chunk = os.urandom(min(size, 1024 * 1024))
+        with path.open("wb") as f:
+            for offset in range(0, size, len(chunk)):
+                f.write(chunk[: size - offset])
+    elif format == "csv":
+        FileHandler.write_csv(path, iter_records(size, format))
+    else:
+        _stream_records(path, iter_records(size, format), format)
+
+    with path.open("rb") as f:
+        os.fsync(f.fileno())
+    return path.stat().st_size
+
+
+def _stream_records(path: Path, records: Iterator[Dict[str, Any]], format: str) -> None:
+    # Same bytes as FileHandler.write, one record at a time
+    with path.open("w") as f:
+        if format == "yaml":
+            for record in records:
+                f.write(yaml.dump([record], default_flow_style=False))
+            return
+
+        f.write("[")
+        for i, record in enumerate(records):
+            f.write(",\n" if i else "\n")
+            f.write(textwrap.indent(json.dumps(record, indent=2), "  "))
+        f.write("\n]")
+
+
+def evict(path: Path) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+def _read(format: str, cold: bool, disk_cache: bool = False) -> Setup:
+    def setup(size: int) -> Iterator[Workload]:
+        check_structured_size(size)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / f"fixture.{format}"
+            nbytes = write_fixture(path, size, format)
+            # Disk tier only, as seen by a fresh process: no in-memory hits
+            cache = (
+                ParseCache(max_entries=0, directory=Path(temp_dir) / "cache")
+                if disk_cache
+                else None
+            )
+
+            def workload(iterations: int) -> None:
+                for _ in range(iterations):
+                    if cold:
+                        evict(path)
+                    FileHandler.read(path, cache=cache)
+
+            yield with_bytes_per_op(workload, nbytes)
+
+    return setup
+
+
+def _write(format: str, atomic: bool) -> Setup:
+    def setup(size: int) -> Iterator[Workload]:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / f"output.{format}"
+            records = make_records(size, format)
+            write = FileHandler.atomic_write if atomic else FileHandler.write
+            write(path, records, format=format)
+
+            def workload(iterations: int) -> None:
+                for _ in range(iterations):
+                    write(path, records, format=format)
+
+            yield with_bytes_per_op(workload, path.stat().st_size)
+
+    return setup
+
+
+def _checksum(cold: bool, method: str = "checksum") -> Setup:
+    def setup(size: int) -> Iterator[Workload]:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "fixture.bin"
+            nbytes = write_fixture(path, size, "bytes")
+
+            def workload(iterations: int) -> None:
+                for _ in range(iterations):
+                    if cold:
+                        evict(path)
+                    getattr(FileHandler, method)(path)
+
+            yield with_bytes_per_op(workload, nbytes)
+
+    return setup
+
+
+def _copy(cold: bool) -> Setup:
+    def setup(size: int) -> Iterator[Workload]:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = Path(temp_dir) / "fixture.bin"
+            destination = Path(temp_dir) / "copy" / "fixture.bin"
+            nbytes = write_fixture(source, size, "bytes")
+
+            def workload(iterations: int) -> None:
+                for _ in range(iterations):
+                    if cold:
+                        evict(source)
+                    FileHandler.copy(source, destination)
+
+            yield with_bytes_per_op(workload, nbytes)
+
+    return setup
+
+
+def _register(
+    key: str, name: str, setup: Setup, tags: List[str], max_size: Optional[int] = None
+) -> None:
+    benchmark(
+        f"file_handler.{key}",
+        name,
+        tags=["io", "file_handler"] + tags,
+        default_size=DEFAULT_SIZE,
+        opt_in=True,
+        max_size=max_size,
+    )(setup)
+
+
+for _format in FORMATS:
+    _label = _format.upper()
+    _register(
+        f"read.{_format}",
+        f"FileHandler.read {_label}",
+        _read(_format, False),
+        [_format],
+        MAX_STRUCTURED_SIZE,
+    )
+    if COLD_CACHE_SUPPORTED:
+        _register(
+            f"read.{_format}.cold",
+            f"FileHandler.read {_label} (cold)",
+            _read(_format, True),
+            [_format, "cold"],
+            MAX_STRUCTURED_SIZE,
+        )
+    _register(
+        f"read.{_format}.disk_cache",
+        f"FileHandler.read {_label} (disk cache)",
+        _read(_format, False, disk_cache=True),
+        [_format, "cache"],
+        MAX_STRUCTURED_SIZE,
+    )
+    _register(
+        f"write.{_format}",
+        f"FileHandler.write {_label}",
+        _write(_format, False),
+        [_format],
+        MAX_STRUCTURED_SIZE,
+    )
+    _register(
+        f"atomic_write.{_format}",
+        f"FileHandler.atomic_write {_label}",
+        _write(_format, True),
+        [_format],
+        MAX_STRUCTURED_SIZE,
+    )
+
+_register("checksum", "FileHandler.checksum", _checksum(False), [])
+_register("copy", "FileHandler.copy", _copy(False), [])
+_register(
+    "tree_checksum",
+    "FileHandler.tree_checksum",
+    _checksum(False, "tree_checksum"),
+    [],
+)
+if COLD_CACHE_SUPPORTED:
+    _register("checksum.cold", "FileHandler.checksum (cold)", _checksum(True), ["cold"])
+    _register("copy.cold", "FileHandler.copy (cold)", _copy(True), ["cold"])
@@ -0,0 +1,95 @@
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from .stats import summarize
+
+Workload = Callable[[int], Any]
+
+
+def with_bytes_per_op(workload: Workload, nbytes: int) -> Workload:
+    """Mark a workload as moving ``nbytes`` per operation, so its results
+    include throughput in MB/s"""
+
+    def measured(iterations: int) -> Any:
+        return workload(iterations)
+
+    # Wrapped rather than tagged in place, since bound methods take no attributes
+    measured.bytes_per_op = nbytes  # type: ignore[attr-defined]
+    return measured
+
+
+@dataclass
+class BenchmarkHarness:
+    """Times a workload over warmup and measured rounds.
+
+    A workload is called with an iteration count and runs its operation that
+    many times, so loop overhead stays inside the workload rather than in
+    per-call timing. Per-operation times from each measured round form the
+    samples the statistics are computed from.
+    """
+
+    iterations: int = 1000
+    rounds: int = 5
+    warmup: int = 1
+    target_time: Optional[float] = None
+    timer: Callable[[], float] = time.perf_counter
+
+    MAX_CALIBRATION_STEPS = 30
+
+    def run(self, name: str, workload: Workload) -> Dict[str, Any]:
+        iterations = self.calibrate(workload) if self.target_time else self.iterations
+
+        for _ in range(self.warmup):
+            workload(iterations)
+
+        samples = [self._time_round(workload, iterations) for _ in range(self.rounds)]
+        stats = summarize(samples)
+
+        return {
+            "name": name,
+            "iterations": iterations,
+            "rounds": self.rounds,
+            "warmup": self.warmup,
+            "total_time": sum(samples) * iterations,
+            "avg_time": stats["mean"],
+            "ops_per_sec": 1 / stats["mean"] if stats["mean"] > 0 else float("inf"),
+            "min_time": stats["min"],
+            "max_time": stats["max"],
+            "median_time": stats["median"],
+            "p95_time": stats["p95"],
+            "p99_time": stats["p99"],
+            "stddev_time": stats["stddev"],
+            "samples": samples,
+            **self._throughput(workload, stats["mean"]),
+        }
+
+    def _throughput(self, workload: Workload, avg_time: float) -> Dict[str, Any]:
+        nbytes = getattr(workload, "bytes_per_op", None)
+        if nbytes is None:
+            return {}
+        return {
+            "bytes_per_op": nbytes,
+            "mb_per_sec": nbytes / avg_time / 1_000_000 if avg_time > 0 else 0.0,
+        }
+
+    def calibrate(self, workload: Workload) -> int:
+        """Find an iteration count whose measured rounds fill target_time"""
+        assert self.target_time is not None
+        round_budget = self.target_time / self.rounds
+        iterations = 1
+
+        for _ in range(self.MAX_CALIBRATION_STEPS):
+            elapsed = self._time_round(workload, iterations) * iterations
+            if elapsed >= round_budget:
+                break
+            # Grow towards the budget, at most 10x per step to absorb noise
+            scale = round_budget / elapsed if elapsed > 0 else 10
+            iterations = max(iterations + 1, int(iterations * min(scale * 1.1, 10)))
+
+        return iterations
+
+    def _time_round(self, workload: Workload, iterations: int) -> float:
+        start_time = self.timer()
+        workload(iterations)
+        return (self.timer() - start_time) / iterations
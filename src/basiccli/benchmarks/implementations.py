@@ -0,0 +1,263 @@
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..utils.memory import maxrss_to_bytes
+from .stats import percentile
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+DEFAULT_PYTHON_COMMAND = [str(PROJECT_ROOT / "bin" / "basiccli-python")]
+DEFAULT_RUST_COMMAND = [str(PROJECT_ROOT / "target" / "release" / "basiccli-rust")]
+
+# The Rust port kept the names of the Ruby original for two workloads
+RUST_BENCHMARK_ALIASES = {
+    "Array Operations": "List Operations",
+    "Hash Operations": "Dict Operations",
+}
+
+# Forks and execs the command, then reports "status maxrss seconds" on a pipe
+_LAUNCHER = """
+import os, sys, time
+report, argv = int(sys.argv[1]), sys.argv[2:]
+start = time.perf_counter()
+pid = os.fork()
+if pid == 0:
+    os.close(report)
+    try:
+        os.execvp(argv[0], argv)
+    except OSError as e:
+        os.write(2, f"{argv[0]}: {e.strerror}\\n".encode())
+        os._exit(127)
+_, status, usage = os.wait4(pid, 0)
+elapsed = time.perf_counter() - start
+code = os.waitstatus_to_exitcode(status)
+os.write(report, f"{code} {usage.ru_maxrss} {elapsed}".encode())
+"""
+
+_LOG_PREFIX = re.compile(r"^\[[^\]]*\] ", re.MULTILINE)
+_JSON_START = re.compile(r"^[\[{]", re.MULTILINE)
+
+SAMPLE_DOCUMENT = {
+    "users": [
+        {"id": i, "name": f"User {i}", "active": i % 2 == 0, "score": i * 1.5}
+        for i in range(50)
+    ],
+    "metadata": {"version": "1.0", "count": 50},
+}
+
+
+@dataclass
+class RunResult:
+    returncode: int
+    stdout: str
+    stderr: str
+    wall_time: float
+    max_rss: int
+
+
+@dataclass
+class CliCase:
+    name: str
+    args: List[str]
+    # Banners that name the implementation can never match
+    check_parity: bool = True
+
+
+@dataclass
+class CaseComparison:
+    name: str
+    python: Dict[str, float]
+    rust: Dict[str, float]
+    parity: Optional[bool]
+    speedup: float
+
+
+@dataclass
+class WorkloadComparison:
+    name: str
+    python_ops_per_sec: float
+    rust_ops_per_sec: float
+    speedup: float
+
+
+def run_once(command: List[str], cwd: Optional[str] = None) -> RunResult:
+    """Run a command to completion, measuring wall time and peak RSS.
+
+    Linux folds the resident pages a child inherits at fork into its
+    ``ru_maxrss``, so the command is started from a minimal launcher
+    interpreter rather than from this (much larger) process. The launcher's
+    own footprint is the floor below which peak RSS cannot be resolved; see
+    ``rss_floor``.
+    """
+    read_fd, write_fd = os.pipe()
+    try:
+        with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+            launcher = subprocess.Popen(
+                [sys.executable, "-S", "-I", "-c", _LAUNCHER, str(write_fd)] + command,
+                cwd=cwd,
+                stdin=subprocess.DEVNULL,
+                stdout=out,
+                stderr=err,
+                pass_fds=[write_fd],
+            )
+            os.close(write_fd)
+            write_fd = -1
+            with os.fdopen(read_fd, "rb") as report:
+                read_fd = -1
+                fields = report.read().split()
+            launcher.wait()
+
+            if len(fields) != 3:
+                raise RuntimeError(f"Could not run {command[0]}")
+
+            out.seek(0)
+            err.seek(0)
+            return RunResult(
+                returncode=int(fields[0]),
+                stdout=out.read().decode(errors="replace"),
+                stderr=err.read().decode(errors="replace"),
+                wall_time=float(fields[2]),
+                max_rss=maxrss_to_bytes(int(fields[1])),
+            )
+    finally:
+        for fd in (read_fd, write_fd):
+            if fd >= 0:
+                os.close(fd)
+
+
+def rss_floor() -> int:
+    """Peak RSS reported for a trivial command, i.e. the launcher's footprint"""
+    return run_once(["true"]).max_rss
+
+
+def normalize_output(text: str) -> str:
+    """Drop log timestamps and trailing whitespace before comparing outputs"""
+    lines = _LOG_PREFIX.sub("", text).splitlines()
+    return "\n".join(line.rstrip() for line in lines).strip()
+
+
+def outputs_match(first: str, second: str) -> bool:
+    """Compare normalized outputs, parsing a trailing JSON document so its key
+    order and layout don't count (serde_json prints keys sorted)"""
+    return _comparable(first) == _comparable(second)
+
+
+def _comparable(text: str) -> Tuple[str, Any]:
+    text = normalize_output(text)
+    match = _JSON_START.search(text)
+    if match:
+        try:
+            return text[: match.start()], json.loads(text[match.start() :])
+        except ValueError:
+            pass
+    return text, None
+
+
+def default_cases(sample_file: str) -> List[CliCase]:
+    return [
+        CliCase("hello", ["hello", "World"]),
+        CliCase("version", ["version"], check_parity=False),
+        CliCase("process", ["process", sample_file, "--pretty"]),
+    ]
+
+
+@dataclass
+class ImplementationComparison:
+    """Runs the same CLI invocations and workloads against both builds"""
+
+    python_command: List[str] = field(
+        default_factory=lambda: list(DEFAULT_PYTHON_COMMAND)
+    )
+    rust_command: List[str] = field(default_factory=lambda: list(DEFAULT_RUST_COMMAND))
+    repeats: int = 5
+    iterations: int = 1000
+
+    def check_available(self) -> None:
+        for label, command in (
+            ("Python", self.python_command),
+            ("Rust", self.rust_command),
+        ):
+            if shutil.which(command[0]) is None:
+                hint = (
+                    " (build it with: cargo build --release)" if label == "Rust" else ""
+                )
+                raise FileNotFoundError(
+                    f"{label} implementation not found: {command[0]}{hint}"
+                )
+
+    def compare_cases(self, cases: List[CliCase]) -> List[CaseComparison]:
+        comparisons = []
+
+        for case in cases:
+            python_runs = self._repeat(self.python_command + case.args)
+            rust_runs = self._repeat(self.rust_command + case.args)
+
+            parity = None
+            if case.check_parity:
+                parity = outputs_match(python_runs[0].stdout, rust_runs[0].stdout) and (
+                    python_runs[0].returncode == rust_runs[0].returncode
+                )
+
+            python = self._summarize_runs(python_runs)
+            rust = self._summarize_runs(rust_runs)
+            comparisons.append(
+                CaseComparison(
+                    name=case.name,
+                    python=python,
+                    rust=rust,
+                    parity=parity,
+                    speedup=_ratio(python["cold_start"], rust["cold_start"]),
+                )
+            )
+
+        return comparisons
+
+    def compare_workloads(self) -> List[WorkloadComparison]:
+        args = ["benchmark", str(self.iterations), "--output", "json"]
+        python = self._workload_throughput(self.python_command + args)
+        rust = self._workload_throughput(self.rust_command + args)
+
+        return [
+            WorkloadComparison(
+                name=name,
+                python_ops_per_sec=ops,
+                rust_ops_per_sec=rust[name],
+                speedup=_ratio(rust[name], ops),
+            )
+            for name, ops in python.items()
+            if name in rust
+        ]
+
+    def _repeat(self, command: List[str]) -> List[RunResult]:
+        return [run_once(command) for _ in range(self.repeats)]
+
+    def _summarize_runs(self, runs: List[RunResult]) -> Dict[str, float]:
+        return {
+            "cold_start": percentile([r.wall_time for r in runs], 50),
+            "max_rss": max(r.max_rss for r in runs),
+        }
+
+    def _workload_throughput(self, command: List[str]) -> Dict[str, float]:
+        result = run_once(command)
+        if result.returncode != 0:
+            raise RuntimeError(
+                f"{' '.join(command)} exited with {result.returncode}: "
+                f"{result.stderr.strip()}"
+            )
+
+        data: Dict[str, Any] = json.loads(result.stdout)
+        return {
+            RUST_BENCHMARK_ALIASES.get(b["name"], b["name"]): b["ops_per_second"]
+            for b in data["benchmarks"]
+        }
+
+
+def _ratio(numerator: float, denominator: float) -> float:
+    return numerator / denominator if denominator > 0 else 0.0
@@ -0,0 +1,125 @@
+"""Run benchmarks in fresh interpreters, optionally in parallel and pinned.
+
+Each benchmark gets its own ``python -m basiccli.benchmarks.isolation``
+subprocess, so heap, GC and cache state never carry over from one benchmark
+to the next. The parent sends the benchmark key and harness settings as JSON
+on stdin and reads the harness result back as JSON on stdout.
+"""
+
+import json
+import os
+import queue
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .allocations import run_with_memory
+from .harness import BenchmarkHarness
+from .registry import BenchmarkSpec, registry
+
+PACKAGE_PARENT = str(Path(__file__).resolve().parents[2])
+
+
+def available_cpus() -> List[int]:
+    if not hasattr(os, "sched_getaffinity"):
+        raise OSError("CPU pinning requires os.sched_setaffinity (Linux)")
+    return sorted(os.sched_getaffinity(0))
+
+
+@dataclass
+class IsolatedRunner:
+    harness: Dict[str, Any] = field(default_factory=dict)
+    modules: List[str] = field(default_factory=list)
+    jobs: int = 1
+    pin_cpus: bool = False
+    # None skips memory profiling; otherwise the number of top lines to list
+    top_allocations: Optional[int] = None
+    python: str = sys.executable
+
+    def run(self, specs: List[BenchmarkSpec]) -> Dict[str, Dict[str, Any]]:
+        """Run every spec in its own subprocess; results keep the spec order"""
+        cpus: "queue.Queue[Optional[int]]" = queue.Queue()
+        if self.pin_cpus:
+            allowed = available_cpus()
+            if len(allowed) < self.jobs:
+                raise ValueError(
+                    f"Cannot pin {self.jobs} jobs to {len(allowed)} available CPUs"
+                )
+            for cpu in allowed[: self.jobs]:
+                cpus.put(cpu)
+        else:
+            for _ in range(self.jobs):
+                cpus.put(None)
+
+        def run_pinned(spec: BenchmarkSpec) -> Dict[str, Any]:
+            # Each running job holds one CPU, so jobs never share a core
+            cpu = cpus.get()
+            try:
+                return self.run_one(spec.key, cpu)
+            finally:
+                cpus.put(cpu)
+
+        # Threads only wait on the subprocesses, which do the actual work
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            results = list(executor.map(run_pinned, specs))
+
+        return {spec.key: result for spec, result in zip(specs, results)}
+
+    def run_one(self, key: str, cpu: Optional[int] = None) -> Dict[str, Any]:
+        request = {
+            "key": key,
+            "harness": self.harness,
+            "modules": self.modules,
+            "cpu": cpu,
+            "top_allocations": self.top_allocations,
+        }
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            p for p in [PACKAGE_PARENT, env.get("PYTHONPATH")] if p
+        )
+
+        completed = subprocess.run(
+            [self.python, "-m", __name__],
+            input=json.dumps(request),
+            capture_output=True,
+            text=True,
+            env=env,
+        )
+        if completed.returncode != 0:
+            detail = completed.stderr.strip().splitlines()
+            raise RuntimeError(
+                f"Benchmark {key} failed in subprocess: "
+                f"{detail[-1] if detail else f'exit code {completed.returncode}'}"
+            )
+        result: Dict[str, Any] = json.loads(completed.stdout)
+        return result
+
+
+def main() -> None:
+    request = json.load(sys.stdin)
+
+    if request["cpu"] is not None:
+        os.sched_setaffinity(0, {request["cpu"]})
+
+    registry.load_plugins(request["modules"])
+    spec = registry.get(request["key"])
+
+    # Keep stdout for the result even if a workload prints
+    result_output, sys.stdout = sys.stdout, sys.stderr
+    harness = BenchmarkHarness(**request["harness"])
+    with spec.open() as workload:
+        if request["top_allocations"] is None:
+            result = harness.run(spec.name, workload)
+        else:
+            result = run_with_memory(
+                harness, spec.name, workload, request["top_allocations"]
+            )
+
+    json.dump(result, result_output)
+
+
+if __name__ == "__main__":
+    main()
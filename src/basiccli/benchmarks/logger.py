@@ -0,0 +1,106 @@
+"""Logger benchmarks (opt-in: select with ``--tag logging``).
+
+Each operation logs one DEBUG record, so ops/sec is records/sec. The flush
+benchmarks write to a FileLogger under each flush policy; the format
+benchmarks write to the null device to isolate formatting cost. The call
+benchmarks time one ``debug("...%s", i)`` call with DEBUG disabled and
+enabled, for the per-call overhead in ns.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Iterator
+
+from ..utils.logger import LOG_FORMATS, FileLogger, FlushPolicy, Logger, LogLevel
+from .harness import Workload
+from .registry import benchmark
+
+FLUSH_POLICIES = {
+    "every_record": FlushPolicy(),
+    "every_100": FlushPolicy(records=100),
+    "every_50ms": FlushPolicy(records=None, interval_ms=50),
+    "errors_only": FlushPolicy(records=None, level=LogLevel.ERROR),
+}
+
+
+def _file_logger(policy: FlushPolicy) -> Callable[[], Iterator[Workload]]:
+    def setup() -> Iterator[Workload]:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            logger = FileLogger(
+                str(Path(temp_dir) / "bench.log"),
+                level=LogLevel.DEBUG,
+                flush_policy=policy,
+            )
+
+            def workload(iterations: int) -> None:
+                for i in range(iterations):
+                    logger.debug("Processed record", {"index": i, "status": "ok"})
+
+            try:
+                yield workload
+            finally:
+                logger.file.close()
+
+    return setup
+
+
+for _key, _policy in FLUSH_POLICIES.items():
+    benchmark(
+        f"logger.flush.{_key}",
+        f"FileLogger flush {_key.replace('_', ' ')}",
+        tags=["logging"],
+        opt_in=True,
+    )(_file_logger(_policy))
+
+
+def _null_logger(format: str) -> Callable[[], Iterator[Workload]]:
+    def setup() -> Iterator[Workload]:
+        with open(os.devnull, "w") as output:
+            logger = Logger(level=LogLevel.DEBUG, output=output, format=format)
+
+            def workload(iterations: int) -> None:
+                for i in range(iterations):
+                    logger.debug("Processed record", {"index": i, "status": "ok"})
+
+            yield workload
+
+    return setup
+
+
+for _format in LOG_FORMATS:
+    benchmark(
+        f"logger.format.{_format}",
+        f"Logger format {_format}",
+        tags=["logging"],
+        opt_in=True,
+    )(_null_logger(_format))
+
+
+def _debug_call(level: LogLevel) -> Callable[[], Iterator[Workload]]:
+    def setup() -> Iterator[Workload]:
+        with open(os.devnull, "w") as output:
+            logger = Logger(level=level, output=output)
+
+            def workload(iterations: int) -> None:
+                debug = logger.debug
+                for i in range(iterations):
+                    debug("Processed record %d", i)
+
+            yield workload
+
+    return setup
+
+
+benchmark(
+    "logger.call.disabled",
+    "Logger debug call (disabled)",
+    tags=["logging"],
+    opt_in=True,
+)(_debug_call(LogLevel.INFO))
+benchmark(
+    "logger.call.enabled",
+    "Logger debug call (enabled)",
+    tags=["logging"],
+    opt_in=True,
+)(_debug_call(LogLevel.DEBUG))
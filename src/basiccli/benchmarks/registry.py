@@ -0,0 +1,129 @@
+import importlib
+import inspect
+import os
+import sys
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from importlib.metadata import entry_points
+from typing import Callable, ContextManager, Dict, Iterable, List, Optional
+
+from .harness import Workload
+
+ENTRY_POINT_GROUP = "basiccli.benchmarks"
+
+
+@dataclass
+class BenchmarkSpec:
+    """A registered benchmark.
+
+    ``setup`` returns the workload. It may instead be a generator that yields
+    the workload, in which case the code after ``yield`` runs as teardown once
+    the benchmark has finished. Benchmarks registered with a ``default_size``
+    take the input size as their only argument, which lets ``--sweep`` vary it
+    up to ``max_size``. Opt-in benchmarks only run when selected by key or tag.
+    """
+
+    key: str
+    name: str
+    setup: Callable[..., object]
+    tags: List[str] = field(default_factory=list)
+    default_size: Optional[int] = None
+    opt_in: bool = False
+    max_size: Optional[int] = None
+
+    @property
+    def sizeable(self) -> bool:
+        return self.default_size is not None
+
+    def open(self, size: Optional[int] = None) -> ContextManager[Workload]:
+        args = [] if self.default_size is None else [size or self.default_size]
+        if inspect.isgeneratorfunction(self.setup):
+            return contextmanager(self.setup)(*args)  # type: ignore[arg-type]
+        return nullcontext(self.setup(*args))  # type: ignore[arg-type]
+
+
+class BenchmarkRegistry:
+    def __init__(self) -> None:
+        self._specs: Dict[str, BenchmarkSpec] = {}
+        self._plugins_loaded = False
+
+    def register(
+        self,
+        key: str,
+        name: Optional[str] = None,
+        tags: Iterable[str] = (),
+        default_size: Optional[int] = None,
+        opt_in: bool = False,
+        max_size: Optional[int] = None,
+    ) -> Callable[[Callable], Callable]:
+        """Decorator registering a benchmark setup function under ``key``"""
+
+        def decorator(setup: Callable) -> Callable:
+            if key in self._specs:
+                raise ValueError(f"Benchmark '{key}' is already registered")
+            self._specs[key] = BenchmarkSpec(
+                key=key,
+                name=name or key.replace("_", " ").title(),
+                setup=setup,
+                tags=list(tags),
+                default_size=default_size,
+                opt_in=opt_in,
+                max_size=max_size,
+            )
+            return setup
+
+        return decorator
+
+    def get(self, key: str) -> BenchmarkSpec:
+        if key not in self._specs:
+            raise KeyError(f"Unknown benchmark: {key}")
+        return self._specs[key]
+
+    def all(self) -> List[BenchmarkSpec]:
+        return list(self._specs.values())
+
+    def select(
+        self,
+        only: Iterable[str] = (),
+        exclude: Iterable[str] = (),
+        tags: Iterable[str] = (),
+        include_opt_in: bool = False,
+    ) -> List[BenchmarkSpec]:
+        """Benchmarks matching any ``only`` glob and any tag, minus ``exclude``"""
+        only, exclude, tags = list(only), list(exclude), set(tags)
+        include_opt_in = include_opt_in or bool(only or tags)
+
+        return [
+            spec
+            for spec in self._specs.values()
+            if (include_opt_in or not spec.opt_in)
+            and (not only or any(fnmatchcase(spec.key, p) for p in only))
+            and not any(fnmatchcase(spec.key, p) for p in exclude)
+            and (not tags or tags.intersection(spec.tags))
+        ]
+
+    def load_plugins(self, modules: Iterable[str] = ()) -> None:
+        """Import the built-in benchmarks, installed entry points and modules
+
+        Registration happens as a side effect of importing a module, so an
+        entry point only needs to name the module that defines benchmarks.
+        """
+        if not self._plugins_loaded:
+            importlib.import_module(f"{__package__}.builtin")
+            importlib.import_module(f"{__package__}.file_handler")
+            importlib.import_module(f"{__package__}.logger")
+            for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+                entry_point.load()
+            self._plugins_loaded = True
+
+        modules = list(modules)
+        if modules and os.getcwd() not in sys.path:
+            # Let --load find benchmark modules kept in the current project
+            sys.path.insert(0, os.getcwd())
+        for module in modules:
+            importlib.import_module(module)
+
+
+registry = BenchmarkRegistry()
+benchmark = registry.register
@@ -0,0 +1,131 @@
+import math
+from typing import Dict, Sequence, Tuple
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """Linearly interpolated percentile (pct in 0-100) of samples"""
+    if not samples:
+        raise ValueError("percentile of empty sample set")
+
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def mean(samples: Sequence[float]) -> float:
+    return math.fsum(samples) / len(samples)
+
+
+def stddev(samples: Sequence[float]) -> float:
+    """Sample standard deviation (0.0 for fewer than two samples)"""
+    if len(samples) < 2:
+        return 0.0
+
+    avg = mean(samples)
+    return math.sqrt(math.fsum((s - avg) ** 2 for s in samples) / (len(samples) - 1))
+
+
+def summarize(samples: Sequence[float]) -> Dict[str, float]:
+    return {
+        "mean": mean(samples),
+        "min": min(samples),
+        "max": max(samples),
+        "median": percentile(samples, 50),
+        "p95": percentile(samples, 95),
+        "p99": percentile(samples, 99),
+        "stddev": stddev(samples),
+    }
+
+
+def fit_power_law(
+    sizes: Sequence[float], values: Sequence[float]
+) -> Tuple[float, float, float]:
+    """Least-squares fit of values = coefficient * size ** exponent in log-log
+    space; returns (exponent, coefficient, r_squared)"""
+    points = [(math.log(n), math.log(v)) for n, v in zip(sizes, values) if n > 0 < v]
+    if len(points) < 2:
+        raise ValueError("power-law fit needs at least two positive points")
+
+    xs, ys = [x for x, _ in points], [y for _, y in points]
+    x_mean, y_mean = mean(xs), mean(ys)
+    sxx = math.fsum((x - x_mean) ** 2 for x in xs)
+    if sxx == 0:
+        raise ValueError("power-law fit needs at least two distinct sizes")
+
+    exponent = math.fsum((x - x_mean) * (y - y_mean) for x, y in points) / sxx
+    intercept = y_mean - exponent * x_mean
+
+    ss_total = math.fsum((y - y_mean) ** 2 for y in ys)
+    ss_residual = math.fsum((y - (intercept + exponent * x)) ** 2 for x, y in points)
+    r_squared = 1.0 - ss_residual / ss_total if ss_total > 0 else 1.0
+    return exponent, math.exp(intercept), r_squared
+
+
+def welch_t_test(a: Sequence[float], b: Sequence[float]) -> Tuple[float, float]:
+    """Welch's unequal-variance t-test; returns (t statistic, two-sided p-value)"""
+    if len(a) < 2 or len(b) < 2:
+        return 0.0, 1.0
+
+    var_a = stddev(a) ** 2 / len(a)
+    var_b = stddev(b) ** 2 / len(b)
+    diff = mean(b) - mean(a)
+    se2 = var_a + var_b
+
+    if se2 == 0:
+        return (0.0, 1.0) if diff == 0 else (math.copysign(math.inf, diff), 0.0)
+
+    t = diff / math.sqrt(se2)
+    df = se2**2 / (var_a**2 / (len(a) - 1) + var_b**2 / (len(b) - 1))
+    return t, student_t_sf2(t, df)
+
+
+def student_t_sf2(t: float, df: float) -> float:
+    """Two-sided tail probability P(|T| >= |t|) of Student's t distribution"""
+    return _betainc(df / 2, 0.5, df / (df + t * t))
+
+
+def _betainc(a: float, b: float, x: float) -> float:
+    """Regularized incomplete beta function I_x(a, b)"""
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+
+    log_front = (
+        math.lgamma(a + b)
+        - math.lgamma(a)
+        - math.lgamma(b)
+        + a * math.log(x)
+        + b * math.log1p(-x)
+    )
+    # The continued fraction converges quickly only below the mean
+    if x < (a + 1) / (a + b + 2):
+        return math.exp(log_front) * _betacf(a, b, x) / a
+    return 1.0 - math.exp(log_front) * _betacf(b, a, 1.0 - x) / b
+
+
+def _betacf(a: float, b: float, x: float) -> float:
+    """Continued fraction for the incomplete beta function (modified Lentz)"""
+    tiny = 1e-300
+    c = 1.0
+    d = 1.0 - (a + b) * x / (a + 1)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    result = d
+
+    for m in range(1, 300):
+        m2 = 2 * m
+        for numerator in (
+            m * (b - m) * x / ((a + m2 - 1) * (a + m2)),
+            -(a + m) * (a + b + m) * x / ((a + m2) * (a + m2 + 1)),
+        ):
+            d = 1.0 + numerator * d
+            d = 1.0 / (d if abs(d) > tiny else tiny)
+            c = 1.0 + numerator / c
+            c = c if abs(c) > tiny else tiny
+            result *= d * c
+        if abs(d * c - 1.0) < 1e-12:
+            break
+
+    return result
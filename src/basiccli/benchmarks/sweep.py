@@ -0,0 +1,93 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from .allocations import trace_allocations
+from .harness import BenchmarkHarness
+from .registry import BenchmarkSpec
+from .stats import fit_power_law
+
+# Exponents above this are reported as superlinear
+SUPERLINEAR_EXPONENT = 1.2
+
+
+def sweep_sizes(base: int, steps: int, factor: float) -> List[int]:
+    """Geometric sizes base, base*factor, base*factor**2, ... without repeats"""
+    sizes: List[int] = []
+    for step in range(steps):
+        size = max(1, round(base * factor**step))
+        if size not in sizes:
+            sizes.append(size)
+    return sizes
+
+
+def run_sweep(
+    spec: BenchmarkSpec, harness: BenchmarkHarness, sizes: List[int]
+) -> Dict[str, Any]:
+    """Time one op and trace its peak memory at each size, then fit how both
+    grow with size.
+
+    Iterations shrink as the size grows so every point takes roughly as long
+    as the default size does; times are per operation either way. Sizes above
+    the benchmark's ``max_size`` are skipped and listed in ``skipped_sizes``.
+    """
+    assert spec.default_size is not None
+    points = []
+    skipped = [size for size in sizes if spec.max_size and size > spec.max_size]
+
+    for size in sizes:
+        if size in skipped:
+            continue
+        iterations = max(1, harness.iterations * spec.default_size // size)
+        sized_harness = BenchmarkHarness(
+            iterations=iterations,
+            rounds=harness.rounds,
+            warmup=harness.warmup,
+            timer=harness.timer,
+        )
+        with spec.open(size) as workload:
+            result = sized_harness.run(spec.name, workload)
+            memory = trace_allocations(workload, 1)
+
+        points.append(
+            {
+                "size": size,
+                "iterations": iterations,
+                "avg_time": result["avg_time"],
+                "median_time": result["median_time"],
+                "peak_memory": memory["peak_traced"],
+                **(
+                    {"mb_per_sec": result["mb_per_sec"]}
+                    if "mb_per_sec" in result
+                    else {}
+                ),
+            }
+        )
+
+    time_fit = _fit([p["size"] for p in points], [p["median_time"] for p in points])
+    memory_fit = _fit([p["size"] for p in points], [p["peak_memory"] for p in points])
+
+    return {
+        "name": spec.name,
+        "points": points,
+        "time_exponent": time_fit and time_fit[0],
+        "time_r_squared": time_fit and time_fit[1],
+        "memory_exponent": memory_fit and memory_fit[0],
+        "superlinear": bool(time_fit and time_fit[0] > SUPERLINEAR_EXPONENT),
+        "skipped_sizes": skipped,
+    }
+
+
+def describe_exponent(exponent: Optional[float]) -> str:
+    """Human-readable complexity estimate such as "~O(n^1.98)" """
+    if exponent is None:
+        return "n/a"
+    if abs(exponent) < 0.15:
+        return f"~O(1) (n^{exponent:.2f})"
+    return f"~O(n^{exponent:.2f})"
+
+
+def _fit(sizes: List[float], values: List[float]) -> Optional[Tuple[float, float]]:
+    try:
+        exponent, _, r_squared = fit_power_law(sizes, values)
+    except ValueError:
+        return None
+    return exponent, r_squared
@@ -1,22 +1,38 @@
 #!/usr/bin/env python3
 
-import json
 import sys
-from pathlib import Path
+from typing import List, Optional, Tuple
 
 import click
 
-from .commands.benchmark import BenchmarkCommand
-from .commands.hello import HelloCommand
-from .commands.version import VersionCommand
-from .utils.logger import Logger
+# Command modules are imported inside each callback so that startup only pays
+# for the command actually being run (see tests/test_cli.py)
 
 
 @click.group()
 @click.version_option()
-def cli() -> None:
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Profile the command; prints top functions to stderr",
+)
+@click.option(
+    "--profile-output",
+    metavar="PREFIX",
+    default=None,
+    help="Write PREFIX.pstats and PREFIX.collapsed (implies --profile) "
+    "[default: basiccli-profile]",
+)
+@click.pass_context
+def cli(ctx: click.Context, profile: bool, profile_output: Optional[str]) -> None:
     """BasicCli - A Python CLI framework demonstrating PTD"""
-    pass
+    if profile or profile_output:
+        from .utils.profiler import DEFAULT_PROFILE_OUTPUT, Profiler
+
+        profiler = Profiler(profile_output or DEFAULT_PROFILE_OUTPUT)
+        # Runs when the command returns or exits, including with sys.exit(1)
+        ctx.call_on_close(profiler.finish)
+        profiler.start()
 
 
 @cli.command()
@@ -25,6 +41,8 @@ def cli() -> None:
 @click.option("--repeat", "-r", type=int, default=1, help="Repeat the greeting N times")
 def hello(name: str, uppercase: bool, repeat: int) -> None:
     """Greet someone with a personalized message"""
+    from .commands.hello import HelloCommand
+
     command = HelloCommand(name, uppercase=uppercase, repeat=repeat)
     result = command.execute()
     if not result.success:
@@ -36,6 +54,8 @@ def hello(name: str, uppercase: bool, repeat: int) -> None:
 @click.option("--json", "output_json", is_flag=True, help="Output version info as JSON")
 def version(output_json: bool) -> None:
     """Display version information"""
+    from .commands.version import VersionCommand
+
     command = VersionCommand(output_json=output_json)
     result = command.execute()
     if not result.success:
@@ -54,9 +74,223 @@ def version(output_json: bool) -> None:
 @click.option(
     "--verbose", "-v", is_flag=True, help="Show detailed benchmark information"
 )
-def benchmark(iterations: int, output: str, verbose: bool) -> None:
+@click.option(
+    "--rounds",
+    type=click.IntRange(min=1),
+    default=5,
+    show_default=True,
+    help="Measured rounds per benchmark",
+)
+@click.option(
+    "--warmup",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Unmeasured warmup rounds per benchmark",
+)
+@click.option(
+    "--target-time",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Calibrate iterations so each benchmark's rounds take about this many seconds",
+)
+@click.option(
+    "--save-baseline",
+    metavar="NAME",
+    default=None,
+    help="Store these results as a named baseline",
+)
+@click.option(
+    "--compare",
+    metavar="NAME",
+    default=None,
+    help=(
+        "Compare against a saved baseline and fail on significant regressions "
+        "(needs --rounds 3 or more for a significance test)"
+    ),
+)
+@click.option(
+    "--baseline-file",
+    type=click.Path(dir_okay=False),
+    default=".benchmarks/baselines.json",
+    show_default=True,
+    help="File holding saved baselines",
+)
+@click.option(
+    "--threshold",
+    type=click.FloatRange(min=0),
+    default=10.0,
+    show_default=True,
+    help="Slowdown in percent that counts as a regression",
+)
+@click.option(
+    "--compare-impl",
+    is_flag=True,
+    help="Compare the Python and Rust builds: startup, throughput, memory, output",
+)
+@click.option(
+    "--python-bin",
+    default=None,
+    help="Python CLI to compare (default: bin/basiccli-python)",
+)
+@click.option(
+    "--rust-bin",
+    default=None,
+    help="Rust CLI to compare (default: target/release/basiccli-rust)",
+)
+@click.option(
+    "--repeats",
+    type=click.IntRange(min=1),
+    default=5,
+    show_default=True,
+    help="Runs per CLI invocation in --compare-impl mode",
+)
+@click.option(
+    "--only",
+    multiple=True,
+    metavar="GLOB",
+    help="Run only benchmarks whose key matches (repeatable)",
+)
+@click.option(
+    "--exclude",
+    multiple=True,
+    metavar="GLOB",
+    help="Skip benchmarks whose key matches (repeatable)",
+)
+@click.option(
+    "--tag",
+    "tags",
+    multiple=True,
+    help="Run only benchmarks with this tag, e.g. io or cpu (repeatable)",
+)
+@click.option(
+    "--load",
+    "modules",
+    multiple=True,
+    metavar="MODULE",
+    help="Import a module that registers extra benchmarks (repeatable)",
+)
+@click.option(
+    "--list", "list_benchmarks", is_flag=True, help="List benchmarks and exit"
+)
+@click.option(
+    "--isolate",
+    is_flag=True,
+    help="Run each benchmark in a fresh Python subprocess",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Isolated benchmarks to run in parallel (implies --isolate)",
+)
+@click.option(
+    "--pin-cpus",
+    is_flag=True,
+    help="Pin each job to its own CPU core (Linux; implies --isolate)",
+)
+@click.option(
+    "--memory",
+    is_flag=True,
+    help="Record peak traced memory, retained blocks, GC collections and RSS delta",
+)
+@click.option(
+    "--top-allocations",
+    type=click.IntRange(min=0),
+    default=0,
+    metavar="N",
+    help="List the N source lines holding the most memory at peak (implies --memory)",
+)
+@click.option(
+    "--sweep",
+    is_flag=True,
+    help=(
+        "Run each sizeable benchmark over a geometric range of input sizes "
+        "(structured file_handler benchmarks stop at 256 MB)"
+    ),
+)
+@click.option(
+    "--sweep-steps",
+    type=click.IntRange(min=2),
+    default=5,
+    show_default=True,
+    help="Number of sizes in --sweep mode",
+)
+@click.option(
+    "--sweep-factor",
+    type=click.FloatRange(min=1, min_open=True),
+    default=4.0,
+    show_default=True,
+    help="Growth factor between consecutive sizes in --sweep mode",
+)
+def benchmark(
+    iterations: int,
+    output: str,
+    verbose: bool,
+    rounds: int,
+    warmup: int,
+    target_time: Optional[float],
+    save_baseline: Optional[str],
+    compare: Optional[str],
+    baseline_file: str,
+    threshold: float,
+    compare_impl: bool,
+    python_bin: Optional[str],
+    rust_bin: Optional[str],
+    repeats: int,
+    only: Tuple[str, ...],
+    exclude: Tuple[str, ...],
+    tags: Tuple[str, ...],
+    modules: Tuple[str, ...],
+    list_benchmarks: bool,
+    isolate: bool,
+    jobs: int,
+    pin_cpus: bool,
+    memory: bool,
+    top_allocations: int,
+    sweep: bool,
+    sweep_steps: int,
+    sweep_factor: float,
+) -> None:
     """Run performance benchmarks"""
-    command = BenchmarkCommand(iterations, output_format=output, verbose=verbose)
+    from .benchmarks.implementations import ImplementationComparison
+    from .commands.benchmark import BenchmarkCommand
+
+    implementations = ImplementationComparison(repeats=repeats)
+    if python_bin:
+        implementations.python_command = [python_bin]
+    if rust_bin:
+        implementations.rust_command = [rust_bin]
+
+    command = BenchmarkCommand(
+        iterations,
+        output_format=output,
+        verbose=verbose,
+        rounds=rounds,
+        warmup=warmup,
+        target_time=target_time,
+        save_baseline=save_baseline,
+        compare_baseline=compare,
+        baseline_file=baseline_file,
+        threshold=threshold / 100,
+        compare_impl=compare_impl,
+        implementations=implementations,
+        only=list(only),
+        exclude=list(exclude),
+        tags=list(tags),
+        modules=list(modules),
+        list_benchmarks=list_benchmarks,
+        isolate=isolate,
+        jobs=jobs,
+        pin_cpus=pin_cpus,
+        memory=memory,
+        top_allocations=top_allocations,
+        sweep=sweep,
+        sweep_steps=sweep_steps,
+        sweep_factor=sweep_factor,
+    )
     result = command.execute()
     if not result.success:
         click.echo(f"Error: {result.message}", err=True)
@@ -64,41 +298,116 @@ def benchmark(iterations: int, output: str, verbose: bool) -> None:
 
 
 @cli.command()
-@click.argument("file", type=click.Path(exists=True))
+@click.argument("files", nargs=-1, required=True)
 @click.option("--pretty", "-p", is_flag=True, help="Pretty print JSON output")
 @click.option("--stats", "-s", is_flag=True, help="Show processing statistics")
-def process(file: str, pretty: bool, stats: bool) -> None:
-    """Process a JSON file and demonstrate file I/O"""
-    logger = Logger(verbose=stats)
-    file_path = Path(file)
-
-    try:
-        logger.info(f"Processing file: {file}")
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="Parse and emit JSON incrementally with bounded memory",
+)
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=64 * 1024,
+    show_default=True,
+    help="Characters read per chunk in --stream mode",
+)
+@click.option(
+    "--ndjson",
+    is_flag=True,
+    help="Treat input as newline-delimited JSON (auto for .ndjson/.jsonl)",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Parallel workers for NDJSON batches or multiple files",
+)
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=1000,
+    help="NDJSON lines handed to a worker at a time",
+)
+@click.option(
+    "--pool",
+    type=click.Choice(["process", "thread"]),
+    default="process",
+    help="Worker pool type used with --workers",
+)
+@click.option(
+    "--keep-going",
+    "-k",
+    is_flag=True,
+    help="Continue past files that fail to process",
+)
+def process(
+    files: Tuple[str, ...],
+    pretty: bool,
+    stats: bool,
+    stream: bool,
+    chunk_size: int,
+    ndjson: bool,
+    workers: int,
+    batch_size: int,
+    pool: str,
+    keep_going: bool,
+) -> None:
+    """Process JSON files, globs or directories and demonstrate file I/O"""
+    from .commands.process import ProcessCommand
 
-        if not file_path.exists():
-            logger.error(f"File not found: {file}")
-            sys.exit(1)
+    command = ProcessCommand(
+        list(files),
+        pretty=pretty,
+        stats=stats,
+        stream=stream,
+        chunk_size=chunk_size,
+        ndjson=ndjson,
+        workers=workers,
+        batch_size=batch_size,
+        pool=pool,
+        keep_going=keep_going,
+    )
+    result = command.execute()
+    if not result.success:
+        sys.exit(1)
 
-        content = file_path.read_text()
-        data = json.loads(content)
 
-        logger.info(f"Successfully parsed JSON with {len(data.keys())} keys")
+@cli.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Unix socket to listen on (default: $BASICCLI_SOCKET or a per-user path)",
+)
+@click.option("--verbose", "-v", is_flag=True, help="Log each forwarded command")
+def serve(socket_path: Optional[str], verbose: bool) -> None:
+    """Keep a warm interpreter serving commands from basiccli-client"""
+    from .client import default_socket_path
+    from .commands.serve import ServeCommand
 
-        if pretty:
-            click.echo(json.dumps(data, indent=2))
-        else:
-            click.echo(json.dumps(data))
+    command = ServeCommand(
+        socket_path or default_socket_path(), handler=run, verbose=verbose
+    )
+    result = command.execute()
+    if not result.success:
+        click.echo(f"Error: {result.message}", err=True)
+        sys.exit(1)
 
-        if stats:
-            logger.info(f"File size: {file_path.stat().st_size} bytes")
-            logger.info("Processing complete")
 
-    except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON: {e}")
-        sys.exit(1)
-    except Exception as e:
-        logger.error(f"Error: {e}")
-        sys.exit(1)
+def run(argv: List[str]) -> int:
+    """Run the CLI in-process with argv and return its exit code"""
+    try:
+        cli.main(args=argv, prog_name="basiccli")
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        click.echo(e.code, err=True)
+        return 1
+    return 0
 
 
 def main() -> None:
@@ -0,0 +1,127 @@
+"""Thin client for ``basiccli serve``.
+
+Only the standard library is imported here so that forwarding a command to a
+warm server costs little more than interpreter startup. The client hands its
+stdin/stdout/stderr file descriptors to the server, which runs the command in
+a forked worker writing directly to them, and exits with the command's code.
+"""
+
+import json
+import os
+import signal
+import socket
+import struct
+import sys
+from typing import List, Optional
+
+SOCKET_ENV = "BASICCLI_SOCKET"
+_HEADER = struct.Struct("!I")
+_STATUS = struct.Struct("!i")
+# struct ucred: pid, uid, gid
+_PEERCRED = struct.Struct("3i")
+
+
+def default_socket_path() -> str:
+    if os.environ.get(SOCKET_ENV):
+        return os.environ[SOCKET_ENV]
+
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "basiccli.sock")
+    return os.path.join(
+        os.environ.get("TMPDIR", "/tmp"), f"basiccli-{os.getuid()}.sock"
+    )
+
+
+def encode_request(argv: List[str], cwd: str) -> bytes:
+    payload = json.dumps({"argv": argv, "cwd": cwd}).encode()
+    return _HEADER.pack(len(payload)) + payload
+
+
+def _recv_exact(sock: socket.socket, size: int) -> Optional[bytes]:
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+def peer_uid(sock: socket.socket, socket_path: str) -> int:
+    """The uid of the process listening on the other end of ``sock``"""
+    if hasattr(socket, "SO_PEERCRED"):
+        creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, _PEERCRED.size)
+        uid: int = _PEERCRED.unpack(creds)[1]
+        return uid
+    # Without SO_PEERCRED, trust whoever bound the socket file
+    return os.stat(socket_path).st_uid
+
+
+def connect(socket_path: str) -> Optional[socket.socket]:
+    """Connect to a running server, or return None if there is none or it
+    belongs to another user"""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+        owner = peer_uid(sock, socket_path)
+    except (FileNotFoundError, ConnectionRefusedError):
+        sock.close()
+        return None
+
+    if owner != os.getuid():
+        # Never hand our terminal to a server another user started
+        print(
+            f"Warning: ignoring {socket_path}, owned by uid {owner}",
+            file=sys.stderr,
+        )
+        sock.close()
+        return None
+    return sock
+
+
+def forward(sock: socket.socket, argv: List[str]) -> int:
+    """Run argv on the connected server and return its exit code"""
+    try:
+        fds = [sys.stdin.fileno(), sys.stdout.fileno(), sys.stderr.fileno()]
+        socket.send_fds(sock, [encode_request(argv, os.getcwd())], fds)
+
+        pid_data = _recv_exact(sock, _STATUS.size)
+        if pid_data is None:
+            print("Error: server closed the connection", file=sys.stderr)
+            return 1
+        (worker_pid,) = _STATUS.unpack(pid_data)
+
+        while True:
+            try:
+                status = _recv_exact(sock, _STATUS.size)
+                break
+            except KeyboardInterrupt:
+                # Pass Ctrl-C on to the worker running our command
+                os.kill(worker_pid, signal.SIGINT)
+
+        if status is None:
+            print("Error: server closed the connection", file=sys.stderr)
+            return 1
+        exit_code: int = _STATUS.unpack(status)[0]
+        return exit_code
+    finally:
+        sock.close()
+
+
+def main() -> None:
+    """Entry point for basiccli-client"""
+    sock = connect(default_socket_path())
+
+    if sock is None:
+        # No server running: fall back to running the command in-process
+        from .cli import main as cli_main
+
+        cli_main()
+        return
+
+    sys.exit(forward(sock, sys.argv[1:]))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,32 @@ import platform
 import sys
 import tempfile
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from io import StringIO
-from typing import Any, Dict
-
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..benchmarks.allocations import run_with_memory
+from ..benchmarks.baseline import (
+    DEFAULT_BASELINE_FILE,
+    MIN_TEST_ROUNDS,
+    BaselineStore,
+    Comparison,
+    compare_results,
+)
+from ..benchmarks.harness import BenchmarkHarness, Workload
+from ..benchmarks.implementations import (
+    SAMPLE_DOCUMENT,
+    CaseComparison,
+    ImplementationComparison,
+    WorkloadComparison,
+    default_cases,
+    rss_floor,
+)
+from ..benchmarks.isolation import IsolatedRunner
+from ..benchmarks.registry import BenchmarkSpec, registry
+from ..benchmarks.sweep import describe_exponent, run_sweep, sweep_sizes
+from ..utils.memory import format_bytes
 from ..utils.result import Result
 
 
@@ -16,168 +38,449 @@ class BenchmarkCommand:
     iterations: int
     output_format: str = "console"
     verbose: bool = False
+    rounds: int = 5
+    warmup: int = 1
+    target_time: Optional[float] = None
+    save_baseline: Optional[str] = None
+    compare_baseline: Optional[str] = None
+    baseline_file: str = DEFAULT_BASELINE_FILE
+    threshold: float = 0.10
+    alpha: float = 0.05
+    compare_impl: bool = False
+    implementations: ImplementationComparison = field(
+        default_factory=ImplementationComparison
+    )
+    only: List[str] = field(default_factory=list)
+    exclude: List[str] = field(default_factory=list)
+    tags: List[str] = field(default_factory=list)
+    modules: List[str] = field(default_factory=list)
+    list_benchmarks: bool = False
+    isolate: bool = False
+    jobs: int = 1
+    pin_cpus: bool = False
+    memory: bool = False
+    top_allocations: int = 0
+    sweep: bool = False
+    sweep_steps: int = 5
+    sweep_factor: float = 4.0
 
     def execute(self) -> Result:
+        if self.list_benchmarks:
+            return self._list_benchmarks()
+        if self.compare_impl:
+            return self._compare_implementations()
+        if self.sweep:
+            return self._run_sweeps()
+
         try:
+            store = BaselineStore(self.baseline_file)
+            # Load up front so a missing baseline fails before the slow part
+            baseline = (
+                store.load(self.compare_baseline) if self.compare_baseline else None
+            )
+
             if self.verbose:
-                print(f"Running benchmarks with {self.iterations} iterations...")
+                print(
+                    f"Running benchmarks with {self.iterations} iterations "
+                    f"x {self.rounds} rounds (+{self.warmup} warmup)..."
+                )
+                if self.isolate or self.jobs > 1 or self.pin_cpus:
+                    pinning = ", pinned to CPUs" if self.pin_cpus else ""
+                    print(f"Isolated subprocesses, {self.jobs} at a time{pinning}")
 
             results = self._run_benchmarks()
+            comparisons = (
+                compare_results(baseline, results, self.threshold, self.alpha)
+                if baseline is not None
+                else None
+            )
+            if comparisons and not all(c.tested for c in comparisons):
+                print(
+                    f"Warning: fewer than {MIN_TEST_ROUNDS} rounds to compare, "
+                    "so changes beyond the threshold count without a "
+                    f"significance test; use --rounds {MIN_TEST_ROUNDS} or more",
+                    file=sys.stderr,
+                )
 
             if self.output_format == "json":
-                self._output_json(results)
+                self._output_json(results, comparisons)
             elif self.output_format == "csv":
-                self._output_csv(results)
+                self._output_csv(results, comparisons)
             else:
-                self._output_console(results)
+                self._output_console(results, comparisons)
+
+            if self.save_baseline:
+                store.save(self.save_baseline, results)
+                if self.verbose:
+                    print(f"Saved baseline '{self.save_baseline}' to {store.path}")
+
+            regressions = [c.name for c in comparisons or [] if c.is_regression]
+            if regressions:
+                return Result(
+                    success=False,
+                    message=f"Performance regression in: {', '.join(regressions)}",
+                )
 
             return Result(success=True, message="Benchmarks completed successfully")
         except Exception as e:
             return Result(success=False, message=str(e))
 
+    @property
+    def profiles_memory(self) -> bool:
+        return self.memory or self.top_allocations > 0
+
     def _run_benchmarks(self) -> Dict[str, Dict[str, Any]]:
+        specs = self._select_benchmarks()
+        if not specs:
+            raise ValueError("No benchmarks match the given filters")
+
+        if self.isolate or self.jobs > 1 or self.pin_cpus:
+            runner = IsolatedRunner(
+                harness={
+                    "iterations": self.iterations,
+                    "rounds": self.rounds,
+                    "warmup": self.warmup,
+                    "target_time": self.target_time,
+                },
+                modules=self.modules,
+                jobs=self.jobs,
+                pin_cpus=self.pin_cpus,
+                top_allocations=(
+                    self.top_allocations if self.profiles_memory else None
+                ),
+            )
+            return runner.run(specs)
+
         results = {}
+        for spec in specs:
+            with spec.open() as workload:
+                results[spec.key] = self._measure(spec.name, workload)
 
-        # String manipulation benchmark
-        results["string_manipulation"] = self._benchmark_string_manipulation()
+        return results
 
-        # List operations benchmark
-        results["list_operations"] = self._benchmark_list_operations()
+    def _select_benchmarks(self, include_opt_in: bool = False) -> List[BenchmarkSpec]:
+        registry.load_plugins(self.modules)
+        return registry.select(self.only, self.exclude, self.tags, include_opt_in)
 
-        # File I/O benchmark
-        results["file_io"] = self._benchmark_file_io()
+    def _list_benchmarks(self) -> Result:
+        try:
+            specs = self._select_benchmarks(include_opt_in=True)
+        except ImportError as e:
+            return Result(success=False, message=str(e))
 
-        # JSON parsing benchmark
-        results["json_parsing"] = self._benchmark_json_parsing()
+        for spec in specs:
+            tags = ", ".join(spec.tags + (["opt-in"] if spec.opt_in else []))
+            print(f"{spec.key:<32}{spec.name:<36}{tags}")
+        return Result(success=True, message=f"{len(specs)} benchmarks")
 
-        # Dict operations benchmark
-        results["dict_operations"] = self._benchmark_dict_operations()
+    def _run_sweeps(self) -> Result:
+        try:
+            specs = [spec for spec in self._select_benchmarks() if spec.sizeable]
+            if not specs:
+                raise ValueError("No sizeable benchmarks match the given filters")
 
-        return results
+            harness = BenchmarkHarness(
+                iterations=self.iterations, rounds=self.rounds, warmup=self.warmup
+            )
+            sweeps = {}
+            for spec in specs:
+                assert spec.default_size is not None
+                sizes = sweep_sizes(
+                    spec.default_size, self.sweep_steps, self.sweep_factor
+                )
+                if self.verbose:
+                    print(f"Sweeping {spec.name} over sizes {sizes}")
+                sweeps[spec.key] = run_sweep(spec, harness, sizes)
+        except Exception as e:
+            return Result(success=False, message=str(e))
 
-    def _benchmark_string_manipulation(self) -> Dict[str, Any]:
-        start_time = time.perf_counter()
+        if self.output_format == "json":
+            self._output_sweep_json(sweeps)
+        elif self.output_format == "csv":
+            self._output_sweep_csv(sweeps)
+        else:
+            self._output_sweep_console(sweeps)
 
-        for i in range(self.iterations):
-            text = f"Hello World {i}"
-            text = text.upper()
-            text = text[::-1]  # reverse
-            text = "".join("*" if c in "AEIOU" else c for c in text)
-            "-".join(text)
+        return Result(success=True, message="Sweep completed successfully")
 
-        end_time = time.perf_counter()
-        total_time = end_time - start_time
+    def _output_sweep_console(self, sweeps: Dict[str, Dict[str, Any]]) -> None:
+        print("\n" + "=" * 60)
+        print(f"{' ' * 22}SCALING SWEEP")
+        print("=" * 60)
 
-        return {
-            "name": "String Manipulation",
-            "iterations": self.iterations,
-            "total_time": total_time,
-            "avg_time": total_time / self.iterations,
-            "ops_per_sec": self.iterations / total_time,
+        for sweep in sweeps.values():
+            print(f"\n{sweep['name']}:")
+            throughput_header = (
+                f"{'Throughput':>15}" if "mb_per_sec" in sweep["points"][0] else ""
+            )
+            print(
+                f"  {'Size':>10}{'Iterations':>12}{'Median/op':>14}{'Peak memory':>14}"
+                f"{throughput_header}"
+            )
+            for p in sweep["points"]:
+                throughput = (
+                    f"{p['mb_per_sec']:>10.1f} MB/s" if "mb_per_sec" in p else ""
+                )
+                print(
+                    f"  {p['size']:>10}{p['iterations']:>12}"
+                    f"{self._format_time(p['median_time']):>14}"
+                    f"{format_bytes(p['peak_memory']):>14}{throughput}"
+                )
+            flag = "  <- superlinear" if sweep["superlinear"] else ""
+            print(f"  Time:   {describe_exponent(sweep['time_exponent'])}{flag}")
+            print(f"  Memory: {describe_exponent(sweep['memory_exponent'])}")
+            if sweep["skipped_sizes"]:
+                skipped = ", ".join(str(size) for size in sweep["skipped_sizes"])
+                print(f"  Skipped sizes above the benchmark's limit: {skipped}")
+
+        print("\n" + "=" * 60)
+
+    def _output_sweep_json(self, sweeps: Dict[str, Dict[str, Any]]) -> None:
+        output = {
+            "timestamp": time.ctime(),
+            "platform": platform.platform(),
+            "python_version": sys.version.split()[0],
+            "sweeps": [
+                {
+                    "name": sweep["name"],
+                    "time_exponent": _round_or_none(sweep["time_exponent"], 3),
+                    "time_r_squared": _round_or_none(sweep["time_r_squared"], 3),
+                    "memory_exponent": _round_or_none(sweep["memory_exponent"], 3),
+                    "superlinear": sweep["superlinear"],
+                    "skipped_sizes": sweep["skipped_sizes"],
+                    "points": [
+                        {
+                            "size": p["size"],
+                            "iterations": p["iterations"],
+                            "avg_time_ms": round(p["avg_time"] * 1000, 6),
+                            "median_time_ms": round(p["median_time"] * 1000, 6),
+                            "peak_memory_bytes": p["peak_memory"],
+                            **(
+                                {"mb_per_sec": round(p["mb_per_sec"], 2)}
+                                if "mb_per_sec" in p
+                                else {}
+                            ),
+                        }
+                        for p in sweep["points"]
+                    ],
+                }
+                for sweep in sweeps.values()
+            ],
         }
 
-    def _benchmark_list_operations(self) -> Dict[str, Any]:
-        start_time = time.perf_counter()
+        print(json.dumps(output, indent=2))
 
-        for _ in range(self.iterations):
-            arr = list(range(1, 101))
-            arr = [n * 2 for n in arr]
-            arr = [n for n in arr if n % 3 == 0]
-            arr = sorted(arr, reverse=True)
-            sum(arr)
+    def _output_sweep_csv(self, sweeps: Dict[str, Dict[str, Any]]) -> None:
+        output = StringIO()
+        writer = csv.writer(output)
+        writer.writerow(
+            [
+                "Benchmark",
+                "Size",
+                "Iterations",
+                "Avg Time (s)",
+                "Median Time (s)",
+                "Peak Memory (B)",
+                "MB/s",
+                "Time Exponent",
+                "Memory Exponent",
+            ]
+        )
 
-        end_time = time.perf_counter()
-        total_time = end_time - start_time
+        for sweep in sweeps.values():
+            for p in sweep["points"]:
+                writer.writerow(
+                    [
+                        sweep["name"],
+                        p["size"],
+                        p["iterations"],
+                        round(p["avg_time"], 9),
+                        round(p["median_time"], 9),
+                        p["peak_memory"],
+                        _round_or_none(p.get("mb_per_sec"), 2),
+                        _round_or_none(sweep["time_exponent"], 3),
+                        _round_or_none(sweep["memory_exponent"], 3),
+                    ]
+                )
 
-        return {
-            "name": "List Operations",
-            "iterations": self.iterations,
-            "total_time": total_time,
-            "avg_time": total_time / self.iterations,
-            "ops_per_sec": self.iterations / total_time,
-        }
+        print(output.getvalue())
 
-    def _benchmark_file_io(self) -> Dict[str, Any]:
-        start_time = time.perf_counter()
+    def _compare_implementations(self) -> Result:
+        comparison = self.implementations
+        comparison.iterations = self.iterations
 
-        with tempfile.NamedTemporaryFile(mode="w+", delete=True) as temp_file:
-            for i in range(self.iterations):
-                temp_file.seek(0)
-                temp_file.write(f"Line {i}: {'x' * 100}\n")
-                temp_file.flush()
-                temp_file.seek(0)
-                temp_file.read()
+        try:
+            comparison.check_available()
+
+            with tempfile.TemporaryDirectory() as temp_dir:
+                sample_file = Path(temp_dir) / "sample.json"
+                sample_file.write_text(json.dumps(SAMPLE_DOCUMENT))
+
+                if self.verbose:
+                    print(
+                        f"Comparing implementations over {comparison.repeats} runs "
+                        "per command..."
+                    )
+                cases = comparison.compare_cases(default_cases(str(sample_file)))
+                workloads = comparison.compare_workloads()
+                floor = rss_floor()
+        except (OSError, RuntimeError, ValueError) as e:
+            return Result(success=False, message=str(e))
 
-        end_time = time.perf_counter()
-        total_time = end_time - start_time
+        if self.output_format == "json":
+            self._output_impl_json(cases, workloads, floor)
+        elif self.output_format == "csv":
+            self._output_impl_csv(cases, workloads, floor)
+        else:
+            self._output_impl_console(cases, workloads, floor)
 
-        return {
-            "name": "File I/O",
-            "iterations": self.iterations,
-            "total_time": total_time,
-            "avg_time": total_time / self.iterations,
-            "ops_per_sec": self.iterations / total_time,
-        }
+        mismatches = [c.name for c in cases if c.parity is False]
+        if mismatches:
+            return Result(
+                success=False,
+                message=f"Implementations differ in output for: {', '.join(mismatches)}",
+            )
+        return Result(success=True, message="Implementations compared successfully")
+
+    def _output_impl_console(
+        self,
+        cases: List[CaseComparison],
+        workloads: List[WorkloadComparison],
+        floor: int,
+    ) -> None:
+        print("\n" + "=" * 60)
+        print(f"{' ' * 16}PYTHON VS RUST COMPARISON")
+        print("=" * 60)
+
+        print("\nCLI invocations (median cold start, peak RSS):")
+        for c in cases:
+            parity = {True: "identical", False: "DIFFERS", None: "not compared"}
+            print(f"\n{c.name}:")
+            print(
+                f"  Python:         {self._format_time(c.python['cold_start'])}, "
+                f"{format_bytes(c.python['max_rss'])}"
+            )
+            print(
+                f"  Rust:           {self._format_time(c.rust['cold_start'])}, "
+                f"{format_bytes(c.rust['max_rss'])}"
+            )
+            print(f"  Speedup:        {c.speedup:.1f}x")
+            print(f"  Output:         {parity[c.parity]}")
+
+        print("\nWorkloads (ops/second):")
+        for w in workloads:
+            print(f"\n{w.name}:")
+            print(f"  Python:         {w.python_ops_per_sec:.2f}")
+            print(f"  Rust:           {w.rust_ops_per_sec:.2f}")
+            print(f"  Speedup:        {w.speedup:.1f}x")
+
+        print("\n" + "=" * 60)
+        print(f"Peak RSS is not resolved below {format_bytes(floor)} (launcher floor)")
+        print("=" * 60)
 
-    def _benchmark_json_parsing(self) -> Dict[str, Any]:
-        sample_data = {
-            "users": [
+    def _output_impl_json(
+        self,
+        cases: List[CaseComparison],
+        workloads: List[WorkloadComparison],
+        floor: int,
+    ) -> None:
+        output = {
+            "timestamp": time.ctime(),
+            "platform": platform.platform(),
+            "rss_floor_bytes": floor,
+            "commands": [
                 {
-                    "id": i,
-                    "name": f"User {i}",
-                    "email": f"user{i}@example.com",
-                    "metadata": {
-                        "created_at": time.ctime(),
-                        "tags": ["python", "ptd", "cli", "benchmark"],
-                    },
+                    "name": c.name,
+                    "python_cold_start_ms": round(c.python["cold_start"] * 1000, 3),
+                    "rust_cold_start_ms": round(c.rust["cold_start"] * 1000, 3),
+                    "python_max_rss_bytes": c.python["max_rss"],
+                    "rust_max_rss_bytes": c.rust["max_rss"],
+                    "speedup": round(c.speedup, 2),
+                    "identical_output": c.parity,
                 }
-                for i in range(1, 11)
-            ]
+                for c in cases
+            ],
+            "workloads": [
+                {
+                    "name": w.name,
+                    "python_ops_per_second": round(w.python_ops_per_sec, 2),
+                    "rust_ops_per_second": round(w.rust_ops_per_sec, 2),
+                    "speedup": round(w.speedup, 2),
+                }
+                for w in workloads
+            ],
         }
 
-        json_string = json.dumps(sample_data)
-
-        start_time = time.perf_counter()
-
-        for _ in range(self.iterations):
-            parsed = json.loads(json_string)
-            json.dumps(parsed)
+        print(json.dumps(output, indent=2))
 
-        end_time = time.perf_counter()
-        total_time = end_time - start_time
+    def _output_impl_csv(
+        self,
+        cases: List[CaseComparison],
+        workloads: List[WorkloadComparison],
+        floor: int,
+    ) -> None:
+        output = StringIO()
+        writer = csv.writer(output)
+        writer.writerow(["Kind", "Name", "Python", "Rust", "Speedup", "Identical"])
 
-        return {
-            "name": "JSON Parsing",
-            "iterations": self.iterations,
-            "total_time": total_time,
-            "avg_time": total_time / self.iterations,
-            "ops_per_sec": self.iterations / total_time,
-        }
+        for c in cases:
+            writer.writerow(
+                [
+                    "cold_start_s",
+                    c.name,
+                    round(c.python["cold_start"], 6),
+                    round(c.rust["cold_start"], 6),
+                    round(c.speedup, 2),
+                    "" if c.parity is None else c.parity,
+                ]
+            )
+            writer.writerow(
+                [
+                    "max_rss_bytes",
+                    c.name,
+                    c.python["max_rss"],
+                    c.rust["max_rss"],
+                    "",
+                    "",
+                ]
+            )
+        writer.writerow(["rss_floor_bytes", "launcher", floor, floor, "", ""])
+        for w in workloads:
+            writer.writerow(
+                [
+                    "ops_per_second",
+                    w.name,
+                    round(w.python_ops_per_sec, 2),
+                    round(w.rust_ops_per_sec, 2),
+                    round(w.speedup, 2),
+                    "",
+                ]
+            )
 
-    def _benchmark_dict_operations(self) -> Dict[str, Any]:
-        start_time = time.perf_counter()
+        print(output.getvalue())
 
-        for _ in range(self.iterations):
-            data = {}
-            for i in range(100):
-                data[f"key_{i}"] = i * 2
-            sorted(data.keys())
-            sum(data.values())
-            data.update({"extra": 999})
-            {k: v for k, v in data.items() if isinstance(v, int) and v > 50}
+    def _measure(self, name: str, workload: Workload) -> Dict[str, Any]:
+        harness = BenchmarkHarness(
+            iterations=self.iterations,
+            rounds=self.rounds,
+            warmup=self.warmup,
+            target_time=self.target_time,
+        )
+        if self.profiles_memory:
+            result = run_with_memory(harness, name, workload, self.top_allocations)
+        else:
+            result = harness.run(name, workload)
 
-        end_time = time.perf_counter()
-        total_time = end_time - start_time
+        if self.verbose and self.target_time:
+            print(f"Calibrated {name} to {result['iterations']} iterations per round")
 
-        return {
-            "name": "Dict Operations",
-            "iterations": self.iterations,
-            "total_time": total_time,
-            "avg_time": total_time / self.iterations,
-            "ops_per_sec": self.iterations / total_time,
-        }
+        return result
 
-    def _output_console(self, results: Dict[str, Dict[str, Any]]) -> None:
+    def _output_console(
+        self,
+        results: Dict[str, Dict[str, Any]],
+        comparisons: Optional[List[Comparison]] = None,
+    ) -> None:
         print("\n" + "=" * 60)
         print(f"{' ' * 20}BENCHMARK RESULTS")
         print("=" * 60)
@@ -188,14 +491,59 @@ class BenchmarkCommand:
             print(f"  Total time:     {self._format_time(result['total_time'])}")
             print(f"  Avg time/op:    {self._format_time(result['avg_time'])}")
             print(f"  Ops/second:     {result['ops_per_sec']:.2f}")
+            print(f"  Rounds:         {result['rounds']} (+{result['warmup']} warmup)")
+            print(f"  Min time/op:    {self._format_time(result['min_time'])}")
+            print(f"  Median time/op: {self._format_time(result['median_time'])}")
+            print(f"  p95 time/op:    {self._format_time(result['p95_time'])}")
+            print(f"  p99 time/op:    {self._format_time(result['p99_time'])}")
+            print(f"  Std dev:        {self._format_time(result['stddev_time'])}")
+            if "mb_per_sec" in result:
+                print(f"  Throughput:     {result['mb_per_sec']:.2f} MB/s")
+            if "memory" in result:
+                self._output_console_memory(result["memory"])
 
         total_time = sum(r["total_time"] for r in results.values())
         print("\n" + "=" * 60)
         print(f"Total benchmark time: {self._format_time(total_time)}")
         print("=" * 60)
 
-    def _output_json(self, results: Dict[str, Dict[str, Any]]) -> None:
-        output = {
+        if comparisons is not None:
+            self._output_console_comparison(comparisons)
+
+    def _output_console_memory(self, memory: Dict[str, Any]) -> None:
+        gc_counts = "/".join(str(n) for n in memory["gc_collections"])
+        print(f"  Peak traced:     {format_bytes(memory['peak_traced'])}")
+        print(f"  Retained blocks: {memory['retained_blocks']}")
+        print(f"  GC gen0/1/2:     {gc_counts}")
+        print(f"  RSS delta:       {format_bytes(memory['rss_delta'])}")
+
+        if memory["top_allocations"]:
+            print("  Top allocations at peak:")
+            for line in memory["top_allocations"]:
+                print(
+                    f"    {format_bytes(line['size']):>10} "
+                    f"{line['count']:>7} blocks  {line['location']}"
+                )
+
+    def _output_console_comparison(self, comparisons: List[Comparison]) -> None:
+        print(f"\nCompared with baseline '{self.compare_baseline}':")
+        print(
+            f"  {'Benchmark':<22}{'Baseline':>12}{'Current':>12}"
+            f"{'Change':>10}{'p-value':>9}  Status"
+        )
+        for c in comparisons:
+            print(
+                f"  {c.name:<22}{self._format_time(c.baseline_time):>12}"
+                f"{self._format_time(c.current_time):>12}"
+                f"{c.change:>+10.1%}{self._format_p_value(c):>9}  {c.status}"
+            )
+
+    def _output_json(
+        self,
+        results: Dict[str, Dict[str, Any]],
+        comparisons: Optional[List[Comparison]] = None,
+    ) -> None:
+        output: Dict[str, Any] = {
             "timestamp": time.ctime(),
             "platform": platform.platform(),
             "python_version": sys.version.split()[0],
@@ -206,18 +554,108 @@ class BenchmarkCommand:
                     "total_time_ms": round(r["total_time"] * 1000, 3),
                     "avg_time_ms": round(r["avg_time"] * 1000, 6),
                     "ops_per_second": round(r["ops_per_sec"], 2),
+                    "rounds": r["rounds"],
+                    "warmup": r["warmup"],
+                    "min_time_ms": round(r["min_time"] * 1000, 6),
+                    "median_time_ms": round(r["median_time"] * 1000, 6),
+                    "p95_time_ms": round(r["p95_time"] * 1000, 6),
+                    "p99_time_ms": round(r["p99_time"] * 1000, 6),
+                    "stddev_time_ms": round(r["stddev_time"] * 1000, 6),
+                    **self._json_throughput(r),
+                    **self._json_memory(r),
                 }
                 for r in results.values()
             ],
         }
 
+        if comparisons is not None:
+            output["comparison"] = {
+                "baseline": self.compare_baseline,
+                "threshold": self.threshold,
+                "alpha": self.alpha,
+                "benchmarks": [
+                    {
+                        "name": c.name,
+                        "baseline_time_ms": round(c.baseline_time * 1000, 6),
+                        "current_time_ms": round(c.current_time * 1000, 6),
+                        "change_percent": round(c.change * 100, 2),
+                        "p_value": (
+                            round(c.p_value, 4) if c.p_value is not None else None
+                        ),
+                        "status": c.status,
+                    }
+                    for c in comparisons
+                ],
+            }
+
         print(json.dumps(output, indent=2))
 
-    def _output_csv(self, results: Dict[str, Dict[str, Any]]) -> None:
+    def _json_throughput(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        if "mb_per_sec" not in result:
+            return {}
+        return {
+            "bytes_per_op": result["bytes_per_op"],
+            "mb_per_sec": round(result["mb_per_sec"], 2),
+        }
+
+    def _json_memory(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        if "memory" not in result:
+            return {}
+
+        memory = result["memory"]
+        return {
+            "memory": {
+                "peak_traced_bytes": memory["peak_traced"],
+                "retained_blocks": memory["retained_blocks"],
+                "gc_collections": memory["gc_collections"],
+                "rss_delta_bytes": memory["rss_delta"],
+                "top_allocations": [
+                    {
+                        "location": line["location"],
+                        "size_bytes": line["size"],
+                        "blocks": line["count"],
+                    }
+                    for line in memory["top_allocations"]
+                ],
+            }
+        }
+
+    def _output_csv(
+        self,
+        results: Dict[str, Dict[str, Any]],
+        comparisons: Optional[List[Comparison]] = None,
+    ) -> None:
         output = StringIO()
         writer = csv.writer(output)
+        has_throughput = any("mb_per_sec" in r for r in results.values())
+        memory_columns = (
+            [
+                "Peak Traced (B)",
+                "Retained Blocks",
+                "GC Gen0",
+                "GC Gen1",
+                "GC Gen2",
+                "RSS Delta (B)",
+            ]
+            if self.profiles_memory
+            else []
+        )
         writer.writerow(
-            ["Benchmark", "Iterations", "Total Time (s)", "Avg Time (s)", "Ops/Second"]
+            [
+                "Benchmark",
+                "Iterations",
+                "Total Time (s)",
+                "Avg Time (s)",
+                "Ops/Second",
+                "Rounds",
+                "Min Time (s)",
+                "Median Time (s)",
+                "P95 Time (s)",
+                "P99 Time (s)",
+                "Std Dev (s)",
+            ]
+            + (["MB/s"] if has_throughput else [])
+            + memory_columns
         )
 
         for r in results.values():
@@ -228,15 +666,70 @@ class BenchmarkCommand:
                     round(r["total_time"], 6),
                     round(r["avg_time"], 9),
                     round(r["ops_per_sec"], 2),
+                    r["rounds"],
+                    round(r["min_time"], 9),
+                    round(r["median_time"], 9),
+                    round(r["p95_time"], 9),
+                    round(r["p99_time"], 9),
+                    round(r["stddev_time"], 9),
+                ]
+                + ([round(r.get("mb_per_sec", 0.0), 2)] if has_throughput else [])
+                + self._csv_memory(r)
+            )
+
+        if comparisons is not None:
+            writer.writerow([])
+            writer.writerow(
+                [
+                    "Benchmark",
+                    "Baseline Time (s)",
+                    "Current Time (s)",
+                    "Change (%)",
+                    "P-Value",
+                    "Status",
                 ]
             )
+            for c in comparisons:
+                writer.writerow(
+                    [
+                        c.name,
+                        round(c.baseline_time, 9),
+                        round(c.current_time, 9),
+                        round(c.change * 100, 2),
+                        round(c.p_value, 4) if c.p_value is not None else "",
+                        c.status,
+                    ]
+                )
 
         print(output.getvalue())
 
+    def _csv_memory(self, result: Dict[str, Any]) -> List[Any]:
+        if "memory" not in result:
+            return []
+
+        memory = result["memory"]
+        return [
+            memory["peak_traced"],
+            memory["retained_blocks"],
+            *memory["gc_collections"],
+            memory["rss_delta"],
+        ]
+
+    def _format_p_value(self, comparison: Comparison) -> str:
+        if comparison.p_value is None:
+            return "n/a"
+        return f"{comparison.p_value:.3f}"
+
     def _format_time(self, seconds: float) -> str:
-        if seconds < 0.001:
+        if seconds < 0.000001:
+            return f"{round(seconds * 1_000_000_000, 1)} ns"
+        elif seconds < 0.001:
             return f"{round(seconds * 1_000_000, 2)} μs"
         elif seconds < 1:
             return f"{round(seconds * 1000, 2)} ms"
         else:
             return f"{round(seconds, 2)} s"
+
+
+def _round_or_none(value: Optional[float], digits: int) -> Optional[float]:
+    return None if value is None else round(value, digits)
@@ -0,0 +1,351 @@
+import glob
+import json
+import sys
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+)
+
+from ..utils.json_stream import DEFAULT_CHUNK_SIZE, JsonStreamError, stream_json
+from ..utils.logger import Logger
+from ..utils.memory import format_bytes, peak_rss_bytes
+from ..utils.result import Result
+
+NDJSON_EXTENSIONS = [".ndjson", ".jsonl"]
+PROCESSABLE_EXTENSIONS = [".json"] + NDJSON_EXTENSIONS
+
+
+@dataclass
+class FileResult:
+    path: str
+    size: int = 0
+    elapsed: float = 0.0
+    records: int = 0
+    output: Optional[str] = None
+    error: Optional[str] = None
+
+
+def _process_ndjson_batch(
+    first_line: int, lines: List[str], pretty: bool
+) -> Tuple[str, int]:
+    """Re-serialize one batch of NDJSON lines; runs inside pool workers"""
+    output = []
+    indent = 2 if pretty else None
+
+    for line_number, line in enumerate(lines, first_line):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise json.JSONDecodeError(f"line {line_number}: {e.msg}", e.doc, e.pos)
+        output.append(json.dumps(record, indent=indent))
+
+    return "\n".join(output), len(output)
+
+
+def _process_file(path: str, pretty: bool, ndjson: bool) -> FileResult:
+    """Process one whole file into a buffered result; runs inside pool workers"""
+    start_time = time.perf_counter()
+    file_path = Path(path)
+
+    try:
+        content = file_path.read_text()
+        if ndjson or file_path.suffix.lower() in NDJSON_EXTENSIONS:
+            output, records = _process_ndjson_batch(1, content.splitlines(), pretty)
+        else:
+            output = json.dumps(json.loads(content), indent=2 if pretty else None)
+            records = 1
+    except json.JSONDecodeError as e:
+        return FileResult(path, error=f"Invalid JSON: {e}")
+    except (OSError, UnicodeDecodeError) as e:
+        return FileResult(path, error=str(e))
+
+    return FileResult(
+        path,
+        size=file_path.stat().st_size,
+        elapsed=time.perf_counter() - start_time,
+        records=records,
+        output=output,
+    )
+
+
+@dataclass
+class ProcessCommand:
+    files: List[str]
+    pretty: bool = False
+    stats: bool = False
+    stream: bool = False
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+    ndjson: bool = False
+    workers: int = 1
+    batch_size: int = 1000
+    pool: str = "process"
+    keep_going: bool = False
+    results: List[FileResult] = field(default_factory=list, init=False)
+
+    def __post_init__(self) -> None:
+        if isinstance(self.files, str):
+            self.files = [self.files]
+
+    def execute(self) -> Result:
+        logger = Logger(verbose=self.stats, output=sys.stdout)
+
+        if len(self.files) == 1 and Path(self.files[0]).is_file():
+            return self._process_single(Path(self.files[0]), logger)
+
+        try:
+            paths = self._resolve_inputs()
+        except FileNotFoundError as e:
+            logger.error(str(e))
+            return Result(success=False, message=str(e))
+
+        return self._process_many(paths, logger)
+
+    def _process_single(self, file_path: Path, logger: Logger) -> Result:
+        try:
+            logger.info(f"Processing file: {file_path}")
+
+            start_time = time.perf_counter()
+
+            if self.ndjson or file_path.suffix.lower() in NDJSON_EXTENSIONS:
+                self._process_ndjson(file_path, logger)
+            elif self.stream:
+                self._process_stream(file_path, logger)
+            else:
+                self._process_document(file_path, logger)
+
+            if self.stats:
+                self._report_stats(file_path, time.perf_counter() - start_time, logger)
+
+            return Result(success=True, message="File processed successfully")
+        except (json.JSONDecodeError, JsonStreamError) as e:
+            logger.error(f"Invalid JSON: {e}")
+            return Result(success=False, message=f"Invalid JSON: {e}")
+        except Exception as e:
+            logger.error(f"Error: {e}")
+            return Result(success=False, message=str(e))
+
+    def _process_document(self, file_path: Path, logger: Logger) -> None:
+        content = file_path.read_text()
+        data = json.loads(content)
+
+        logger.info(f"Successfully parsed JSON with {len(data.keys())} keys")
+
+        if self.pretty:
+            print(json.dumps(data, indent=2))
+        else:
+            print(json.dumps(data))
+
+    def _process_stream(self, file_path: Path, logger: Logger) -> None:
+        entries = self._stream_to_stdout(file_path)
+        logger.info(f"Successfully streamed JSON with {entries} top-level entries")
+
+    def _stream_to_stdout(self, file_path: Path) -> int:
+        with file_path.open() as f:
+            entries = stream_json(
+                f,
+                sys.stdout.write,
+                indent=2 if self.pretty else None,
+                chunk_size=self.chunk_size,
+            )
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+        return entries
+
+    def _process_ndjson(self, file_path: Path, logger: Logger) -> None:
+        records = 0
+
+        with file_path.open() as f:
+            batches = self._iter_batches(f)
+
+            if self.workers > 1:
+                with self._make_executor() as executor:
+                    records = self._emit_batches(
+                        self._map_ordered(
+                            executor,
+                            _process_ndjson_batch,
+                            ((first, lines, self.pretty) for first, lines in batches),
+                        )
+                    )
+            else:
+                records = self._emit_batches(
+                    _process_ndjson_batch(first_line, lines, self.pretty)
+                    for first_line, lines in batches
+                )
+
+        logger.info(f"Successfully processed {records} NDJSON records")
+
+    def _iter_batches(self, f: TextIO) -> Iterator[Tuple[int, List[str]]]:
+        first_line = 1
+        while True:
+            lines = list(islice(f, self.batch_size))
+            if not lines:
+                return
+            yield first_line, lines
+            first_line += len(lines)
+
+    def _emit_batches(self, outputs: Iterable[Tuple[str, int]]) -> int:
+        records = 0
+        for output, count in outputs:
+            if count:
+                sys.stdout.write(output + "\n")
+            records += count
+        sys.stdout.flush()
+        return records
+
+    def _resolve_inputs(self) -> List[Path]:
+        paths: List[Path] = []
+
+        for pattern in self.files:
+            path = Path(pattern)
+            if path.is_dir():
+                paths.extend(
+                    sorted(
+                        p
+                        for p in path.rglob("*")
+                        if p.is_file() and p.suffix.lower() in PROCESSABLE_EXTENSIONS
+                    )
+                )
+            elif path.exists():
+                paths.append(path)
+            elif any(char in pattern for char in "*?["):
+                matches = sorted(glob.glob(pattern, recursive=True))
+                if not matches:
+                    raise FileNotFoundError(f"No files match: {pattern}")
+                paths.extend(Path(m) for m in matches if Path(m).is_file())
+            else:
+                raise FileNotFoundError(f"File not found: {pattern}")
+
+        # Drop duplicates from overlapping patterns, keeping first-seen order
+        return list(dict.fromkeys(paths))
+
+    def _process_many(self, paths: List[Path], logger: Logger) -> Result:
+        logger.info(f"Processing {len(paths)} files")
+        start_time = time.perf_counter()
+        failures = 0
+
+        for result in self._iter_file_results(paths):
+            self.results.append(result)
+
+            if result.error:
+                failures += 1
+                logger.error(f"Failed {result.path}: {result.error}")
+                if not self.keep_going:
+                    break
+                continue
+
+            if result.output is not None:
+                sys.stdout.write(result.output + "\n")
+            logger.debug(
+                f"{result.path}: {result.size} bytes, {result.records} records "
+                f"in {round(result.elapsed * 1000, 2)}ms"
+            )
+        sys.stdout.flush()
+
+        elapsed = time.perf_counter() - start_time
+        processed = len(self.results) - failures
+
+        if self.stats:
+            self._report_aggregate_stats(processed, failures, elapsed, logger)
+
+        message = f"Processed {processed} files ({failures} failed)"
+        logger.info(message)
+        return Result(success=failures == 0, message=message)
+
+    def _iter_file_results(self, paths: List[Path]) -> Iterator[FileResult]:
+        if self.stream:
+            # Streaming writes straight to stdout, so files are handled in order
+            for path in paths:
+                yield self._stream_file(path)
+        elif self.workers > 1:
+            with self._make_executor() as executor:
+                yield from self._map_ordered(
+                    executor,
+                    _process_file,
+                    ((str(path), self.pretty, self.ndjson) for path in paths),
+                )
+        else:
+            for path in paths:
+                yield _process_file(str(path), self.pretty, self.ndjson)
+
+    def _stream_file(self, path: Path) -> FileResult:
+        start_time = time.perf_counter()
+
+        try:
+            if self.ndjson or path.suffix.lower() in NDJSON_EXTENSIONS:
+                result = _process_file(str(path), self.pretty, self.ndjson)
+                if result.output is not None:
+                    sys.stdout.write(result.output + "\n")
+                    result.output = None
+                return result
+
+            entries = self._stream_to_stdout(path)
+        except JsonStreamError as e:
+            return FileResult(str(path), error=f"Invalid JSON: {e}")
+        except (OSError, UnicodeDecodeError) as e:
+            return FileResult(str(path), error=str(e))
+
+        return FileResult(
+            str(path),
+            size=path.stat().st_size,
+            elapsed=time.perf_counter() - start_time,
+            records=entries,
+        )
+
+    def _make_executor(self) -> Executor:
+        if self.pool == "thread":
+            return ThreadPoolExecutor(max_workers=self.workers)
+        return ProcessPoolExecutor(max_workers=self.workers)
+
+    def _map_ordered(
+        self,
+        executor: Executor,
+        func: Callable[..., Any],
+        arguments: Iterable[Tuple[Any, ...]],
+    ) -> Iterator[Any]:
+        # Keep a bounded window of tasks in flight and yield in input order
+        pending: Deque[Future] = deque()
+
+        for args in arguments:
+            pending.append(executor.submit(func, *args))
+            if len(pending) >= self.workers * 2:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+    def _report_stats(self, file_path: Path, elapsed: float, logger: Logger) -> None:
+        size = file_path.stat().st_size
+        throughput = size / elapsed if elapsed > 0 else 0.0
+
+        logger.info(f"File size: {size} bytes")
+        logger.info(f"Throughput: {format_bytes(throughput)}/s")
+        logger.info(f"Peak memory: {format_bytes(peak_rss_bytes())}")
+        logger.info("Processing complete")
+
+    def _report_aggregate_stats(
+        self, processed: int, failures: int, elapsed: float, logger: Logger
+    ) -> None:
+        total_bytes = sum(r.size for r in self.results)
+        files_per_sec = processed / elapsed if elapsed > 0 else 0.0
+        bytes_per_sec = total_bytes / elapsed if elapsed > 0 else 0.0
+
+        logger.info(f"Files: {processed} processed, {failures} failed")
+        logger.info(f"Total size: {total_bytes} bytes")
+        logger.info(f"Files/second: {files_per_sec:.2f}")
+        logger.info(f"Throughput: {format_bytes(bytes_per_sec)}/s")
+        logger.info(f"Peak memory: {format_bytes(peak_rss_bytes())}")
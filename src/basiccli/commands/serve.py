@@ -0,0 +1,172 @@
+import importlib
+import json
+import os
+import signal
+import socket
+import struct
+import sys
+import traceback
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+from ..utils.result import Result
+
+_HEADER = struct.Struct("!I")
+_STATUS = struct.Struct("!i")
+_STOP_SIGNALS = {signal.SIGINT, signal.SIGTERM}
+
+
+@dataclass
+class ServeCommand:
+    socket_path: str
+    handler: Callable[[List[str]], int]
+    preload: List[str] = field(
+        default_factory=lambda: [
+            "click",
+            "yaml",
+            "basiccli.commands.benchmark",
+            "basiccli.commands.hello",
+            "basiccli.commands.process",
+            "basiccli.commands.version",
+            "basiccli.utils.file_handler",
+            "basiccli.utils.logger",
+        ]
+    )
+    verbose: bool = False
+
+    def execute(self) -> Result:
+        if not hasattr(os, "fork") or not hasattr(socket, "AF_UNIX"):
+            return Result(success=False, message="serve requires a POSIX system")
+
+        try:
+            self._warm_up()
+            server = self._bind()
+        except (ImportError, OSError) as e:
+            return Result(success=False, message=str(e))
+
+        previous_sigterm = signal.signal(signal.SIGTERM, self._raise_interrupt)
+        try:
+            print(f"Listening on {self.socket_path}")
+            sys.stdout.flush()
+            self._serve_forever(server)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            signal.signal(signal.SIGTERM, previous_sigterm)
+            server.close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+        return Result(success=True, message="Server stopped")
+
+    def _warm_up(self) -> None:
+        for module in self.preload:
+            importlib.import_module(module)
+
+    def _bind(self) -> socket.socket:
+        path = Path(self.socket_path)
+
+        if path.exists():
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.socket_path)
+                raise OSError(f"A server is already listening on {self.socket_path}")
+            except (ConnectionRefusedError, FileNotFoundError):
+                path.unlink()  # stale socket left by a crashed server
+            finally:
+                probe.close()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Owner-only from the moment the socket file appears
+        previous_umask = os.umask(0o177)
+        try:
+            server.bind(self.socket_path)
+        finally:
+            os.umask(previous_umask)
+        server.listen(socket.SOMAXCONN)
+        return server
+
+    def _serve_forever(self, server: socket.socket) -> None:
+        while True:
+            conn, _ = server.accept()
+            self._reap_workers()
+
+            sys.stdout.flush()
+            sys.stderr.flush()
+            # Hold stop signals across fork so they are never delivered inside
+            # at-fork hooks, where the resulting exception would be swallowed
+            signal.pthread_sigmask(signal.SIG_BLOCK, _STOP_SIGNALS)
+            pid = os.fork()
+            if pid == 0:
+                server.close()
+                self._run_worker(conn)
+            conn.close()
+            signal.pthread_sigmask(signal.SIG_UNBLOCK, _STOP_SIGNALS)
+
+    def _reap_workers(self) -> None:
+        while True:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+
+    def _run_worker(self, conn: socket.socket) -> None:
+        """Run one forwarded command in a forked child; never returns"""
+        code = 1
+        try:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.default_int_handler)
+            signal.pthread_sigmask(signal.SIG_UNBLOCK, _STOP_SIGNALS)
+
+            request = self._receive_request(conn)
+            if request is None:
+                os._exit(0)  # connection probe, or the client went away
+            conn.sendall(_STATUS.pack(os.getpid()))
+
+            os.chdir(request["cwd"])
+            if self.verbose:
+                print(f"[{os.getpid()}] {' '.join(request['argv'])}", file=sys.stderr)
+            code = self.handler(request["argv"])
+        except KeyboardInterrupt:
+            code = 130
+        except Exception:
+            traceback.print_exc()
+        finally:
+            try:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                conn.sendall(_STATUS.pack(code))
+            finally:
+                os._exit(code)
+
+    def _receive_request(self, conn: socket.socket) -> Optional[Any]:
+        data, fds, _, _ = socket.recv_fds(conn, 65536, 3)
+        if not data and not fds:
+            return None
+        if len(fds) != 3:
+            raise OSError("Client did not send stdin/stdout/stderr descriptors")
+
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+            os.close(fd)
+
+        while len(data) < _HEADER.size:
+            data += self._recv_or_fail(conn)
+        (length,) = _HEADER.unpack_from(data)
+        while len(data) < _HEADER.size + length:
+            data += self._recv_or_fail(conn)
+
+        return json.loads(data[_HEADER.size : _HEADER.size + length])
+
+    def _recv_or_fail(self, conn: socket.socket) -> bytes:
+        chunk = conn.recv(65536)
+        if not chunk:
+            raise OSError("Client closed the connection")
+        return chunk
+
+    def _raise_interrupt(self, signum: int, frame: Any) -> None:
+        raise KeyboardInterrupt
@@ -1,15 +1,32 @@
 import csv
 import hashlib
 import json
+import mmap
 import os
+import re
 import shutil
 import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
+from itertools import chain, filterfalse, islice
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import yaml
 
+from .parse_cache import ParseCache
+
 
 class FileError(Exception):
     pass
@@ -19,17 +36,238 @@ class UnsupportedFormatError(FileError):
     pass
 
 
+# Plain decimal literals only: int() and float() also accept underscores and
+# surrounding whitespace, which a numeric CSV column should not
+_INT_LITERAL = re.compile(r"[-+]?\d+", re.ASCII)
+# Blank is allowed and loads as NaN
+_FLOAT_LITERAL = re.compile(
+    r"([-+]?((\d+\.?\d*|\.\d+)([eE][-+]?\d+)?|nan|inf|infinity))?",
+    re.ASCII | re.IGNORECASE,
+)
+_INT64_RANGE = range(-(2**63), 2**63)
+_LOOSE_NUMBER_CHARS = re.compile(r"[_\s]")
+
+
+def _parse_float(value: str) -> float:
+    return float(value) if value else float("nan")
+
+
+# Column dtype -> (array typecode, literal pattern, parser); "str" columns
+# stay lists
+COLUMN_TYPES: Dict[str, Any] = {
+    "int": ("q", _INT_LITERAL, int),
+    "float": ("d", _FLOAT_LITERAL, _parse_float),
+}
+COLUMN_BATCH_SIZE = 10000
+
+
+def _infer_dtype(values: Iterable[str]) -> str:
+    dtype = "int"
+    for value in values:
+        if (
+            dtype == "int"
+            and _INT_LITERAL.fullmatch(value)
+            and int(value) in _INT64_RANGE
+        ):
+            continue
+        if not _FLOAT_LITERAL.fullmatch(value):
+            return "str"
+        # Blank cells become NaN and out-of-range ints lose precision, both of
+        # which only a float column can hold
+        dtype = "float"
+    return dtype
+
+
+def _first_invalid(kind: str, values: Sequence[str]) -> Optional[str]:
+    _, literal, _ = COLUMN_TYPES[kind]
+    for value in values:
+        if not literal.fullmatch(value):
+            return value
+        if kind == "int" and int(value) not in _INT64_RANGE:
+            return value
+    return None
+
+
+def _parse_column(kind: str, values: Sequence[str]) -> Iterator[Any]:
+    _, literal, parse = COLUMN_TYPES[kind]
+    joined = "".join(values)
+    # Without these characters int() and float() are as strict as the pattern,
+    # so most batches skip the per-value check
+    if not joined.isascii() or _LOOSE_NUMBER_CHARS.search(joined):
+        for value in filterfalse(literal.fullmatch, values):
+            raise ValueError(f"could not convert {value!r} to {kind}")
+    return map(parse, values)
+
+
+DEFAULT_TREE_CHUNK_SIZE = 64 * 1024 * 1024
+
+
+def _default_workers() -> int:
+    # ThreadPoolExecutor's own default, for I/O-bound hashing
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+def _checksum_buffer_size(file_size: int) -> int:
+    return min(max(file_size, 64 * 1024), 4 * 1024 * 1024)
+
+
+def _batched(rows: Iterator[Any], size: int) -> Iterator[List[Any]]:
+    return iter(lambda: list(islice(rows, size)), [])
+
+
+class CsvReader:
+    """Streams rows from a CSV file, holding one row (or batch) at a time.
+
+    The header row is read on construction and exposed as ``header``. Rows
+    are dicts as with ``FileHandler.read``, or tuples in header order with
+    ``as_tuples``; with ``batch_size`` they come in lists of that many rows.
+    The file closes once iteration finishes, or on ``close``/``with`` exit.
+    """
+
+    def __init__(
+        self,
+        filepath: Union[str, Path],
+        batch_size: Optional[int] = None,
+        as_tuples: bool = False,
+    ) -> None:
+        self.filepath = Path(filepath)
+        if not self.filepath.exists():
+            raise FileError(f"File not found: {self.filepath}")
+
+        self.batch_size = batch_size
+        self.as_tuples = as_tuples
+        self._file = self.filepath.open(newline="")
+        self._reader = csv.reader(self._file)
+        try:
+            self.header: List[str] = next(self._reader, [])
+        except csv.Error as e:
+            self.close()
+            raise FileError(f"Invalid CSV: {e}")
+
+    def __iter__(self) -> Iterator[Any]:
+        rows: Iterator[Any]
+        if self.as_tuples:
+            # Skip blank lines, as DictReader does
+            rows = map(tuple, filter(None, self._reader))
+        else:
+            rows = csv.DictReader(self._file, fieldnames=self.header)
+
+        if self.batch_size:
+            rows = _batched(rows, self.batch_size)
+
+        try:
+            yield from rows
+        except csv.Error as e:
+            raise FileError(f"Invalid CSV: {e}")
+        finally:
+            self.close()
+
+    def __enter__(self) -> "CsvReader":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class MappedFile:
+    """Read-only memory map of a file.
+
+    Slices, ``lines`` and ``view`` return memoryviews into the page cache
+    rather than copies, so processes mapping the same file share its pages.
+    Views must be released (or dropped) before ``close``; closing while a
+    view is still held raises ``BufferError``.
+    """
+
+    def __init__(self, filepath: Union[str, Path]) -> None:
+        self.filepath = Path(filepath)
+        if not self.filepath.exists():
+            raise FileError(f"File not found: {self.filepath}")
+
+        with self.filepath.open("rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            # mmap cannot map an empty file
+            self._map: Optional[mmap.mmap] = (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+            )
+        self.view = memoryview(self._map if self._map is not None else b"")
+
+    def __len__(self) -> int:
+        return len(self.view)
+
+    def __getitem__(self, key: Union[int, slice]) -> Any:
+        return self.view[key]
+
+    def __enter__(self) -> "MappedFile":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def find(self, sub: bytes, start: int = 0, end: Optional[int] = None) -> int:
+        if self._map is None:
+            return -1
+        return self._map.find(sub, start, len(self) if end is None else end)
+
+    def rfind(self, sub: bytes, start: int = 0, end: Optional[int] = None) -> int:
+        if self._map is None:
+            return -1
+        return self._map.rfind(sub, start, len(self) if end is None else end)
+
+    def search(self, pattern: Union[bytes, "re.Pattern[bytes]"]) -> Iterator[Any]:
+        """Regex matches over the whole mapping, without decoding it"""
+        return re.compile(pattern).finditer(self.view)
+
+    def lines(self, keepends: bool = False) -> Iterator[memoryview]:
+        start, size = 0, len(self)
+        while start < size:
+            end = self.find(b"\n", start)
+            if end == -1:
+                yield self.view[start:]
+                return
+            yield self.view[start : end + 1 if keepends else end]
+            start = end + 1
+
+    def read_text(self, encoding: str = "utf-8") -> str:
+        """Decode the whole file (this copies it into a str)"""
+        return str(self.view, encoding)
+
+    def close(self) -> None:
+        self.view.release()
+        if self._map is not None:
+            self._map.close()
+
+
 class FileHandler:
     SUPPORTED_FORMATS = [".json", ".yaml", ".yml", ".csv", ".txt", ".log"]
+    HASH_ALGORITHMS = {
+        "md5": hashlib.md5,
+        "sha1": hashlib.sha1,
+        "sha256": hashlib.sha256,
+        "sha512": hashlib.sha512,
+    }
 
     @classmethod
-    def read(cls, filepath: Union[str, Path], format: Optional[str] = None) -> Any:
+    def read(
+        cls,
+        filepath: Union[str, Path],
+        format: Optional[str] = None,
+        cache: Optional[ParseCache] = None,
+    ) -> Any:
         filepath = Path(filepath)
 
         if not filepath.exists():
             raise FileError(f"File not found: {filepath}")
 
         format = format or cls._detect_format(filepath)
+        if cache is not None and format in ("json", "yaml", "csv"):
+            return cache.get(filepath, format, lambda: cls._read(filepath, format))
+        return cls._read(filepath, format)
+
+    @classmethod
+    def _read(cls, filepath: Path, format: str) -> Any:
         content = filepath.read_text()
 
         try:
@@ -64,15 +302,193 @@ class FileHandler:
             elif format == "yaml":
                 content = yaml.dump(data, default_flow_style=False)
             elif format == "csv":
+                if data and isinstance(data, list) and isinstance(data[0], dict):
+                    cls.write_csv(filepath, data)
+                    return True
                 content = cls._generate_csv(data)
             else:
                 content = str(data)
 
             filepath.write_text(content)
             return True
+        except FileError:
+            raise
         except Exception as e:
             raise FileError(f"Failed to write {filepath}: {e}")
 
+    @classmethod
+    def open_mapped(cls, filepath: Union[str, Path]) -> MappedFile:
+        return MappedFile(filepath)
+
+    @classmethod
+    def iter_csv(
+        cls,
+        filepath: Union[str, Path],
+        batch_size: Optional[int] = None,
+        as_tuples: bool = False,
+    ) -> CsvReader:
+        return CsvReader(filepath, batch_size=batch_size, as_tuples=as_tuples)
+
+    @classmethod
+    def write_csv(
+        cls,
+        filepath: Union[str, Path],
+        rows: Iterable[Any],
+        fieldnames: Optional[Sequence[str]] = None,
+    ) -> int:
+        """Write rows as they arrive and return how many were written.
+
+        Rows are dicts or sequences. The header is ``fieldnames``, or the keys
+        of the first dict row; sequence rows without ``fieldnames`` are
+        written without a header. Rows go to a temporary file that replaces
+        ``filepath`` once all are written, so an invalid row leaves an
+        existing file untouched.
+        """
+        filepath = Path(filepath)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = filepath.with_suffix(f".tmp.{os.getpid()}")
+
+        rows = iter(rows)
+        first = next(rows, None)
+
+        try:
+            with temp_file.open("w", newline="") as f:
+                count = 0
+                if first is None:
+                    if fieldnames:
+                        csv.writer(f).writerow(fieldnames)
+                else:
+                    if isinstance(first, dict):
+                        writer: Any = csv.DictWriter(f, fieldnames or list(first))
+                        writer.writeheader()
+                    else:
+                        writer = csv.writer(f)
+                        if fieldnames:
+                            writer.writerow(fieldnames)
+
+                    for row in chain([first], rows):
+                        writer.writerow(row)
+                        count += 1
+            temp_file.replace(filepath)
+            return count
+        except (csv.Error, ValueError, TypeError) as e:
+            raise FileError(f"Failed to write {filepath}: {e}")
+        finally:
+            if temp_file.exists():
+                temp_file.unlink()
+
+    @classmethod
+    def read_columns(
+        cls,
+        filepath: Union[str, Path],
+        dtypes: Optional[Dict[str, str]] = None,
+        sample_size: int = 1000,
+        use_numpy: Optional[bool] = None,
+    ) -> Dict[str, Any]:
+        """Load a CSV into one compact column per header field.
+
+        Numeric columns are stored as ``array.array`` ("q" for int, "d" for
+        float, 8 bytes per value) or, when NumPy is installed and
+        ``use_numpy`` isn't False, as NumPy arrays sharing the same buffer.
+        Column types come from ``dtypes`` ("int", "float" or "str") or are
+        inferred from the first ``sample_size`` rows. Numbers must be plain
+        decimal literals, so values with underscores or surrounding
+        whitespace make a column "str". An int column that later meets a
+        float, blank or out-of-range value is widened to float; blank float
+        values load as NaN.
+        """
+        numpy = None
+        if use_numpy is not False:
+            try:
+                import numpy  # type: ignore[import-not-found,no-redef]
+            except ImportError:
+                if use_numpy:
+                    raise FileError("read_columns(use_numpy=True) requires NumPy")
+
+        dtypes = dict(dtypes or {})
+        with cls.iter_csv(
+            filepath, batch_size=COLUMN_BATCH_SIZE, as_tuples=True
+        ) as reader:
+            header = reader.header
+            unknown = set(dtypes) - set(header)
+            if unknown:
+                raise FileError(f"Unknown columns: {', '.join(sorted(unknown))}")
+
+            width = len(header)
+            batches = iter(reader)
+            first: List[Any] = next(batches, [])
+            if any(len(row) != width for row in first):
+                raise FileError(f"Invalid CSV: rows must have {width} fields")
+            sample = list(zip(*first[:sample_size])) or [()] * width
+            kinds = [
+                dtypes.get(name) or _infer_dtype(values)
+                for name, values in zip(header, sample)
+            ]
+            for kind in kinds:
+                if kind not in COLUMN_TYPES and kind != "str":
+                    raise FileError(f"Unsupported column dtype: {kind}")
+
+            columns: List[Any] = [
+                array(COLUMN_TYPES[kind][0]) if kind in COLUMN_TYPES else []
+                for kind in kinds
+            ]
+            for batch in chain([first], batches):
+                if any(len(row) != width for row in batch):
+                    raise FileError(f"Invalid CSV: rows must have {width} fields")
+                for index, values in enumerate(zip(*batch)):
+                    kinds[index], columns[index] = cls._extend_column(
+                        header[index], kinds[index], columns[index], values, dtypes
+                    )
+
+        result: Dict[str, Any] = dict(zip(header, columns))
+        if numpy is not None:
+            for name, kind in zip(header, kinds):
+                if kind in COLUMN_TYPES:
+                    # Zero-copy view over the array's buffer
+                    result[name] = numpy.frombuffer(
+                        result[name], dtype=numpy.dtype(COLUMN_TYPES[kind][0])
+                    )
+        return result
+
+    @classmethod
+    def _extend_column(
+        cls,
+        name: str,
+        kind: str,
+        column: Any,
+        values: Sequence[str],
+        dtypes: Dict[str, str],
+    ) -> Tuple[str, Any]:
+        if kind == "str":
+            column.extend(values)
+            return kind, column
+
+        start = len(column)
+        try:
+            column.extend(_parse_column(kind, values))
+            return kind, column
+        except (ValueError, OverflowError):
+            # OverflowError: an int outside the 64-bit range. Drop the values
+            # appended before the failure.
+            del column[start:]
+
+        if name in dtypes:
+            value = _first_invalid(kind, values)
+            raise FileError(f"Invalid {kind} value in column {name}: {value!r}")
+
+        if kind == "int":
+            try:
+                widened = array("d", column)
+                widened.extend(_parse_column("float", values))
+                return "float", widened
+            except ValueError:
+                pass
+        # Not a number at all, whichever type was inferred
+        value = _first_invalid("float", values)
+        raise FileError(
+            f"Invalid value in column {name} (inferred type {kind}): {value!r}"
+        )
+
     @classmethod
     def copy(
         cls,
@@ -144,29 +560,99 @@ class FileHandler:
         return filepath.stat().st_size
 
     @classmethod
-    def checksum(cls, filepath: Union[str, Path], algorithm: str = "sha256") -> str:
+    def checksum(
+        cls,
+        filepath: Union[str, Path],
+        algorithm: str = "sha256",
+        buffer_size: Optional[int] = None,
+    ) -> str:
+        """Hash the file through one reused buffer; by default the buffer
+        grows with the file, from 64 KiB up to 4 MiB"""
         filepath = Path(filepath)
 
         if not filepath.exists():
             raise FileError(f"File not found: {filepath}")
 
-        hash_algorithms = {
-            "md5": hashlib.md5,
-            "sha1": hashlib.sha1,
-            "sha256": hashlib.sha256,
-            "sha512": hashlib.sha512,
-        }
+        hasher = cls._hasher(algorithm)
 
-        if algorithm not in hash_algorithms:
-            raise ValueError(f"Unsupported algorithm: {algorithm}")
+        with filepath.open("rb", buffering=0) as f:
+            size = buffer_size or _checksum_buffer_size(os.fstat(f.fileno()).st_size)
+            buffer = bytearray(size)
+            view = memoryview(buffer)
+            while True:
+                count = f.readinto(buffer)
+                if not count:
+                    break
+                hasher.update(view[:count])
 
-        hasher = hash_algorithms[algorithm]()
+        return hasher.hexdigest()
 
-        with filepath.open("rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hasher.update(chunk)
+    @classmethod
+    def checksum_many(
+        cls,
+        paths: Iterable[Union[str, Path]],
+        algorithm: str = "sha256",
+        workers: Optional[int] = None,
+    ) -> Dict[str, str]:
+        """Checksum files concurrently; keys are the paths as given, in order.
 
-        return hasher.hexdigest()
+        hashlib releases the GIL while hashing, so threads hash in parallel.
+        """
+        cls._hasher(algorithm)
+        keys = [str(path) for path in paths]
+
+        with ThreadPoolExecutor(max_workers=workers or _default_workers()) as executor:
+            digests = executor.map(lambda path: cls.checksum(path, algorithm), keys)
+            return dict(zip(keys, digests))
+
+    @classmethod
+    def tree_checksum(
+        cls,
+        filepath: Union[str, Path],
+        algorithm: str = "sha256",
+        chunk_size: int = DEFAULT_TREE_CHUNK_SIZE,
+        workers: Optional[int] = None,
+    ) -> str:
+        """Hash fixed-size chunks of the file in parallel, then hash the
+        concatenated chunk digests.
+
+        This is not the plain file digest: it differs from ``checksum`` and
+        depends on ``chunk_size``, so compare tree checksums only with tree
+        checksums made with the same algorithm and chunk size.
+        """
+        filepath = Path(filepath)
+
+        if not filepath.exists():
+            raise FileError(f"File not found: {filepath}")
+
+        cls._hasher(algorithm)
+        if chunk_size <= 0:
+            raise ValueError(f"Invalid chunk size: {chunk_size}")
+
+        with MappedFile(filepath) as mapped:
+            view = mapped.view
+
+            def digest(offset: int) -> bytes:
+                hasher = cls._hasher(algorithm)
+                with view[offset : offset + chunk_size] as chunk:
+                    hasher.update(chunk)
+                return hasher.digest()
+
+            offsets = range(0, len(mapped), chunk_size)
+            with ThreadPoolExecutor(
+                max_workers=workers or _default_workers()
+            ) as executor:
+                digests = list(executor.map(digest, offsets))
+
+        root = cls._hasher(algorithm)
+        root.update(b"".join(digests))
+        return root.hexdigest()
+
+    @classmethod
+    def _hasher(cls, algorithm: str) -> "hashlib._Hash":
+        if algorithm not in cls.HASH_ALGORITHMS:
+            raise ValueError(f"Unsupported algorithm: {algorithm}")
+        return cls.HASH_ALGORITHMS[algorithm]()
 
     @classmethod
     def stats(cls, filepath: Union[str, Path]) -> Dict[str, Any]:
@@ -266,14 +752,7 @@ class FileHandler:
 
     @classmethod
     def _generate_csv(cls, data: Any) -> str:
+        # Lists of dicts never get here: write() streams them through write_csv
         if not data:
             return ""
-
-        if isinstance(data, list) and isinstance(data[0], dict):
-            output = StringIO()
-            writer = csv.DictWriter(output, fieldnames=data[0].keys())
-            writer.writeheader()
-            writer.writerows(data)
-            return output.getvalue()
-        else:
-            return str(data)
+        return str(data)
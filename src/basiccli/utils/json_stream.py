@@ -0,0 +1,261 @@
+import json
+import re
+from json.encoder import encode_basestring_ascii
+from typing import Callable, List, Optional, TextIO, Tuple
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# String contents up to the closing quote, an escape cut off by the end of the
+# buffer, or an invalid character
+_STRING_BODY = re.compile(r'(?:[^"\\\x00-\x1f]|\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4}))*')
+_LONGEST_ESCAPE = 6
+_PLAIN_STRING = re.compile(r'"[ !#-\[\]-~]*"')
+_SCALAR = re.compile(
+    r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?"
+    r"|true|false|null|NaN|-?Infinity"
+)
+_SCALAR_SPAN = re.compile(r"[-+.0-9A-Za-z]*")
+_STRUCTURAL = "{}[]:,"
+
+# Parser expectations
+_VALUE = 0
+_VALUE_OR_CLOSE = 1
+_KEY = 2
+_KEY_OR_CLOSE = 3
+_COLON = 4
+_COMMA_OR_CLOSE = 5
+_DONE = 6
+
+
+class JsonStreamError(ValueError):
+    pass
+
+
+class _Tokenizer:
+    """Splits a character stream into JSON tokens, holding at most one chunk
+    plus the token currently being read in memory."""
+
+    def __init__(self, stream: TextIO, chunk_size: int) -> None:
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.offset = 0
+        self.eof = False
+
+    @property
+    def position(self) -> int:
+        return self.offset + self.pos
+
+    def next(self) -> Optional[Tuple[str, str]]:
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()  # type: ignore
+            if self.pos < len(self.buffer):
+                break
+            if not self._fill():
+                return None
+
+        char = self.buffer[self.pos]
+        if char in _STRUCTURAL:
+            self.pos += 1
+            return char, char
+
+        if char == '"':
+            return "string", self._read_string()
+        return "scalar", self._read_scalar()
+
+    def _read_string(self) -> str:
+        # Completed segments are set aside before each refill, so every
+        # character is scanned once however many chunks the string spans
+        start = self.position
+        segments = ['"']
+        self.pos += 1
+        while True:
+            end = _STRING_BODY.match(self.buffer, self.pos).end()  # type: ignore
+            segments.append(self.buffer[self.pos : end])
+            self.pos = end
+
+            if end < len(self.buffer):
+                char = self.buffer[end]
+                if char == '"':
+                    self.pos += 1
+                    segments.append('"')
+                    return "".join(segments)
+                if char != "\\" or len(self.buffer) - end >= _LONGEST_ESCAPE:
+                    break
+                # An escape split across chunks: read on from the backslash
+            if not self._fill():
+                break
+
+        raise JsonStreamError(f"Invalid string at offset {start}")
+
+    def _read_scalar(self) -> str:
+        # A scalar touching the end of the buffer may continue in the next chunk
+        while True:
+            end = _SCALAR_SPAN.match(self.buffer, self.pos).end()  # type: ignore
+            if end < len(self.buffer) or not self._fill():
+                break
+
+        match = _SCALAR.match(self.buffer, self.pos)
+        if not match or match.end() != end:
+            raise JsonStreamError(f"Invalid JSON value at offset {self.position}")
+
+        self.pos = end
+        return match.group()
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+
+        if self.pos:
+            self.offset += self.pos
+            self.buffer = self.buffer[self.pos :]
+            self.pos = 0
+        self.buffer += chunk
+        return True
+
+
+class _BufferedWriter:
+    def __init__(self, write: Callable[[str], object], limit: int) -> None:
+        self.write_through = write
+        self.limit = limit
+        self.parts: List[str] = []
+        self.size = 0
+
+    def write(self, text: str) -> None:
+        self.parts.append(text)
+        self.size += len(text)
+        if self.size >= self.limit:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.parts:
+            self.write_through("".join(self.parts))
+            self.parts = []
+            self.size = 0
+
+
+def _encode_string(token: str) -> str:
+    if _PLAIN_STRING.fullmatch(token):
+        return token
+    decoded: str = json.loads(token)
+    return encode_basestring_ascii(decoded)
+
+
+def _encode_scalar(token: str) -> str:
+    if token[0] in "tfnNI" or token == "-Infinity":
+        return token
+    if "." not in token and "e" not in token and "E" not in token:
+        return "0" if token == "-0" else token
+
+    value = float(token)
+    if value == float("inf"):
+        return "Infinity"
+    if value == float("-inf"):
+        return "-Infinity"
+    return repr(value)
+
+
+def stream_json(
+    stream: TextIO,
+    write: Callable[[str], object],
+    indent: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """Re-serialize the JSON document in ``stream`` through ``write`` without
+    building the object tree.
+
+    Output matches ``json.dumps(json.load(stream), indent=indent)`` except that
+    duplicate object keys are preserved rather than collapsed. Returns the
+    number of top-level keys (or items) in the document.
+    """
+    tokens = _Tokenizer(stream, chunk_size)
+    out = _BufferedWriter(write, chunk_size)
+    item_separator = "," if indent is not None else ", "
+    # Each frame is [closing character, number of items written]
+    stack: List[list] = []
+    expect = _VALUE
+    top_level_entries = 0
+
+    def newline(depth: int) -> None:
+        if indent is not None:
+            out.write("\n" + " " * (indent * depth))
+
+    def begin_item() -> None:
+        frame = stack[-1]
+        if frame[1]:
+            out.write(item_separator)
+        newline(len(stack))
+        frame[1] += 1
+
+    while True:
+        token = tokens.next()
+        if token is None:
+            if expect != _DONE:
+                raise JsonStreamError(
+                    f"Unexpected end of JSON input at offset {tokens.position}"
+                )
+            break
+
+        kind, text = token
+
+        if expect == _DONE:
+            raise JsonStreamError(f"Extra data at offset {tokens.position - len(text)}")
+
+        if kind == "string" and expect in (_KEY, _KEY_OR_CLOSE):
+            begin_item()
+            out.write(_encode_string(text))
+            if len(stack) == 1:
+                top_level_entries += 1
+            expect = _COLON
+        elif kind == ":" and expect == _COLON:
+            out.write(": ")
+            expect = _VALUE
+        elif kind == "," and expect == _COMMA_OR_CLOSE:
+            expect = _KEY if stack[-1][0] == "}" else _VALUE
+        elif kind in ("}", "]") and (
+            (expect == _COMMA_OR_CLOSE and stack[-1][0] == kind)
+            or (expect == _KEY_OR_CLOSE and kind == "}")
+            or (expect == _VALUE_OR_CLOSE and kind == "]")
+        ):
+            frame = stack.pop()
+            if frame[1]:
+                newline(len(stack))
+            out.write(kind)
+            expect = _COMMA_OR_CLOSE if stack else _DONE
+        elif kind in ("{", "[", "string", "scalar") and expect in (
+            _VALUE,
+            _VALUE_OR_CLOSE,
+        ):
+            if stack and stack[-1][0] == "]":
+                begin_item()
+                if len(stack) == 1:
+                    top_level_entries += 1
+
+            if kind == "{":
+                out.write("{")
+                stack.append(["}", 0])
+                expect = _KEY_OR_CLOSE
+            elif kind == "[":
+                out.write("[")
+                stack.append(["]", 0])
+                expect = _VALUE_OR_CLOSE
+            else:
+                if kind == "string":
+                    out.write(_encode_string(text))
+                else:
+                    out.write(_encode_scalar(text))
+                expect = _COMMA_OR_CLOSE if stack else _DONE
+        else:
+            raise JsonStreamError(
+                f"Unexpected {text!r} at offset {tokens.position - len(text)}"
+            )
+
+    out.flush()
+    return top_level_entries
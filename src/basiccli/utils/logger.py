@@ -1,9 +1,34 @@
+import atexit
+import gzip
+import json
+import lzma
+import math
+import os
+import queue
+import re
+import shutil
+import signal
 import sys
 import threading
 import time
-from datetime import datetime
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from enum import IntEnum
-from typing import Any, Dict, Optional, TextIO
+from pathlib import Path
+from types import FrameType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
 
 
 class LogLevel(IntEnum):
@@ -14,7 +39,156 @@ class LogLevel(IntEnum):
     FATAL = 4
 
 
+@dataclass
+class FlushPolicy:
+    """When a logger flushes its output.
+
+    Output is flushed once ``records`` records are pending, once
+    ``interval_ms`` has passed since the last flush, or on any record at
+    ``level`` or above, whichever comes first; ``None`` disables a trigger.
+    The default flushes every record. Buffering loggers also flush at exit
+    and on SIGTERM/SIGHUP.
+    """
+
+    records: Optional[int] = 1
+    interval_ms: Optional[float] = None
+    level: Optional[LogLevel] = None
+
+    @property
+    def buffers(self) -> bool:
+        return self.records != 1
+
+    def should_flush(self, severity: LogLevel, pending: int, last_flush: float) -> bool:
+        """``last_flush`` is the ``time.monotonic()`` of the previous flush"""
+        return (
+            (self.records is not None and pending >= self.records)
+            or (self.level is not None and severity >= self.level)
+            or (
+                self.interval_ms is not None
+                and (time.monotonic() - last_flush) * 1000 >= self.interval_ms
+            )
+        )
+
+
+# Loggers holding unflushed output, flushed at exit and on termination signals
+_buffered_loggers: "weakref.WeakSet[Logger]" = weakref.WeakSet()
+_FLUSH_SIGNALS = [
+    getattr(signal, name) for name in ("SIGTERM", "SIGHUP") if hasattr(signal, name)
+]
+
+
+def _flush_buffered_loggers(blocking: bool = True) -> None:
+    for logger in list(_buffered_loggers):
+        # A signal may arrive while this thread is mid-write holding the mutex
+        if not logger.mutex.acquire(blocking):
+            continue
+        try:
+            logger._flush_output()
+        except (OSError, ValueError):
+            # Output already closed
+            pass
+        finally:
+            logger.mutex.release()
+
+
+def _flush_and_reraise(signum: int, frame: Optional[FrameType]) -> None:
+    _flush_buffered_loggers(blocking=False)
+    signal.signal(signum, signal.SIG_DFL)
+    os.kill(os.getpid(), signum)
+
+
+def _track_buffered_logger(logger: "Logger") -> None:
+    if not _buffered_loggers and threading.current_thread() is threading.main_thread():
+        # Only take over signals nobody else handles
+        for signum in _FLUSH_SIGNALS:
+            if signal.getsignal(signum) == signal.SIG_DFL:
+                signal.signal(signum, _flush_and_reraise)
+    _buffered_loggers.add(logger)
+
+
+atexit.register(_flush_buffered_loggers)
+
+# Loggers with writer threads to close at exit; weak, so an exit hook never
+# keeps a logger alive
+_open_loggers: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+
+def _close_open_loggers() -> None:
+    for logger in list(_open_loggers):
+        logger.close()
+
+
+atexit.register(_close_open_loggers)
+
+LOG_FORMATS = ("text", "json")
+
+# JSON-lines pieces are built once per level, so each record only encodes
+# its message and metadata and concatenates strings
+_JSON_LEVEL = {level: f'","level":"{level.name}","message":' for level in LogLevel}
+_encode_json_string = json.encoder.encode_basestring_ascii  # type: ignore[attr-defined]
+
+
+# Strict JSON: non-finite floats are rejected rather than written as NaN or
+# Infinity, and circular references raise instead of recursing
+_metadata_encoder = json.JSONEncoder(
+    separators=(",", ":"), default=repr, allow_nan=False
+)
+
+
+def _encode_json_metadata(metadata: Dict[str, Any]) -> str:
+    try:
+        return _metadata_encoder.encode(metadata)
+    except ValueError:
+        return _metadata_encoder.encode(_json_safe(metadata, frozenset()))
+
+
+def _json_safe(value: Any, parents: FrozenSet[int]) -> Any:
+    # Non-finite floats and circular references become their repr
+    if isinstance(value, float) and not math.isfinite(value):
+        return repr(value)
+    if isinstance(value, (dict, list, tuple)):
+        if id(value) in parents:
+            return repr(value)
+        parents = parents | {id(value)}
+        if isinstance(value, dict):
+            return {key: _json_safe(item, parents) for key, item in value.items()}
+        return [_json_safe(item, parents) for item in value]
+    return value
+
+
+_DEBUG, _INFO, _WARN, _ERROR, _FATAL = LogLevel
+
+# Default for the metadata argument, so an omitted argument can be told apart
+# from an explicit None
+_MISSING: Any = object()
+# "%%" is a literal percent sign; anything else after "%" is a placeholder
+_PERCENT = re.compile(r"%(.)", re.DOTALL)
+
+# Cached "YYYY-mm-ddTHH:MM:SS" for the current second: (second, text)
+_timestamp_cache: Tuple[int, str] = (-1, "")
+
+
+def format_timestamp(created: float) -> str:
+    """Local ISO 8601 timestamp with microseconds; the part down to the second
+    is formatted once per second and reused"""
+    global _timestamp_cache
+    second = int(created)
+    cached_second, text = _timestamp_cache
+    if second != cached_second:
+        text = datetime.fromtimestamp(second).strftime("%Y-%m-%dT%H:%M:%S")
+        # A single tuple assignment keeps the cache consistent across threads
+        _timestamp_cache = (second, text)
+    return f"{text}.{int((created - second) * 1_000_000):06d}"
+
+
 class Logger:
+    """Leveled logger writing text or JSON lines.
+
+    Messages may use lazy ``%`` formatting: ``logger.debug("x=%s", x)`` only
+    formats the message when DEBUG is enabled. Metadata is the dict passed
+    as the second argument; any other second argument is a format argument.
+    """
+
     COLORS = {
         LogLevel.DEBUG: "\033[36m",  # Cyan
         LogLevel.INFO: "\033[32m",  # Green
@@ -30,109 +204,238 @@ class Logger:
         verbose: bool = False,
         use_colors: bool = True,
         output: TextIO = sys.stdout,
+        flush_policy: Optional[FlushPolicy] = None,
+        format: str = "text",
     ):
+        if format not in LOG_FORMATS:
+            raise ValueError(
+                f"Unknown log format: {format} (expected one of {', '.join(LOG_FORMATS)})"
+            )
+        self.format = format
         self.level = LogLevel.DEBUG if verbose else level
+        self._prefixes: Dict[LogLevel, Tuple[str, str]] = {}
         self.use_colors = use_colors and output.isatty()
         self.output = output
         self.mutex = threading.Lock()
-
-    def debug(self, message: str, metadata: Optional[Dict[str, Any]] = None) -> None:
-        self._log(LogLevel.DEBUG, message, metadata or {})
-
-    def info(self, message: str, metadata: Optional[Dict[str, Any]] = None) -> None:
-        self._log(LogLevel.INFO, message, metadata or {})
-
-    def warn(self, message: str, metadata: Optional[Dict[str, Any]] = None) -> None:
-        self._log(LogLevel.WARN, message, metadata or {})
-
-    def error(self, message: str, metadata: Optional[Dict[str, Any]] = None) -> None:
-        self._log(LogLevel.ERROR, message, metadata or {})
-
-    def fatal(self, message: str, metadata: Optional[Dict[str, Any]] = None) -> None:
-        self._log(LogLevel.FATAL, message, metadata or {})
+        self.flush_policy = flush_policy or FlushPolicy()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+        if self.flush_policy.buffers:
+            _track_buffered_logger(self)
+        if self.flush_policy.interval_ms is not None:
+            # Flush buffered output even when no further records arrive
+            threading.Thread(
+                target=_flush_periodically,
+                args=(weakref.ref(self), self.flush_policy.interval_ms / 1000),
+                daemon=True,
+            ).start()
+
+    def debug(self, message: str, metadata: Any = _MISSING, *args: Any) -> None:
+        if self.level <= _DEBUG:
+            self._log(_DEBUG, message, metadata, args)
+
+    def info(self, message: str, metadata: Any = _MISSING, *args: Any) -> None:
+        if self.level <= _INFO:
+            self._log(_INFO, message, metadata, args)
+
+    def warn(self, message: str, metadata: Any = _MISSING, *args: Any) -> None:
+        if self.level <= _WARN:
+            self._log(_WARN, message, metadata, args)
+
+    def error(self, message: str, metadata: Any = _MISSING, *args: Any) -> None:
+        if self.level <= _ERROR:
+            self._log(_ERROR, message, metadata, args)
+
+    def fatal(self, message: str, metadata: Any = _MISSING, *args: Any) -> None:
+        if self.level <= _FATAL:
+            self._log(_FATAL, message, metadata, args)
 
     def with_timing(self, message: str) -> Any:
         """Context manager for timing operations"""
-
-        class TimingContext:
-            def __init__(self, logger: "Logger", message: str) -> None:
-                self.logger = logger
-                self.message = message
-                self.start_time: Optional[float] = None
-
-            def __enter__(self) -> "TimingContext":
-                self.start_time = time.perf_counter()
-                self.logger.info(f"Starting: {self.message}")
-                return self
-
-            def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-                elapsed = time.perf_counter() - (self.start_time or 0)
-                if exc_type is None:
-                    self.logger.info(
-                        f"Completed: {self.message} ({self._format_duration(elapsed)})"
-                    )
-                else:
-                    self.logger.error(
-                        f"Failed: {self.message} ({self._format_duration(elapsed)}) - {exc_val}"
-                    )
-
-            def _format_duration(self, seconds: float) -> str:
-                if seconds < 1:
-                    return f"{round(seconds * 1000, 2)}ms"
-                elif seconds < 60:
-                    return f"{round(seconds, 2)}s"
-                else:
-                    minutes = int(seconds // 60)
-                    secs = round(seconds % 60)
-                    return f"{minutes}m {secs}s"
-
-        return TimingContext(self, message)
+        return _TimingContext(self, message)
 
     def progress(self, current: int, total: int, message: str = "Progress") -> None:
-        percentage = round(current / total * 100, 1)
-        bar_length = 30
-        filled = round(bar_length * (current / total))
-
-        bar = ("█" * filled) + ("░" * (bar_length - filled))
-
         with self.mutex:
-            self.output.write(f"\r{message}: [{bar}] {percentage}% ({current}/{total})")
-            if current >= total:
-                self.output.write("\n")
+            self.output.write(_progress_line(current, total, message))
             self.output.flush()
 
-    def _log(self, severity: LogLevel, message: str, metadata: Dict[str, Any]) -> None:
-        if severity < self.level:
-            return
+    def _log(
+        self, severity: LogLevel, message: str, metadata: Any, args: Tuple = ()
+    ) -> None:
+        # Callers have already checked the level
+        message, metadata = _apply_args(message, metadata, args)
+        formatted_message = self._format_message(
+            severity, format_timestamp(time.time()), message, metadata
+        )
 
-        timestamp = datetime.now().isoformat()
-        formatted_message = self._format_message(severity, timestamp, message, metadata)
+        with self.mutex:
+            self._write(formatted_message + "\n", severity, 1)
+
+    @property
+    def use_colors(self) -> bool:
+        return self._use_colors
+
+    @use_colors.setter
+    def use_colors(self, value: bool) -> None:
+        # Text before and after the timestamp for each level, colors included
+        self._use_colors = value
+        for level in LogLevel:
+            color, reset = (
+                (self.COLORS[level], self.COLORS["reset"]) if value else ("", "")
+            )
+            self._prefixes[level] = (f"{color}[", f"] {level.name.ljust(5)}{reset} | ")
 
+    def flush(self) -> None:
         with self.mutex:
-            self.output.write(formatted_message + "\n")
-            self.output.flush()
+            self._flush_output()
+
+    def _write(self, text: str, severity: LogLevel, records: int) -> None:
+        # Called with the mutex held; ``text`` holds ``records`` formatted records
+        self.output.write(text)
+        self._pending += records
+        if self.flush_policy.should_flush(severity, self._pending, self._last_flush):
+            self._flush_output()
+
+    def _flush_output(self) -> None:
+        self.output.flush()
+        self._pending = 0
+        self._last_flush = time.monotonic()
 
     def _format_message(
-        self, severity: LogLevel, timestamp: str, message: str, metadata: Dict[str, Any]
+        self,
+        severity: LogLevel,
+        timestamp: str,
+        message: str,
+        metadata: Optional[Dict[str, Any]],
     ) -> str:
-        severity_str = severity.name.ljust(5)
+        if self.format == "json":
+            return self._format_json(severity, timestamp, message, metadata)
 
-        if self.use_colors:
-            severity_color = self.COLORS[severity]
-            reset_color = self.COLORS["reset"]
-            formatted = (
-                f"{severity_color}[{timestamp}] {severity_str}{reset_color} | {message}"
+        opening, closing = self._prefixes[severity]
+        if metadata:
+            return (
+                f"{opening}{timestamp}{closing}{message}"
+                f" | {self._format_metadata(metadata)}"
             )
-        else:
-            formatted = f"[{timestamp}] {severity_str} | {message}"
+        return f"{opening}{timestamp}{closing}{message}"
+
+    def _format_metadata(self, metadata: Dict[str, Any]) -> str:
+        return " ".join(f"{k}={repr(v)}" for k, v in metadata.items())
 
+    def _format_json(
+        self,
+        severity: LogLevel,
+        timestamp: str,
+        message: str,
+        metadata: Optional[Dict[str, Any]],
+    ) -> str:
+        # Values json cannot encode are written as their repr
+        record = (
+            '{"timestamp":"'
+            + timestamp
+            + _JSON_LEVEL[severity]
+            + _encode_json_string(message)
+        )
         if metadata:
-            formatted += f" | {self._format_metadata(metadata)}"
+            return record + ',"metadata":' + _encode_json_metadata(metadata) + "}"
+        return record + "}"
 
-        return formatted
 
-    def _format_metadata(self, metadata: Dict[str, Any]) -> str:
-        return " ".join(f"{k}={repr(v)}" for k, v in metadata.items())
+def _progress_line(current: int, total: int, message: str) -> str:
+    percentage = round(current / total * 100, 1)
+    bar_length = 30
+    filled = round(bar_length * (current / total))
+
+    bar = ("█" * filled) + ("░" * (bar_length - filled))
+    line = f"\r{message}: [{bar}] {percentage}% ({current}/{total})"
+    return line + "\n" if current >= total else line
+
+
+class _TimingContext:
+    """Logs the start, then the duration and outcome, of a ``with`` block"""
+
+    def __init__(self, logger: Union["Logger", "MultiLogger"], message: str) -> None:
+        self.logger = logger
+        self.message = message
+        self.start_time: Optional[float] = None
+
+    def __enter__(self) -> "_TimingContext":
+        self.start_time = time.perf_counter()
+        self.logger.info(f"Starting: {self.message}")
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        elapsed = time.perf_counter() - (self.start_time or 0)
+        if exc_type is None:
+            self.logger.info(f"Completed: {self.message} ({_format_duration(elapsed)})")
+        else:
+            self.logger.error(
+                f"Failed: {self.message} ({_format_duration(elapsed)}) - {exc_val}"
+            )
+
+
+def _format_duration(seconds: float) -> str:
+    if seconds < 1:
+        return f"{round(seconds * 1000, 2)}ms"
+    elif seconds < 60:
+        return f"{round(seconds, 2)}s"
+    else:
+        minutes = int(seconds // 60)
+        secs = round(seconds % 60)
+        return f"{minutes}m {secs}s"
+
+
+def _apply_args(
+    message: str, metadata: Any, args: Tuple
+) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """Split the arguments of a level method into the formatted message and
+    its metadata.
+
+    The second argument is metadata when it is a dict (or None) and the
+    message has no placeholders, or when further format arguments follow it.
+    Otherwise it is the first format argument, as in
+    ``logger.info("x=%s", x)``. Like stdlib logging, a single dict formats
+    ``%(name)s`` placeholders. Formatting errors never propagate.
+    """
+    if metadata is _MISSING:
+        metadata = None
+    elif isinstance(metadata, dict) and not args:
+        if _has_placeholders(message):
+            args, metadata = (metadata,), None
+    elif metadata is None and not args:
+        if _has_placeholders(message):
+            args = (None,)
+    elif not isinstance(metadata, dict):
+        args, metadata = (metadata,) + args, None
+
+    if args:
+        format_args = args[0] if len(args) == 1 and isinstance(args[0], dict) else args
+        try:
+            message = message % format_args
+        except Exception as e:
+            # Arguments may be what failed, so only the template is kept
+            message = f"{message} (formatting failed: {type(e).__name__})"
+    return message, metadata
+
+
+def _has_placeholders(message: str) -> bool:
+    return any(match.group(1) != "%" for match in _PERCENT.finditer(message))
+
+
+def _flush_periodically(ref: "weakref.ref[Logger]", interval: float) -> None:
+    # Holds only a weak reference, so the thread ends with its logger
+    while True:
+        time.sleep(interval)
+        logger = ref()
+        if logger is None:
+            return
+        if logger._pending:
+            try:
+                logger.flush()
+            except (OSError, ValueError):
+                return
+        del logger
 
 
 class FileLogger(Logger):
@@ -145,33 +448,409 @@ class FileLogger(Logger):
             self.file.close()
 
 
+# Compressor name -> (file suffix, opener)
+COMPRESSORS: Dict[str, Tuple[str, Callable[..., Any]]] = {
+    "gzip": (".gz", gzip.open),
+    "lzma": (".xz", lzma.open),
+}
+
+
+class RotatingFileLogger(FileLogger):
+    """FileLogger that rotates once the file reaches ``max_bytes`` or every
+    ``interval`` seconds, keeping the newest ``backup_count`` segments.
+
+    Rotated segments are renamed to ``<filename>.<YYYYmmdd-HHMMSS-ffffff>``.
+    With ``compress`` set to ``gzip`` or ``lzma``, a background thread
+    compresses each segment and prunes old ones, so the log call that
+    triggers a rotation only pays for a rename and reopen. Size is counted in
+    characters written, which equals bytes for ASCII logs.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        max_bytes: Optional[int] = None,
+        interval: Optional[float] = None,
+        backup_count: Optional[int] = 5,
+        compress: Optional[str] = None,
+        **options: Any,
+    ) -> None:
+        if compress is not None and compress not in COMPRESSORS:
+            raise ValueError(
+                f"Unknown compression: {compress} "
+                f"(expected one of {', '.join(COMPRESSORS)})"
+            )
+        super().__init__(filename, **options)
+        self.path = Path(filename)
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.backup_count = backup_count
+        self.compress = compress
+        self._size = self.path.stat().st_size
+        self._rollover_at = time.time() + interval if interval else None
+        self._background: Optional[ThreadPoolExecutor] = None
+        self._segment_pattern = re.compile(
+            re.escape(self.path.name) + r"\.(\d{8}-\d{6}-\d{6})(\.gz|\.xz)?$"
+        )
+
+    def segments(self) -> List[Path]:
+        """Rotated segments, oldest first"""
+        matches = [
+            (match.group(1), path)
+            for path in self.path.parent.iterdir()
+            if (match := self._segment_pattern.match(path.name))
+        ]
+        return [path for _, path in sorted(matches)]
+
+    def rotate(self) -> Path:
+        with self.mutex:
+            return self._rotate()
+
+    def wait(self) -> None:
+        """Block until background compression and pruning have finished"""
+        if self._background is not None:
+            self._background.submit(lambda: None).result()
+
+    def close(self) -> None:
+        with self.mutex:
+            self.file.close()
+        if self._background is not None:
+            self._background.shutdown(wait=True)
+
+    def _write(self, text: str, severity: LogLevel, records: int) -> None:
+        # Interval rollovers happen before the write, so each segment only
+        # holds records from its own interval
+        if self._rollover_at is not None and time.time() >= self._rollover_at:
+            self._rotate()
+        super()._write(text, severity, records)
+        self._size += len(text)
+        if self.max_bytes is not None and self._size >= self.max_bytes:
+            self._rotate()
+
+    def _rotate(self) -> Path:
+        # Called with the mutex held
+        self.file.close()
+        segment = self._segment_name()
+        os.replace(self.path, segment)
+        self.file = self.output = open(self.path, "a")
+        self._size = 0
+        self._pending = 0
+        if self.interval:
+            self._rollover_at = time.time() + self.interval
+
+        if self.compress is None:
+            self._prune()
+        else:
+            if self._background is None:
+                self._background = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="log-compress"
+                )
+            future: Future = self._background.submit(self._compress, segment)
+            future.add_done_callback(lambda _: self._prune())
+        return segment
+
+    def _segment_name(self) -> Path:
+        stamp = datetime.now()
+        while True:
+            segment = self.path.with_name(
+                f"{self.path.name}.{stamp.strftime('%Y%m%d-%H%M%S-%f')}"
+            )
+            if not any(
+                segment.with_name(segment.name + suffix).exists()
+                for suffix in ("", ".gz", ".xz")
+            ):
+                return segment
+            stamp += timedelta(microseconds=1)
+
+    def _compress(self, segment: Path) -> None:
+        suffix, opener = COMPRESSORS[self.compress]  # type: ignore[index]
+        target = segment.with_name(segment.name + suffix)
+        partial = target.with_name(target.name + ".tmp")
+
+        with segment.open("rb") as source, opener(partial, "wb") as compressed:
+            shutil.copyfileobj(source, compressed, 1024 * 1024)
+        os.replace(partial, target)
+        segment.unlink()
+
+    def _prune(self) -> None:
+        if self.backup_count is None:
+            return
+        segments = self.segments()
+        for path in segments[: max(0, len(segments) - self.backup_count)]:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+# A queued log record: (severity, created, message, metadata). Progress bars
+# are queued as plain strings and written as-is.
+QueuedRecord = Tuple[LogLevel, float, str, Optional[Dict[str, Any]]]
+
+OVERFLOW_POLICIES = ("block", "drop", "sample")
+
+
+class AsyncLogger(Logger):
+    """Logger whose calls only enqueue the record; a background thread formats
+    and writes queued records in batches, flushing per the flush policy.
+
+    When the bounded queue is full, ``overflow`` decides what happens:
+    ``block`` waits for space, ``drop`` discards the record and ``sample``
+    keeps one in ``sample_every`` records and discards the rest. ERROR and
+    FATAL records always wait for space rather than being discarded. A
+    ``queue_size`` of 0 makes the queue unbounded. Call ``close`` (also run
+    at exit) to write everything still queued.
+    """
+
+    def __init__(
+        self,
+        queue_size: int = 10000,
+        overflow: str = "block",
+        sample_every: int = 100,
+        batch_size: int = 256,
+        **options: Any,
+    ) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unknown overflow policy: {overflow} "
+                f"(expected one of {', '.join(OVERFLOW_POLICIES)})"
+            )
+        super().__init__(**options)
+        self.overflow = overflow
+        self.sample_every = max(1, sample_every)
+        self.batch_size = batch_size
+        self.dropped = 0
+        self._overflowed = 0
+        self._closed = False
+        self._queue: Union["queue.Queue[Any]", "queue.SimpleQueue[Any]"] = (
+            queue.Queue(queue_size) if queue_size > 0 else queue.SimpleQueue()
+        )
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+        _open_loggers.add(self)
+
+    def flush(self) -> None:
+        """Block until every record queued so far has been written"""
+        if not self._closed:
+            written = threading.Event()
+            self._queue.put(written)
+            written.wait()
+        super().flush()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._writer.join()
+        _open_loggers.discard(self)
+        super().flush()
+
+        if self.dropped:
+            super()._log(
+                LogLevel.WARN,
+                "Async logger dropped records because its queue was full",
+                {"dropped": self.dropped},
+            )
+
+    def progress(self, current: int, total: int, message: str = "Progress") -> None:
+        self._enqueue(_progress_line(current, total, message), LogLevel.INFO)
+
+    def _log(
+        self, severity: LogLevel, message: str, metadata: Any, args: Tuple = ()
+    ) -> None:
+        if self._closed:
+            # Late records after close go straight to the output
+            super()._log(severity, message, metadata, args)
+            return
+
+        # Format arguments now, while they still hold their current values
+        message, metadata = _apply_args(message, metadata, args)
+        self._enqueue((severity, time.time(), message, metadata), severity)
+
+    def _enqueue(self, item: Union[QueuedRecord, str], severity: LogLevel) -> None:
+        if self.overflow == "block" or severity >= LogLevel.ERROR:
+            self._queue.put(item)
+            return
+
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self._overflowed += 1
+            if self.overflow == "sample" and self._overflowed % self.sample_every == 0:
+                self._queue.put(item)
+            else:
+                self.dropped += 1
+
+    def _write_loop(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            lines: List[str] = []
+            highest = LogLevel.DEBUG
+            for item in batch:
+                if item is None or isinstance(item, threading.Event):
+                    # Markers: write what came before, then signal or stop
+                    self._write_batch(lines, highest)
+                    lines, highest = [], LogLevel.DEBUG
+                    if item is None:
+                        return
+                    item.set()
+                elif isinstance(item, str):
+                    lines.append(item)
+                else:
+                    severity, created, message, metadata = item
+                    lines.append(
+                        self._format_message(
+                            severity, format_timestamp(created), message, metadata
+                        )
+                        + "\n"
+                    )
+                    highest = max(highest, severity)
+            self._write_batch(lines, highest)
+
+    def _write_batch(self, lines: List[str], highest: LogLevel) -> None:
+        if not lines:
+            return
+        with self.mutex:
+            self._write("".join(lines), highest, len(lines))
+
+
 class MultiLogger:
-    def __init__(self, *loggers: Logger) -> None:
+    """Fans each record out to several loggers ("sinks").
+
+    Every sink keeps its own level, format and output. A record is formatted
+    once per distinct format and handed to each interested sink through that
+    sink's queue, where a writer thread writes it, so a slow sink never holds
+    up the caller or the other sinks. A full queue blocks the caller. Call
+    ``flush`` to wait for queued records, and ``close`` (also run at exit) to
+    write them and stop the writer threads.
+    """
+
+    def __init__(self, *loggers: Logger, queue_size: int = 10000) -> None:
         self.loggers = loggers
+        self._writers = [_SinkWriter(logger, queue_size) for logger in loggers]
+        self._closed = False
+        _open_loggers.add(self)
 
-    def debug(self, message: str, metadata: Optional[Dict[str, Any]] = None) -> None:
-        for logger in self.loggers:
-            logger.debug(message, metadata)
+    def debug(self, message: str, metadata: Any = _MISSING, *args: Any) -> None:
+        self._log(_DEBUG, message, metadata, args)
 
-    def info(self, message: str, metadata: Optional[Dict[str, Any]] = None) -> None:
-        for logger in self.loggers:
-            logger.info(message, metadata)
+    def info(self, message: str, metadata: Any = _MISSING, *args: Any) -> None:
+        self._log(_INFO, message, metadata, args)
 
-    def warn(self, message: str, metadata: Optional[Dict[str, Any]] = None) -> None:
-        for logger in self.loggers:
-            logger.warn(message, metadata)
+    def warn(self, message: str, metadata: Any = _MISSING, *args: Any) -> None:
+        self._log(_WARN, message, metadata, args)
 
-    def error(self, message: str, metadata: Optional[Dict[str, Any]] = None) -> None:
-        for logger in self.loggers:
-            logger.error(message, metadata)
+    def error(self, message: str, metadata: Any = _MISSING, *args: Any) -> None:
+        self._log(_ERROR, message, metadata, args)
 
-    def fatal(self, message: str, metadata: Optional[Dict[str, Any]] = None) -> None:
-        for logger in self.loggers:
-            logger.fatal(message, metadata)
+    def fatal(self, message: str, metadata: Any = _MISSING, *args: Any) -> None:
+        self._log(_FATAL, message, metadata, args)
 
     def with_timing(self, message: str) -> Any:
-        return self.loggers[0].with_timing(message)
+        return _TimingContext(self, message)
 
     def progress(self, current: int, total: int, message: str = "Progress") -> None:
+        line = _progress_line(current, total, message)
+        for writer in self._writers:
+            writer.put((line, _INFO))
+
+    def flush(self) -> None:
+        """Block until every sink has written the records queued so far"""
+        if not self._closed:
+            markers = [writer.mark() for writer in self._writers]
+            for marker in markers:
+                marker.wait()
+        for logger in self.loggers:
+            logger.flush()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        for writer in self._writers:
+            writer.stop()
+        _open_loggers.discard(self)
         for logger in self.loggers:
-            logger.progress(current, total, message)
+            logger.flush()
+
+    def _log(
+        self, severity: LogLevel, message: str, metadata: Any, args: Tuple
+    ) -> None:
+        writers = [w for w in self._writers if w.logger.level <= severity]
+        if not writers:
+            return
+        if self._closed:
+            for writer in writers:
+                writer.logger._log(severity, message, metadata, args)
+            return
+
+        message, metadata = _apply_args(message, metadata, args)
+        timestamp = format_timestamp(time.time())
+        formatted: Dict[Tuple[Any, ...], str] = {}
+        for writer in writers:
+            logger = writer.logger
+            key = (type(logger), logger.format, logger.use_colors)
+            if key not in formatted:
+                formatted[key] = (
+                    logger._format_message(severity, timestamp, message, metadata)
+                    + "\n"
+                )
+            writer.put((formatted[key], severity))
+
+
+class _SinkWriter:
+    """Queue and writer thread for one MultiLogger sink"""
+
+    def __init__(self, logger: Logger, queue_size: int) -> None:
+        self.logger = logger
+        self._queue: "queue.Queue[Any]" = queue.Queue(queue_size)
+        self._thread = threading.Thread(target=self._write_loop, daemon=True)
+        self._thread.start()
+
+    def put(self, item: Tuple[str, LogLevel]) -> None:
+        self._queue.put(item)
+
+    def mark(self) -> threading.Event:
+        written = threading.Event()
+        self._queue.put(written)
+        return written
+
+    def stop(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _write_loop(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            texts: List[str] = []
+            highest = _DEBUG
+            for item in batch:
+                if item is None or isinstance(item, threading.Event):
+                    self._write(texts, highest)
+                    texts, highest = [], _DEBUG
+                    if item is None:
+                        return
+                    item.set()
+                else:
+                    texts.append(item[0])
+                    highest = max(highest, item[1])
+            self._write(texts, highest)
+
+    def _write(self, texts: List[str], highest: LogLevel) -> None:
+        if not texts:
+            return
+        with self.logger.mutex:
+            self.logger._write("".join(texts), highest, len(texts))
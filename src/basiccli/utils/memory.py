@@ -0,0 +1,39 @@
+import os
+import sys
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+
+def peak_rss_bytes() -> int:
+    """Peak resident set size of the current process in bytes (0 if unknown)"""
+    if resource is None:
+        return 0
+
+    return maxrss_to_bytes(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def current_rss_bytes() -> int:
+    """Current resident set size in bytes; falls back to the peak off Linux"""
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return peak_rss_bytes()
+
+
+def maxrss_to_bytes(maxrss: int) -> int:
+    """Convert an rusage ``ru_maxrss`` value to bytes"""
+    # Linux reports kilobytes, macOS reports bytes
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def format_bytes(size: float) -> str:
+    for unit in ["B", "KB", "MB"]:
+        if abs(size) < 1024:
+            return f"{round(size, 2)} {unit}"
+        size /= 1024
+    return f"{round(size, 2)} GB"
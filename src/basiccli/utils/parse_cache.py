@@ -0,0 +1,211 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+CACHE_KEYS = ("stat", "checksum")
+
+
+class ParseCache:
+    """Caches parsed file contents, in memory and optionally on disk.
+
+    Entries are keyed by path, format, mtime and size (``key="stat"``), or by
+    format and a SHA-256 of the content (``key="checksum"``), which also
+    survives touches and copies. The in-memory tier is an LRU limited to
+    ``max_entries`` entries and ``max_bytes`` bytes of source files. With a
+    ``directory``, parsed results are also pickled there so other processes
+    skip parsing too; only point it at a directory you trust, since loading
+    a pickle can run code. With ``key="stat"`` each file has one disk entry,
+    replaced when the file changes. The directory is pruned after every
+    write to ``max_disk_entries`` entries and ``max_disk_bytes`` bytes,
+    dropping the least recently used entries first.
+
+    Cached values are shared between callers and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        max_bytes: int = 64 * 1024 * 1024,
+        directory: Optional[Union[str, Path]] = None,
+        key: str = "stat",
+        max_disk_entries: int = 1024,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+    ) -> None:
+        if key not in CACHE_KEYS:
+            raise ValueError(
+                f"Unknown cache key: {key} (expected one of {', '.join(CACHE_KEYS)})"
+            )
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directory = Path(directory) if directory is not None else None
+        self.key = key
+        self.max_disk_entries = max_disk_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+        self._entries: "OrderedDict[Tuple, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, filepath: Path, format: str, load: Callable[[], Any]) -> Any:
+        """The cached result for ``filepath``, calling ``load`` on a miss"""
+        stat = filepath.stat()
+        cache_key = self._key(filepath, format, stat)
+
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return entry[0]
+
+        value, found = self._load_from_disk(cache_key)
+        if found:
+            with self._lock:
+                self.disk_hits += 1
+        else:
+            value = load()
+            with self._lock:
+                self.misses += 1
+            self._save_to_disk(cache_key, value)
+
+        self._remember(cache_key, value, stat.st_size)
+        return value
+
+    def clear(self, disk: bool = False) -> None:
+        """Empty the in-memory tier, and the disk tier too when ``disk``"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if disk:
+            for path, _ in self._disk_entries():
+                path.unlink(missing_ok=True)
+
+    def prune(self) -> int:
+        """Drop least recently used disk entries until the directory is within
+        ``max_disk_entries`` and ``max_disk_bytes``; returns how many went"""
+        entries = sorted(self._disk_entries(), key=lambda entry: entry[1].st_mtime)
+        count = len(entries)
+        total = sum(stat.st_size for _, stat in entries)
+
+        removed = 0
+        for path, stat in entries:
+            if count <= self.max_disk_entries and total <= self.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            count -= 1
+            total -= stat.st_size
+            removed += 1
+
+        with self._lock:
+            self.disk_evictions += removed
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "disk_evictions": self.disk_evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            }
+
+    def _key(self, filepath: Path, format: str, stat: os.stat_result) -> Tuple:
+        if self.key == "checksum":
+            hasher = hashlib.sha256()
+            with filepath.open("rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    hasher.update(chunk)
+            return (format, hasher.hexdigest())
+        return (str(filepath.resolve()), format, stat.st_mtime_ns, stat.st_size)
+
+    def _remember(self, cache_key: Tuple, value: Any, size: int) -> None:
+        if size > self.max_bytes or self.max_entries <= 0:
+            return
+
+        with self._lock:
+            if cache_key in self._entries:
+                return
+            self._entries[cache_key] = (value, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def _disk_path(self, cache_key: Tuple) -> Optional[Path]:
+        if self.directory is None:
+            return None
+        # Stat keys share one entry per path and format, so a changed file
+        # replaces its old entry; the full key is checked on load
+        slot = cache_key[:2] if self.key == "stat" else cache_key
+        digest = hashlib.sha256(repr(slot).encode()).hexdigest()
+        return self.directory / f"{digest}.pickle"
+
+    def _disk_entries(self) -> List[Tuple[Path, os.stat_result]]:
+        if self.directory is None:
+            return []
+        entries = []
+        for path in self.directory.glob("*.pickle"):
+            try:
+                entries.append((path, path.stat()))
+            except FileNotFoundError:
+                # Removed by another process meanwhile
+                pass
+        return entries
+
+    def _load_from_disk(self, cache_key: Tuple) -> Tuple[Any, bool]:
+        path = self._disk_path(cache_key)
+        if path is None:
+            return None, False
+        try:
+            with path.open("rb") as f:
+                stored_key, value = pickle.load(f)
+        except FileNotFoundError:
+            return None, False
+        except Exception:
+            # Truncated or incompatible entry: drop it and parse again
+            path.unlink(missing_ok=True)
+            return None, False
+
+        if stored_key != cache_key:
+            # An older version of the file; the next save replaces it
+            return None, False
+        try:
+            # Mark the entry as recently used for prune
+            os.utime(path)
+        except OSError:
+            pass
+        return value, True
+
+    def _save_to_disk(self, cache_key: Tuple, value: Any) -> None:
+        path = self._disk_path(cache_key)
+        if path is None:
+            return
+        # Write then rename, so readers never see a partial entry. A failed
+        # write only costs the disk tier; the parsed value is still returned.
+        temp_name = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((cache_key, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_name, path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            if temp_name is not None and os.path.exists(temp_name):
+                os.unlink(temp_name)
+            return
+        self.prune()
@@ -0,0 +1,98 @@
+import cProfile
+import io
+import pstats
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+from typing import Optional, TextIO, Tuple, Union
+
+DEFAULT_PROFILE_OUTPUT = "basiccli-profile"
+DEFAULT_SAMPLE_INTERVAL = 0.001
+
+
+class Profiler:
+    """Profiles the calling thread with cProfile while a background thread
+    samples its stack for a flamegraph.
+
+    cProfile records exact call counts and cumulative times but no full
+    stacks, so the collapsed-stack file comes from sampling instead. Only the
+    thread that called ``start`` is profiled; work done in pool workers or
+    other threads is not included.
+    """
+
+    def __init__(
+        self,
+        output: Union[str, Path] = DEFAULT_PROFILE_OUTPUT,
+        interval: float = DEFAULT_SAMPLE_INTERVAL,
+    ) -> None:
+        self.output = Path(output)
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._profile = cProfile.Profile()
+        self._stop = threading.Event()
+        self._sampler = threading.Thread(target=self._sample, daemon=True)
+        self._thread_id = 0
+
+    @property
+    def pstats_path(self) -> Path:
+        return self.output.with_name(self.output.name + ".pstats")
+
+    @property
+    def collapsed_path(self) -> Path:
+        return self.output.with_name(self.output.name + ".collapsed")
+
+    def start(self) -> None:
+        self._thread_id = threading.get_ident()
+        self._sampler.start()
+        self._profile.enable()
+
+    def stop(self) -> None:
+        self._profile.disable()
+        self._stop.set()
+        self._sampler.join()
+
+    def write(self) -> Tuple[Path, Path]:
+        self.output.parent.mkdir(parents=True, exist_ok=True)
+        self._profile.dump_stats(str(self.pstats_path))
+
+        with self.collapsed_path.open("w") as f:
+            for stack, count in sorted(self.stacks.items()):
+                f.write(f"{stack} {count}\n")
+
+        return self.pstats_path, self.collapsed_path
+
+    def summary(self, limit: int = 15) -> str:
+        """Top functions by cumulative time, as printed by pstats"""
+        stream = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=stream)
+        stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+        return stream.getvalue()
+
+    def finish(self, stream: Optional[TextIO] = None, limit: int = 15) -> None:
+        """Stop, write both files and print the summary (to stderr by default)"""
+        stream = stream or sys.stderr
+        self.stop()
+        pstats_path, collapsed_path = self.write()
+
+        stream.write(self.summary(limit))
+        stream.write(f"Profile written to {pstats_path} and {collapsed_path}\n")
+        stream.flush()
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is not None:
+                self.stacks[_collapse(frame)] += 1
+
+
+def _collapse(frame: Optional[FrameType]) -> str:
+    # Collapsed-stack format: root first, frames joined by ";"
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        module = frame.f_globals.get("__name__", Path(code.co_filename).stem)
+        names.append(f"{module}:{code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
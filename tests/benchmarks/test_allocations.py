@@ -0,0 +1,79 @@
+import sys
+import tracemalloc
+
+sys.path.insert(0, "src")
+
+from basiccli.benchmarks.allocations import (  # noqa: E402
+    run_with_memory,
+    trace_allocations,
+)
+from basiccli.benchmarks.harness import BenchmarkHarness  # noqa: E402
+
+KEPT = []
+
+
+def allocate_transient(iterations):
+    for _ in range(iterations):
+        data = bytearray(256 * 1024)
+        del data
+
+
+def allocate_kept(iterations):
+    for _ in range(iterations):
+        KEPT.append([object() for _ in range(10)])
+
+
+class TestTraceAllocations:
+    def test_peak_reflects_transient_allocations(self):
+        memory = trace_allocations(allocate_transient, 5)
+
+        assert memory["peak_traced"] >= 256 * 1024
+        assert memory["top_allocations"] == []
+
+    def test_retained_blocks_counts_surviving_objects(self):
+        KEPT.clear()
+        memory = trace_allocations(allocate_kept, 50)
+
+        assert memory["retained_blocks"] >= 500
+        KEPT.clear()
+
+    def test_retained_blocks_ignores_freed_allocations(self):
+        memory = trace_allocations(allocate_transient, 5)
+
+        assert memory["retained_blocks"] < 50
+
+    def test_top_allocations_name_source_lines(self):
+        KEPT.clear()
+        memory = trace_allocations(allocate_kept, 50, top=2)
+
+        top = memory["top_allocations"]
+        assert 1 <= len(top) <= 2
+        assert top[0]["location"].startswith(__file__)
+        assert top[0]["size"] > 0
+        assert top[0]["count"] > 0
+        KEPT.clear()
+
+    def test_stops_tracing_it_started(self):
+        trace_allocations(allocate_transient, 1)
+
+        assert tracemalloc.is_tracing() is False
+
+    def test_leaves_existing_tracing_running(self):
+        tracemalloc.start()
+        try:
+            trace_allocations(allocate_transient, 1)
+            assert tracemalloc.is_tracing() is True
+        finally:
+            tracemalloc.stop()
+
+
+class TestRunWithMemory:
+    def test_attaches_memory_section(self):
+        harness = BenchmarkHarness(iterations=2, rounds=2, warmup=0)
+        result = run_with_memory(harness, "Transient", allocate_transient)
+
+        memory = result["memory"]
+        assert result["name"] == "Transient"
+        assert len(memory["gc_collections"]) == 3
+        assert isinstance(memory["rss_delta"], int)
+        assert memory["peak_traced"] > 0
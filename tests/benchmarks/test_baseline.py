@@ -0,0 +1,109 @@
+import sys
+
+sys.path.insert(0, "src")
+
+import pytest  # noqa: E402
+
+from basiccli.benchmarks.baseline import (  # noqa: E402
+    BaselineError,
+    BaselineStore,
+    compare_results,
+)
+
+
+def make_result(name, samples):
+    return {
+        "name": name,
+        "iterations": 100,
+        "avg_time": sum(samples) / len(samples),
+        "samples": samples,
+    }
+
+
+class TestBaselineStore:
+    @pytest.fixture
+    def store(self, tmp_path):
+        return BaselineStore(tmp_path / "nested" / "baselines.json")
+
+    def test_save_and_load_roundtrip(self, store):
+        results = {"work": make_result("Work", [1.0, 1.1, 0.9])}
+        store.save("main", results)
+
+        loaded = store.load("main")
+        assert loaded["work"]["samples"] == [1.0, 1.1, 0.9]
+        assert loaded["work"]["name"] == "Work"
+
+    def test_keeps_multiple_named_baselines(self, store):
+        store.save("main", {"work": make_result("Work", [1.0, 1.0])})
+        store.save("feature", {"work": make_result("Work", [2.0, 2.0])})
+
+        assert store.names() == ["feature", "main"]
+        assert store.load("main")["work"]["samples"] == [1.0, 1.0]
+
+    def test_unknown_baseline_lists_available(self, store):
+        store.save("main", {"work": make_result("Work", [1.0, 1.0])})
+
+        with pytest.raises(BaselineError, match="available: main"):
+            store.load("missing")
+
+    def test_missing_file_has_no_baselines(self, store):
+        assert store.names() == []
+
+    def test_corrupt_file_raises_error(self, store):
+        store.path.parent.mkdir(parents=True)
+        store.path.write_text("{not json")
+
+        with pytest.raises(BaselineError, match="Corrupt"):
+            store.load("main")
+
+
+class TestCompareResults:
+    baseline = {"work": make_result("Work", [1.0, 1.02, 0.98, 1.01, 0.99])}
+
+    def test_significant_slowdown_is_regression(self):
+        current = {"work": make_result("Work", [1.5, 1.52, 1.48, 1.51, 1.49])}
+
+        (comparison,) = compare_results(self.baseline, current)
+        assert comparison.status == "regression"
+        assert comparison.is_regression
+        assert comparison.change == pytest.approx(0.5)
+
+    def test_significant_speedup_is_improvement(self):
+        current = {"work": make_result("Work", [0.5, 0.52, 0.48, 0.51, 0.49])}
+
+        (comparison,) = compare_results(self.baseline, current)
+        assert comparison.status == "improvement"
+        assert not comparison.is_regression
+
+    def test_small_change_is_unchanged(self):
+        current = {"work": make_result("Work", [1.05, 1.06, 1.04, 1.05, 1.05])}
+
+        (comparison,) = compare_results(self.baseline, current)
+        assert comparison.status == "unchanged"
+
+    def test_large_but_noisy_change_is_noise(self):
+        current = {"work": make_result("Work", [0.5, 3.0, 0.6, 2.5, 1.0])}
+
+        (comparison,) = compare_results(self.baseline, current)
+        assert comparison.status == "noise"
+
+    def test_single_round_slowdown_is_regression_without_test(self):
+        baseline = {"work": make_result("Work", [1.0])}
+        current = {"work": make_result("Work", [1.5])}
+
+        (comparison,) = compare_results(baseline, current)
+        assert comparison.status == "regression"
+        assert comparison.p_value is None
+        assert not comparison.tested
+
+    def test_too_few_rounds_on_one_side_skips_test(self):
+        current = {"work": make_result("Work", [1.05, 1.06])}
+
+        (comparison,) = compare_results(self.baseline, current)
+        assert comparison.status == "unchanged"
+        assert comparison.p_value is None
+
+    def test_skips_benchmarks_missing_from_baseline(self):
+        current = {"other": make_result("Other", [1.0, 1.0])}
+
+        assert compare_results(self.baseline, current) == []
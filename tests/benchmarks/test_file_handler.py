@@ -0,0 +1,99 @@
+import sys
+
+sys.path.insert(0, "src")
+
+import pytest  # noqa: E402
+
+from basiccli.benchmarks import file_handler  # noqa: E402
+from basiccli.benchmarks.harness import BenchmarkHarness  # noqa: E402
+from basiccli.benchmarks.registry import registry  # noqa: E402
+from basiccli.utils.file_handler import FileHandler  # noqa: E402
+
+SMALL_SIZE = 4 * 1024
+
+
+class TestFileHandlerBenchmarks:
+    @pytest.fixture(autouse=True)
+    def load(self):
+        registry.load_plugins()
+
+    def specs(self):
+        return registry.select(tags=["file_handler"])
+
+    def test_registers_every_operation_and_format(self):
+        keys = {spec.key for spec in self.specs()}
+
+        for format in file_handler.FORMATS:
+            assert f"file_handler.read.{format}" in keys
+            assert f"file_handler.write.{format}" in keys
+            assert f"file_handler.atomic_write.{format}" in keys
+        assert {"file_handler.checksum", "file_handler.copy"} <= keys
+
+    def test_opt_in_and_sizeable(self):
+        default_keys = {spec.key for spec in registry.select()}
+
+        for spec in self.specs():
+            assert spec.opt_in is True
+            assert spec.default_size == file_handler.DEFAULT_SIZE
+            assert spec.key not in default_keys
+
+    @pytest.mark.skipif(
+        not file_handler.COLD_CACHE_SUPPORTED, reason="requires posix_fadvise"
+    )
+    def test_cold_variants_tagged(self):
+        cold = registry.select(tags=["cold"])
+
+        assert "file_handler.read.json.cold" in [spec.key for spec in cold]
+        assert all("file_handler" in spec.tags for spec in cold)
+
+    @pytest.mark.parametrize("format", ["json", "yaml", "csv", "bytes"])
+    def test_fixture_close_to_requested_size(self, tmp_path, format):
+        path = tmp_path / f"fixture.{format}"
+
+        nbytes = file_handler.write_fixture(path, SMALL_SIZE, format)
+
+        assert nbytes == path.stat().st_size
+        assert SMALL_SIZE / 2 <= nbytes <= SMALL_SIZE * 2
+
+    def test_fixture_is_readable(self, tmp_path):
+        path = tmp_path / "fixture.json"
+        file_handler.write_fixture(path, SMALL_SIZE, "json")
+
+        records = FileHandler.read(path)
+
+        assert records == file_handler.make_records(SMALL_SIZE)
+
+    @pytest.mark.parametrize("format", ["json", "yaml", "csv"])
+    def test_streamed_fixture_matches_write(self, tmp_path, format):
+        streamed = tmp_path / f"streamed.{format}"
+        written = tmp_path / f"written.{format}"
+
+        file_handler.write_fixture(streamed, SMALL_SIZE, format)
+        FileHandler.write(
+            written, file_handler.make_records(SMALL_SIZE, format), format=format
+        )
+
+        assert streamed.read_bytes() == written.read_bytes()
+
+    def test_structured_sizes_are_capped(self):
+        spec = registry.get("file_handler.read.json")
+
+        with pytest.raises(ValueError, match="limited to"):
+            with spec.open(file_handler.MAX_STRUCTURED_SIZE + 1):
+                pass
+
+    def test_only_structured_benchmarks_have_a_max_size(self):
+        for spec in self.specs():
+            structured = set(spec.tags) & set(file_handler.FORMATS)
+            expected = file_handler.MAX_STRUCTURED_SIZE if structured else None
+            assert spec.max_size == expected, spec.key
+
+    def test_every_benchmark_reports_throughput(self):
+        harness = BenchmarkHarness(iterations=2, rounds=1, warmup=0)
+
+        for spec in self.specs():
+            with spec.open(SMALL_SIZE) as workload:
+                result = harness.run(spec.name, workload)
+
+            assert result["bytes_per_op"] > 0
+            assert result["mb_per_sec"] > 0
@@ -0,0 +1,84 @@
+import sys
+
+sys.path.insert(0, "src")
+
+from basiccli.benchmarks.harness import (  # noqa: E402
+    BenchmarkHarness,
+    with_bytes_per_op,
+)
+
+
+class FakeTimer:
+    """Advances one second per operation run by the workload"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def workload(self, iterations):
+        self.now += iterations
+
+
+class TestBenchmarkHarness:
+    def test_runs_warmup_and_measured_rounds(self):
+        calls = []
+        harness = BenchmarkHarness(iterations=10, rounds=3, warmup=2)
+
+        harness.run("Recorder", calls.append)
+
+        assert calls == [10] * 5
+
+    def test_reports_statistics(self):
+        timer = FakeTimer()
+        harness = BenchmarkHarness(iterations=4, rounds=3, warmup=0, timer=timer)
+
+        result = harness.run("Fake", timer.workload)
+
+        assert result["name"] == "Fake"
+        assert result["iterations"] == 4
+        assert result["rounds"] == 3
+        assert result["samples"] == [1.0, 1.0, 1.0]
+        assert result["total_time"] == 12.0
+        assert result["avg_time"] == 1.0
+        assert result["median_time"] == 1.0
+        assert result["p99_time"] == 1.0
+        assert result["stddev_time"] == 0.0
+        assert result["ops_per_sec"] == 1.0
+
+    def test_calibrates_to_target_time(self):
+        timer = FakeTimer()
+        harness = BenchmarkHarness(
+            iterations=1, rounds=2, warmup=0, target_time=100.0, timer=timer
+        )
+
+        iterations = harness.calibrate(timer.workload)
+
+        # Each round must take at least target_time / rounds = 50 fake seconds
+        assert iterations >= 50
+        assert iterations < 500
+
+    def test_calibration_overrides_iterations(self):
+        timer = FakeTimer()
+        harness = BenchmarkHarness(
+            iterations=1, rounds=1, warmup=0, target_time=20.0, timer=timer
+        )
+
+        result = harness.run("Calibrated", timer.workload)
+
+        assert result["iterations"] >= 20
+
+    def test_reports_throughput_for_byte_workloads(self):
+        timer = FakeTimer()
+        harness = BenchmarkHarness(iterations=4, rounds=2, warmup=0, timer=timer)
+
+        result = harness.run("Bytes", with_bytes_per_op(timer.workload, 2_000_000))
+
+        assert result["bytes_per_op"] == 2_000_000
+        assert result["mb_per_sec"] == 2.0
+
+    def test_no_throughput_without_byte_count(self):
+        result = BenchmarkHarness(iterations=1, rounds=1).run("Plain", lambda n: None)
+
+        assert "mb_per_sec" not in result
@@ -0,0 +1,110 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, "src")
+
+import pytest  # noqa: E402
+
+from basiccli.benchmarks.implementations import (  # noqa: E402
+    CliCase,
+    ImplementationComparison,
+    normalize_output,
+    outputs_match,
+    run_once,
+)
+
+PYTHON_CLI = [sys.executable, "-m", "basiccli.cli"]
+
+
+@pytest.fixture
+def cli_env(monkeypatch):
+    monkeypatch.setenv("PYTHONPATH", str(Path("src").resolve()))
+
+
+class TestRunOnce:
+    def test_captures_output_and_exit_code(self):
+        result = run_once(
+            [sys.executable, "-c", "import sys; print('out'); sys.exit(3)"]
+        )
+
+        assert result.returncode == 3
+        assert result.stdout == "out\n"
+        assert result.wall_time > 0
+
+    def test_reports_child_peak_memory(self):
+        small = run_once([sys.executable, "-c", "pass"])
+        large = run_once([sys.executable, "-c", "x = bytearray(64 * 1024 * 1024)"])
+
+        assert small.max_rss > 0
+        assert large.max_rss > small.max_rss + 32 * 1024 * 1024
+
+
+class TestNormalizeOutput:
+    def test_strips_log_timestamps(self):
+        python = "[2025-01-15 10:00:00] INFO  | Processing file: a.json\n{}\n"
+        rust = "[2025-01-15T10:00:01.123] INFO  | Processing file: a.json\n{}"
+
+        assert normalize_output(python) == normalize_output(rust)
+
+    def test_keeps_content_differences(self):
+        assert normalize_output('{"a": 1}') != normalize_output('{"a":1}')
+
+
+class TestOutputsMatch:
+    def test_ignores_json_key_order(self):
+        python = '[2025-01-15] INFO  | Parsed\n{\n  "users": [],\n  "metadata": {}\n}\n'
+        rust = '[2025-01-15T10:00] INFO  | Parsed\n{"metadata": {}, "users": []}'
+
+        assert outputs_match(python, rust)
+
+    def test_detects_json_value_differences(self):
+        assert not outputs_match('{"a": 1, "b": 2}', '{"b": 2, "a": 3}')
+
+    def test_detects_log_line_differences(self):
+        assert not outputs_match("INFO  | One\n{}", "INFO  | Two\n{}")
+
+    def test_plain_text_compared_as_text(self):
+        assert outputs_match("Hello, World!\n", "Hello, World!")
+        assert not outputs_match("Hello, World!", "Hello, Other!")
+
+
+class TestImplementationComparison:
+    def test_missing_implementation_raises_error(self):
+        comparison = ImplementationComparison(rust_command=["/nonexistent/basiccli"])
+
+        with pytest.raises(FileNotFoundError, match="cargo build --release"):
+            comparison.check_available()
+
+    def test_identical_implementations_have_parity(self, cli_env):
+        comparison = ImplementationComparison(
+            python_command=PYTHON_CLI, rust_command=PYTHON_CLI, repeats=1
+        )
+
+        (case,) = comparison.compare_cases([CliCase("hello", ["hello", "Test"])])
+
+        assert case.parity is True
+        assert case.python["cold_start"] > 0
+        assert case.rust["max_rss"] > 0
+
+    def test_differing_output_breaks_parity(self, cli_env):
+        comparison = ImplementationComparison(
+            python_command=PYTHON_CLI,
+            rust_command=[sys.executable, "-c", "print('Hello, Other!')"],
+            repeats=1,
+        )
+
+        (case,) = comparison.compare_cases([CliCase("hello", ["hello", "Test"])])
+        assert case.parity is False
+
+    def test_workloads_matched_by_name(self, cli_env):
+        comparison = ImplementationComparison(
+            python_command=PYTHON_CLI, rust_command=PYTHON_CLI, iterations=5
+        )
+
+        workloads = comparison.compare_workloads()
+
+        assert [w.name for w in workloads][:2] == [
+            "String Manipulation",
+            "List Operations",
+        ]
+        assert all(w.speedup > 0 for w in workloads)
@@ -0,0 +1,86 @@
+import os
+import sys
+
+sys.path.insert(0, "src")
+
+import pytest  # noqa: E402
+
+from basiccli.benchmarks.isolation import IsolatedRunner  # noqa: E402
+from basiccli.benchmarks.registry import registry  # noqa: E402
+
+HARNESS = {"iterations": 5, "rounds": 2, "warmup": 0}
+
+PID_BENCHMARKS = """
+import os
+from pathlib import Path
+
+from basiccli.benchmarks.registry import benchmark
+
+
+@benchmark("record_pid_a", tags=["pid"])
+def record_pid_a():
+    Path("pids").mkdir(exist_ok=True)
+    Path("pids", "a").write_text(str(os.getpid()))
+    return lambda iterations: None
+
+
+@benchmark("record_pid_b", tags=["pid"])
+def record_pid_b():
+    Path("pids").mkdir(exist_ok=True)
+    Path("pids", "b").write_text(str(os.getpid()))
+    print("workload output must not corrupt the result")
+    return lambda iterations: None
+"""
+
+
+class TestIsolatedRunner:
+    @pytest.fixture
+    def specs(self):
+        registry.load_plugins()
+        return registry.select(only=["string_manipulation", "dict_operations"])
+
+    def test_runs_benchmark_in_subprocess(self):
+        result = IsolatedRunner(harness=HARNESS).run_one("list_operations")
+
+        assert result["name"] == "List Operations"
+        assert result["iterations"] == 5
+        assert len(result["samples"]) == 2
+
+    def test_parallel_jobs_keep_spec_order(self, specs):
+        results = IsolatedRunner(harness=HARNESS, jobs=2).run(specs)
+
+        assert list(results) == ["string_manipulation", "dict_operations"]
+        assert results["dict_operations"]["name"] == "Dict Operations"
+
+    def test_each_benchmark_gets_fresh_process(self, tmp_path, monkeypatch):
+        (tmp_path / "pid_benchmarks.py").write_text(PID_BENCHMARKS)
+        monkeypatch.chdir(tmp_path)
+        runner = IsolatedRunner(harness=HARNESS, modules=["pid_benchmarks"])
+
+        runner.run_one("record_pid_a")
+        runner.run_one("record_pid_b")
+
+        pids = {(tmp_path / "pids" / name).read_text() for name in ["a", "b"]}
+        assert len(pids) == 2
+        assert str(os.getpid()) not in pids
+
+    def test_unknown_benchmark_raises_error(self):
+        with pytest.raises(RuntimeError, match="Unknown benchmark: missing"):
+            IsolatedRunner(harness=HARNESS).run_one("missing")
+
+    @pytest.mark.skipif(
+        not hasattr(os, "sched_setaffinity"), reason="CPU pinning needs Linux"
+    )
+    def test_pins_jobs_to_cpus(self, specs):
+        results = IsolatedRunner(harness=HARNESS, pin_cpus=True).run(specs)
+
+        assert len(results) == 2
+
+    @pytest.mark.skipif(
+        not hasattr(os, "sched_setaffinity"), reason="CPU pinning needs Linux"
+    )
+    def test_pinning_more_jobs_than_cpus_raises_error(self, specs):
+        jobs = len(os.sched_getaffinity(0)) + 1
+
+        with pytest.raises(ValueError, match="Cannot pin"):
+            IsolatedRunner(harness=HARNESS, jobs=jobs, pin_cpus=True).run(specs)
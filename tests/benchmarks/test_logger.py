@@ -0,0 +1,33 @@
+import sys
+
+sys.path.insert(0, "src")
+
+from basiccli.benchmarks import logger  # noqa: E402
+from basiccli.benchmarks.harness import BenchmarkHarness  # noqa: E402
+from basiccli.benchmarks.registry import registry  # noqa: E402
+
+
+class TestLoggerBenchmarks:
+    def test_registers_opt_in_benchmarks(self):
+        registry.load_plugins()
+        specs = registry.select(tags=["logging"])
+
+        assert [spec.key for spec in specs] == [
+            f"logger.flush.{key}" for key in logger.FLUSH_POLICIES
+        ] + [
+            "logger.format.text",
+            "logger.format.json",
+            "logger.call.disabled",
+            "logger.call.enabled",
+        ]
+        assert all(spec.opt_in for spec in specs)
+
+    def test_benchmarks_log_records(self):
+        registry.load_plugins()
+        harness = BenchmarkHarness(iterations=50, rounds=1, warmup=0)
+
+        for spec in registry.select(tags=["logging"]):
+            with spec.open() as workload:
+                result = harness.run(spec.name, workload)
+
+            assert result["ops_per_sec"] > 0
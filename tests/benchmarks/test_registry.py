@@ -0,0 +1,110 @@
+import sys
+
+sys.path.insert(0, "src")
+
+import pytest  # noqa: E402
+
+from basiccli.benchmarks.registry import BenchmarkRegistry  # noqa: E402
+
+
+class TestBenchmarkRegistry:
+    @pytest.fixture
+    def registry(self):
+        registry = BenchmarkRegistry()
+
+        @registry.register("read_small", tags=["io"])
+        def read_small():
+            return lambda iterations: None
+
+        @registry.register("read_large", "Large Reads", tags=["io", "slow"])
+        def read_large():
+            return lambda iterations: None
+
+        @registry.register("parse", tags=["cpu"])
+        def parse():
+            return lambda iterations: None
+
+        return registry
+
+    def keys(self, specs):
+        return [spec.key for spec in specs]
+
+    def test_keeps_registration_order(self, registry):
+        assert self.keys(registry.all()) == ["read_small", "read_large", "parse"]
+
+    def test_default_name_from_key(self, registry):
+        assert registry.get("read_small").name == "Read Small"
+        assert registry.get("read_large").name == "Large Reads"
+
+    def test_duplicate_key_raises_error(self, registry):
+        with pytest.raises(ValueError, match="already registered"):
+            registry.register("parse")(lambda: None)
+
+    def test_unknown_key_raises_error(self, registry):
+        with pytest.raises(KeyError):
+            registry.get("missing")
+
+    def test_select_only_glob(self, registry):
+        assert self.keys(registry.select(only=["read_*"])) == [
+            "read_small",
+            "read_large",
+        ]
+
+    def test_select_exclude_glob(self, registry):
+        assert self.keys(registry.select(exclude=["*_large"])) == [
+            "read_small",
+            "parse",
+        ]
+
+    def test_select_by_tag(self, registry):
+        assert self.keys(registry.select(tags=["slow", "cpu"])) == [
+            "read_large",
+            "parse",
+        ]
+
+    def test_select_without_filters_returns_all(self, registry):
+        assert self.keys(registry.select()) == self.keys(registry.all())
+
+    def test_generator_setup_runs_teardown(self):
+        registry = BenchmarkRegistry()
+        events = []
+
+        @registry.register("with_fixture")
+        def with_fixture():
+            events.append("setup")
+            yield lambda iterations: events.append(iterations)
+            events.append("teardown")
+
+        with registry.get("with_fixture").open() as workload:
+            workload(3)
+
+        assert events == ["setup", 3, "teardown"]
+
+    def test_load_plugins_imports_modules(self, tmp_path, monkeypatch):
+        (tmp_path / "extra_benchmarks.py").write_text("LOADED = True\n")
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(sys, "path", list(sys.path))
+        monkeypatch.delitem(sys.modules, "extra_benchmarks", raising=False)
+
+        BenchmarkRegistry().load_plugins(["extra_benchmarks"])
+
+        assert sys.modules["extra_benchmarks"].LOADED is True
+        del sys.modules["extra_benchmarks"]
+
+    def test_sizeable_setup_receives_size(self):
+        registry = BenchmarkRegistry()
+        sizes = []
+
+        @registry.register("sized", default_size=100)
+        def sized(size):
+            sizes.append(size)
+            return lambda iterations: None
+
+        spec = registry.get("sized")
+        with spec.open():
+            pass
+        with spec.open(400):
+            pass
+
+        assert spec.sizeable is True
+        assert sizes == [100, 400]
@@ -0,0 +1,91 @@
+import sys
+
+sys.path.insert(0, "src")
+
+import pytest  # noqa: E402
+
+from basiccli.benchmarks.stats import (  # noqa: E402
+    fit_power_law,
+    mean,
+    percentile,
+    stddev,
+    student_t_sf2,
+    summarize,
+    welch_t_test,
+)
+
+
+class TestStats:
+    def test_percentile_interpolates(self):
+        samples = [1.0, 2.0, 3.0, 4.0]
+
+        assert percentile(samples, 0) == 1.0
+        assert percentile(samples, 50) == 2.5
+        assert percentile(samples, 100) == 4.0
+        assert percentile(samples, 95) == pytest.approx(3.85)
+
+    def test_percentile_ignores_input_order(self):
+        assert percentile([5.0, 1.0, 3.0], 50) == 3.0
+
+    def test_percentile_empty_raises_error(self):
+        with pytest.raises(ValueError):
+            percentile([], 50)
+
+    def test_mean_and_stddev(self):
+        samples = [2.0, 4.0, 4.0, 4.0, 5.0, 5.0, 7.0, 9.0]
+
+        assert mean(samples) == 5.0
+        assert stddev(samples) == pytest.approx(2.138, rel=1e-3)
+
+    def test_stddev_single_sample(self):
+        assert stddev([1.0]) == 0.0
+
+    def test_summarize_keys(self):
+        summary = summarize([1.0, 2.0, 3.0])
+
+        assert summary["min"] == 1.0
+        assert summary["max"] == 3.0
+        assert summary["median"] == 2.0
+        assert set(summary) == {"mean", "min", "max", "median", "p95", "p99", "stddev"}
+
+    def test_student_t_tail_probability(self):
+        assert student_t_sf2(0.0, 10) == pytest.approx(1.0)
+        assert student_t_sf2(2.0, 10) == pytest.approx(0.0734, abs=1e-4)
+        assert student_t_sf2(-2.0, 10) == student_t_sf2(2.0, 10)
+
+    def test_welch_t_test_overlapping_samples(self):
+        t, p = welch_t_test([1.0, 2.0, 3.0, 4.0], [2.0, 3.0, 4.0, 5.0])
+
+        assert t == pytest.approx(1.095, rel=1e-3)
+        assert p == pytest.approx(0.3153, abs=1e-3)
+
+    def test_welch_t_test_separated_samples(self):
+        _, p = welch_t_test([1.0, 1.1, 0.9, 1.0], [2.0, 2.1, 1.9, 2.0])
+
+        assert p < 0.001
+
+    def test_welch_t_test_degenerate_samples(self):
+        assert welch_t_test([1.0], [2.0, 3.0]) == (0.0, 1.0)
+        assert welch_t_test([1.0, 1.0], [1.0, 1.0]) == (0.0, 1.0)
+        assert welch_t_test([1.0, 1.0], [2.0, 2.0])[1] == 0.0
+
+    def test_fit_power_law_exact(self):
+        sizes = [10, 100, 1000]
+        exponent, coefficient, r_squared = fit_power_law(
+            sizes, [3 * n**2 for n in sizes]
+        )
+
+        assert exponent == pytest.approx(2.0)
+        assert coefficient == pytest.approx(3.0)
+        assert r_squared == pytest.approx(1.0)
+
+    def test_fit_power_law_skips_non_positive_values(self):
+        exponent, _, _ = fit_power_law([1, 10, 100], [0.0, 10.0, 100.0])
+
+        assert exponent == pytest.approx(1.0)
+
+    def test_fit_power_law_needs_two_sizes(self):
+        with pytest.raises(ValueError):
+            fit_power_law([10, 10], [1.0, 2.0])
+        with pytest.raises(ValueError):
+            fit_power_law([10], [1.0])
@@ -0,0 +1,99 @@
+import sys
+
+sys.path.insert(0, "src")
+
+import pytest  # noqa: E402
+
+from basiccli.benchmarks.harness import BenchmarkHarness  # noqa: E402
+from basiccli.benchmarks.registry import BenchmarkRegistry  # noqa: E402
+from basiccli.benchmarks.sweep import (  # noqa: E402
+    describe_exponent,
+    run_sweep,
+    sweep_sizes,
+)
+
+
+class ScalingTimer:
+    """Fake clock where one operation on size n takes n ** exponent seconds"""
+
+    def __init__(self, exponent):
+        self.exponent = exponent
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def setup(self, size):
+        def workload(iterations):
+            self.now += iterations * size**self.exponent
+
+        return workload
+
+
+def make_spec(timer, default_size=10, max_size=None):
+    registry = BenchmarkRegistry()
+    registry.register("scaling", default_size=default_size, max_size=max_size)(
+        timer.setup
+    )
+    return registry.get("scaling")
+
+
+class TestSweepSizes:
+    def test_geometric_sizes(self):
+        assert sweep_sizes(10, 4, 2) == [10, 20, 40, 80]
+
+    def test_drops_repeated_sizes(self):
+        assert sweep_sizes(1, 4, 1.2) == [1, 2]
+
+
+class TestRunSweep:
+    @pytest.mark.parametrize("exponent", [1.0, 2.0])
+    def test_recovers_exponent(self, exponent):
+        timer = ScalingTimer(exponent)
+        harness = BenchmarkHarness(iterations=100, rounds=2, warmup=0, timer=timer)
+
+        sweep = run_sweep(make_spec(timer), harness, [10, 40, 160])
+
+        assert sweep["time_exponent"] == pytest.approx(exponent)
+        assert sweep["time_r_squared"] == pytest.approx(1.0)
+        assert sweep["superlinear"] is (exponent > 1.2)
+
+    def test_scales_iterations_down_with_size(self):
+        timer = ScalingTimer(1.0)
+        harness = BenchmarkHarness(iterations=100, rounds=1, warmup=0, timer=timer)
+
+        sweep = run_sweep(make_spec(timer), harness, [10, 100, 10000])
+
+        assert [p["iterations"] for p in sweep["points"]] == [100, 10, 1]
+        assert [p["median_time"] for p in sweep["points"]] == [10, 100, 10000]
+
+    def test_skips_sizes_above_max_size(self):
+        timer = ScalingTimer(1.0)
+        harness = BenchmarkHarness(iterations=10, rounds=1, warmup=0, timer=timer)
+
+        sweep = run_sweep(make_spec(timer, max_size=100), harness, [10, 100, 1000])
+
+        assert [p["size"] for p in sweep["points"]] == [10, 100]
+        assert sweep["skipped_sizes"] == [1000]
+        assert sweep["time_exponent"] == pytest.approx(1.0)
+
+    def test_records_peak_memory_per_size(self):
+        registry = BenchmarkRegistry()
+
+        @registry.register("alloc", default_size=1000)
+        def alloc(size):
+            return lambda iterations: [bytearray(size) for _ in range(iterations)]
+
+        harness = BenchmarkHarness(iterations=1, rounds=1, warmup=0)
+        sweep = run_sweep(registry.get("alloc"), harness, [100_000, 1_000_000])
+
+        small, large = sweep["points"]
+        assert large["peak_memory"] > small["peak_memory"] >= 100_000
+        assert sweep["memory_exponent"] == pytest.approx(1.0, abs=0.1)
+
+
+class TestDescribeExponent:
+    def test_labels(self):
+        assert describe_exponent(None) == "n/a"
+        assert describe_exponent(0.05).startswith("~O(1)")
+        assert describe_exponent(1.98) == "~O(n^1.98)"
@@ -1,10 +1,14 @@
 import json
 import sys
+from pathlib import Path
 
 sys.path.insert(0, "src")
 
 import pytest  # noqa: E402
 
+from basiccli.benchmarks.baseline import BaselineStore  # noqa: E402
+from basiccli.benchmarks.implementations import ImplementationComparison  # noqa: E402
+from basiccli.benchmarks.registry import registry  # noqa: E402
 from basiccli.commands.benchmark import BenchmarkCommand  # noqa: E402
 
 
@@ -87,6 +91,46 @@ class TestBenchmarkCommand:
             assert "avg_time_ms" in benchmark
             assert "ops_per_second" in benchmark
 
+    def test_json_includes_round_statistics(self, iterations, capsys):
+        command = BenchmarkCommand(iterations, output_format="json", rounds=3)
+        command.execute()
+
+        captured = capsys.readouterr()
+        for benchmark in json.loads(captured.out)["benchmarks"]:
+            assert benchmark["rounds"] == 3
+            assert benchmark["min_time_ms"] <= benchmark["median_time_ms"]
+            assert benchmark["median_time_ms"] <= benchmark["p95_time_ms"]
+            assert benchmark["p95_time_ms"] <= benchmark["p99_time_ms"]
+            assert "stddev_time_ms" in benchmark
+
+    def test_console_shows_round_statistics(self, iterations, capsys):
+        command = BenchmarkCommand(iterations)
+        command.execute()
+
+        captured = capsys.readouterr()
+        assert "Median time/op:" in captured.out
+        assert "p95 time/op:" in captured.out
+        assert "p99 time/op:" in captured.out
+        assert "Std dev:" in captured.out
+
+    def test_csv_includes_round_statistics(self, iterations, capsys):
+        command = BenchmarkCommand(iterations, output_format="csv")
+        command.execute()
+
+        captured = capsys.readouterr()
+        header = captured.out.split("\n")[0]
+        assert "Median Time (s)" in header
+        assert "P99 Time (s)" in header
+        assert "Std Dev (s)" in header
+
+    def test_target_time_calibrates_iterations(self, iterations):
+        command = BenchmarkCommand(
+            1, rounds=2, warmup=0, target_time=0.02, only=["list_operations"]
+        )
+        result = command._run_benchmarks()["list_operations"]
+
+        assert result["iterations"] > 1
+
     def test_csv_output_format(self, iterations, capsys):
         command = BenchmarkCommand(iterations, output_format="csv")
         command.execute()
@@ -104,8 +148,8 @@ class TestBenchmarkCommand:
         assert f"Running benchmarks with {iterations} iterations" in captured.out
 
     def test_string_manipulation_benchmark(self, iterations):
-        command = BenchmarkCommand(iterations)
-        result = command._benchmark_string_manipulation()
+        command = BenchmarkCommand(iterations, only=["string_manipulation"])
+        result = command._run_benchmarks()["string_manipulation"]
 
         assert result["name"] == "String Manipulation"
         assert result["iterations"] == iterations
@@ -114,29 +158,29 @@ class TestBenchmarkCommand:
         assert result["ops_per_sec"] > 0
 
     def test_list_operations_benchmark(self, iterations):
-        command = BenchmarkCommand(iterations)
-        result = command._benchmark_list_operations()
+        command = BenchmarkCommand(iterations, only=["list_operations"])
+        result = command._run_benchmarks()["list_operations"]
 
         assert result["name"] == "List Operations"
         assert isinstance(result["total_time"], float)
 
     def test_file_io_benchmark(self, iterations):
-        command = BenchmarkCommand(iterations)
-        result = command._benchmark_file_io()
+        command = BenchmarkCommand(iterations, only=["file_io"])
+        result = command._run_benchmarks()["file_io"]
 
         assert result["name"] == "File I/O"
         assert isinstance(result["total_time"], float)
 
     def test_json_parsing_benchmark(self, iterations):
-        command = BenchmarkCommand(iterations)
-        result = command._benchmark_json_parsing()
+        command = BenchmarkCommand(iterations, only=["json_parsing"])
+        result = command._run_benchmarks()["json_parsing"]
 
         assert result["name"] == "JSON Parsing"
         assert isinstance(result["total_time"], float)
 
     def test_dict_operations_benchmark(self, iterations):
-        command = BenchmarkCommand(iterations)
-        result = command._benchmark_dict_operations()
+        command = BenchmarkCommand(iterations, only=["dict_operations"])
+        result = command._run_benchmarks()["dict_operations"]
 
         assert result["name"] == "Dict Operations"
         assert isinstance(result["total_time"], float)
@@ -148,3 +192,334 @@ class TestBenchmarkCommand:
         assert result.success is True
         assert result.is_success() is True
         assert "Benchmarks completed successfully" in result.message
+
+
+class TestBenchmarkBaselines:
+    @pytest.fixture
+    def baseline_file(self, tmp_path):
+        return str(tmp_path / "baselines.json")
+
+    def test_save_then_compare(self, baseline_file, capsys):
+        saved = BenchmarkCommand(
+            10, rounds=3, save_baseline="main", baseline_file=baseline_file
+        ).execute()
+        assert saved.success is True
+
+        command = BenchmarkCommand(
+            10,
+            rounds=3,
+            compare_baseline="main",
+            baseline_file=baseline_file,
+            threshold=1000.0,
+        )
+        result = command.execute()
+
+        captured = capsys.readouterr()
+        assert result.success is True
+        assert "Compared with baseline 'main'" in captured.out
+
+    def test_json_includes_comparison(self, baseline_file, capsys):
+        BenchmarkCommand(
+            10, rounds=3, save_baseline="main", baseline_file=baseline_file
+        ).execute()
+        capsys.readouterr()
+
+        BenchmarkCommand(
+            10,
+            output_format="json",
+            rounds=3,
+            compare_baseline="main",
+            baseline_file=baseline_file,
+            threshold=1000.0,
+        ).execute()
+
+        json_data = json.loads(capsys.readouterr().out)
+        comparison = json_data["comparison"]
+        assert comparison["baseline"] == "main"
+        assert len(comparison["benchmarks"]) == 5
+        assert {b["status"] for b in comparison["benchmarks"]} <= {
+            "unchanged",
+            "noise",
+            "improvement",
+        }
+
+    def test_unknown_baseline_fails(self, baseline_file, capsys):
+        command = BenchmarkCommand(
+            10, compare_baseline="missing", baseline_file=baseline_file
+        )
+        result = command.execute()
+
+        assert result.success is False
+        assert "Unknown baseline 'missing'" in result.message
+        assert "BENCHMARK RESULTS" not in capsys.readouterr().out
+
+    def test_regression_fails(self, baseline_file, capsys):
+        fast = {
+            "name": "String Manipulation",
+            "iterations": 10,
+            "avg_time": 1e-12,
+            "samples": [1e-12, 1.1e-12, 0.9e-12],
+        }
+        BaselineStore(baseline_file).save("fast", {"string_manipulation": fast})
+
+        result = BenchmarkCommand(
+            10, rounds=3, compare_baseline="fast", baseline_file=baseline_file
+        ).execute()
+
+        assert result.success is False
+        assert "Performance regression in: String Manipulation" in result.message
+
+    def test_single_round_regression_fails_with_warning(self, baseline_file, capsys):
+        fast = {
+            "name": "String Manipulation",
+            "iterations": 10,
+            "avg_time": 1e-12,
+            "samples": [1e-12],
+        }
+        BaselineStore(baseline_file).save("fast", {"string_manipulation": fast})
+
+        result = BenchmarkCommand(
+            10, rounds=1, compare_baseline="fast", baseline_file=baseline_file
+        ).execute()
+
+        assert result.success is False
+        assert "Performance regression in: String Manipulation" in result.message
+        assert "significance test" in capsys.readouterr().err
+
+
+class TestBenchmarkCompareImpl:
+    @pytest.fixture
+    def implementations(self, monkeypatch):
+        monkeypatch.setenv("PYTHONPATH", str(Path("src").resolve()))
+        python_cli = [sys.executable, "-m", "basiccli.cli"]
+        return ImplementationComparison(
+            python_command=python_cli, rust_command=python_cli, repeats=1
+        )
+
+    def test_reports_side_by_side_json(self, implementations, capsys):
+        command = BenchmarkCommand(
+            5,
+            output_format="json",
+            compare_impl=True,
+            implementations=implementations,
+        )
+        result = command.execute()
+
+        json_data = json.loads(capsys.readouterr().out)
+        assert result.success is True
+        assert [c["name"] for c in json_data["commands"]] == [
+            "hello",
+            "version",
+            "process",
+        ]
+        assert json_data["commands"][0]["identical_output"] is True
+        assert json_data["commands"][1]["identical_output"] is None
+        assert len(json_data["workloads"]) == 5
+
+    def test_missing_rust_binary_fails(self, capsys):
+        command = BenchmarkCommand(
+            5,
+            compare_impl=True,
+            implementations=ImplementationComparison(
+                rust_command=["/nonexistent/basiccli-rust"]
+            ),
+        )
+        result = command.execute()
+
+        assert result.success is False
+        assert "Rust implementation not found" in result.message
+
+
+class TestBenchmarkSelection:
+    def test_only_filters_by_glob(self, capsys):
+        command = BenchmarkCommand(5, output_format="json", only=["*_operations"])
+        command.execute()
+
+        names = [b["name"] for b in json.loads(capsys.readouterr().out)["benchmarks"]]
+        assert names == ["List Operations", "Dict Operations"]
+
+    def test_exclude_and_tags(self):
+        command = BenchmarkCommand(5, tags=["cpu"], exclude=["json_*"])
+
+        assert [s.key for s in command._select_benchmarks()] == [
+            "string_manipulation",
+            "list_operations",
+            "dict_operations",
+        ]
+
+    def test_no_match_fails(self):
+        result = BenchmarkCommand(5, only=["nothing*"]).execute()
+
+        assert result.success is False
+        assert "No benchmarks match" in result.message
+
+    def test_lists_benchmarks_with_tags(self, capsys):
+        result = BenchmarkCommand(5, list_benchmarks=True, tags=["io"]).execute()
+
+        output = capsys.readouterr().out
+        assert result.success is True
+        assert "file_io" in output
+        assert "string_manipulation" not in output
+
+    def test_unknown_module_fails(self):
+        result = BenchmarkCommand(5, modules=["no_such_benchmarks"]).execute()
+
+        assert result.success is False
+        assert "no_such_benchmarks" in result.message
+
+    def test_parallel_jobs_keep_benchmark_order(self, capsys):
+        command = BenchmarkCommand(
+            5, output_format="json", only=["*_operations"], jobs=2
+        )
+        result = command.execute()
+
+        names = [b["name"] for b in json.loads(capsys.readouterr().out)["benchmarks"]]
+        assert result.success is True
+        assert names == ["List Operations", "Dict Operations"]
+
+
+class TestBenchmarkMemory:
+    def test_json_includes_memory(self, capsys):
+        command = BenchmarkCommand(
+            5, output_format="json", only=["json_parsing"], top_allocations=2
+        )
+        command.execute()
+
+        (benchmark,) = json.loads(capsys.readouterr().out)["benchmarks"]
+        memory = benchmark["memory"]
+        assert memory["peak_traced_bytes"] > 0
+        assert len(memory["gc_collections"]) == 3
+        assert "rss_delta_bytes" in memory
+        assert len(memory["top_allocations"]) <= 2
+
+    def test_csv_includes_memory_columns(self, capsys):
+        BenchmarkCommand(5, output_format="csv", memory=True).execute()
+
+        lines = capsys.readouterr().out.strip().splitlines()
+        header = lines[0].split(",")
+        assert header[-6:] == [
+            "Peak Traced (B)",
+            "Retained Blocks",
+            "GC Gen0",
+            "GC Gen1",
+            "GC Gen2",
+            "RSS Delta (B)",
+        ]
+        assert all(len(line.split(",")) == len(header) for line in lines[1:])
+
+    def test_console_lists_top_allocations(self, capsys):
+        BenchmarkCommand(5, only=["json_parsing"], top_allocations=3).execute()
+
+        output = capsys.readouterr().out
+        assert "Peak traced:" in output
+        assert "Top allocations at peak:" in output
+
+    def test_memory_off_by_default(self, capsys):
+        BenchmarkCommand(5, output_format="json", only=["file_io"]).execute()
+
+        (benchmark,) = json.loads(capsys.readouterr().out)["benchmarks"]
+        assert "memory" not in benchmark
+
+    def test_isolated_runs_report_memory(self, capsys):
+        command = BenchmarkCommand(
+            5, output_format="json", only=["list_operations"], isolate=True, memory=True
+        )
+        command.execute()
+
+        (benchmark,) = json.loads(capsys.readouterr().out)["benchmarks"]
+        assert benchmark["memory"]["peak_traced_bytes"] > 0
+
+
+class TestBenchmarkSweep:
+    def test_json_reports_points_and_exponents(self, capsys):
+        command = BenchmarkCommand(
+            20,
+            output_format="json",
+            only=["list_operations"],
+            rounds=2,
+            sweep=True,
+            sweep_steps=3,
+            sweep_factor=2,
+        )
+        result = command.execute()
+
+        (sweep,) = json.loads(capsys.readouterr().out)["sweeps"]
+        assert result.success is True
+        assert sweep["name"] == "List Operations"
+        assert [p["size"] for p in sweep["points"]] == [100, 200, 400]
+        assert sweep["time_exponent"] is not None
+        assert all(p["peak_memory_bytes"] > 0 for p in sweep["points"])
+
+    def test_console_shows_complexity(self, capsys):
+        BenchmarkCommand(
+            10, only=["dict_*"], rounds=1, sweep=True, sweep_steps=2
+        ).execute()
+
+        output = capsys.readouterr().out
+        assert "SCALING SWEEP" in output
+        assert "Time:   ~O(" in output
+
+    def test_csv_has_row_per_size(self, capsys):
+        BenchmarkCommand(
+            10, output_format="csv", rounds=1, sweep=True, sweep_steps=3
+        ).execute()
+
+        lines = capsys.readouterr().out.strip().splitlines()
+        assert lines[0].startswith("Benchmark,Size,Iterations")
+        assert len(lines) == 1 + 5 * 3
+
+
+class TestBenchmarkFileHandler:
+    def test_opt_in_suite_not_run_by_default(self):
+        results = BenchmarkCommand(1, rounds=1)._run_benchmarks()
+
+        assert not any(key.startswith("file_handler.") for key in results)
+
+    def test_json_includes_throughput(self, capsys):
+        result = BenchmarkCommand(
+            2,
+            output_format="json",
+            rounds=1,
+            only=[
+                "file_handler.read.json",
+                "file_handler.read.json.disk_cache",
+                "file_handler.checksum",
+            ],
+        ).execute()
+
+        output = json.loads(capsys.readouterr().out)
+        assert result.success is True
+        assert len(output["benchmarks"]) == 3
+        assert all(b["mb_per_sec"] > 0 for b in output["benchmarks"])
+
+    def test_sweep_skips_sizes_over_limit_and_keeps_others(self, monkeypatch, capsys):
+        registry.load_plugins()
+        monkeypatch.setattr(
+            registry.get("file_handler.read.json"), "max_size", 100 * 1024
+        )
+
+        result = BenchmarkCommand(
+            1,
+            output_format="json",
+            rounds=1,
+            warmup=0,
+            only=["file_handler.read.json", "file_handler.checksum"],
+            sweep=True,
+            sweep_steps=2,
+            sweep_factor=4,
+        ).execute()
+
+        sweeps = {s["name"]: s for s in json.loads(capsys.readouterr().out)["sweeps"]}
+        assert result.success is True
+        read, checksum = sweeps["FileHandler.read JSON"], sweeps["FileHandler.checksum"]
+        assert [p["size"] for p in read["points"]] == [64 * 1024]
+        assert read["skipped_sizes"] == [256 * 1024]
+        assert len(checksum["points"]) == 2
+        assert checksum["skipped_sizes"] == []
+
+    def test_list_marks_opt_in(self, capsys):
+        BenchmarkCommand(1, list_benchmarks=True).execute()
+
+        output = capsys.readouterr().out
+        assert "file_handler.copy" in output
+        assert "opt-in" in output
@@ -0,0 +1,220 @@
+import json
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, "src")
+
+import pytest  # noqa: E402
+
+from basiccli.commands.process import (  # noqa: E402
+    ProcessCommand,
+    _process_ndjson_batch,
+)
+
+
+class TestProcessCommand:
+    @pytest.fixture
+    def temp_dir(self):
+        temp_dir = tempfile.mkdtemp()
+        yield temp_dir
+        shutil.rmtree(temp_dir)
+
+    @pytest.fixture
+    def json_file(self, temp_dir):
+        filepath = Path(temp_dir) / "data.json"
+        filepath.write_text(json.dumps({"name": "Test", "items": [1, 2.5, None]}))
+        return filepath
+
+    def test_outputs_compact_json(self, json_file, capsys):
+        result = ProcessCommand([str(json_file)]).execute()
+
+        captured = capsys.readouterr()
+        assert '{"name": "Test", "items": [1, 2.5, null]}' in captured.out
+        assert "Successfully parsed JSON with 2 keys" in captured.out
+        assert result.success is True
+
+    def test_outputs_pretty_json(self, json_file, capsys):
+        ProcessCommand([str(json_file)], pretty=True).execute()
+
+        captured = capsys.readouterr()
+        assert '{\n  "name": "Test",' in captured.out
+
+    def test_stream_matches_document_mode(self, json_file, capsys):
+        def json_lines(output):
+            return [line for line in output.splitlines() if " INFO  | " not in line]
+
+        for pretty in (False, True):
+            ProcessCommand([str(json_file)], pretty=pretty).execute()
+            document_lines = json_lines(capsys.readouterr().out)
+
+            ProcessCommand(
+                [str(json_file)], pretty=pretty, stream=True, chunk_size=3
+            ).execute()
+            stream_lines = json_lines(capsys.readouterr().out)
+
+            assert stream_lines == document_lines
+
+    def test_stream_reports_top_level_entries(self, json_file, capsys):
+        result = ProcessCommand([str(json_file)], stream=True).execute()
+
+        captured = capsys.readouterr()
+        assert "Successfully streamed JSON with 2 top-level entries" in captured.out
+        assert result.success is True
+
+    def test_stats_report_throughput_and_memory(self, json_file, capsys):
+        ProcessCommand([str(json_file)], stats=True, stream=True).execute()
+
+        captured = capsys.readouterr()
+        assert "File size:" in captured.out
+        assert "Throughput:" in captured.out
+        assert "Peak memory:" in captured.out
+        assert "Processing complete" in captured.out
+
+    @pytest.fixture
+    def ndjson_file(self, temp_dir):
+        filepath = Path(temp_dir) / "records.ndjson"
+        lines = [json.dumps({"id": i, "tags": ["a", "b"]}) for i in range(50)]
+        filepath.write_text("\n".join(lines[:25]) + "\n\n" + "\n".join(lines[25:]))
+        return filepath
+
+    def test_ndjson_outputs_records_in_order(self, ndjson_file, capsys):
+        result = ProcessCommand([str(ndjson_file)], batch_size=7).execute()
+
+        captured = capsys.readouterr()
+        records = [json.loads(line) for line in captured.out.splitlines()[1:-1]]
+        assert [r["id"] for r in records] == list(range(50))
+        assert "Successfully processed 50 NDJSON records" in captured.out
+        assert result.success is True
+
+    def test_ndjson_workers_preserve_order(self, ndjson_file, capsys):
+        ProcessCommand([str(ndjson_file)], batch_size=7).execute()
+        sequential = capsys.readouterr().out.splitlines()[1:-1]
+
+        ProcessCommand([str(ndjson_file)], workers=3, batch_size=4).execute()
+        parallel = capsys.readouterr().out.splitlines()[1:-1]
+
+        assert parallel == sequential
+
+    def test_ndjson_flag_overrides_extension(self, temp_dir, capsys):
+        filepath = Path(temp_dir) / "records.log"
+        filepath.write_text('{"a": 1}\n{"a": 2}\n')
+
+        result = ProcessCommand([str(filepath)], ndjson=True).execute()
+
+        captured = capsys.readouterr()
+        assert '{"a": 1}\n{"a": 2}\n' in captured.out
+        assert result.success is True
+
+    def test_ndjson_invalid_line_reports_line_number(self, temp_dir, capsys):
+        filepath = Path(temp_dir) / "broken.jsonl"
+        filepath.write_text('{"a": 1}\n{"a": }\n')
+
+        result = ProcessCommand([str(filepath)], workers=2).execute()
+
+        assert result.success is False
+        assert "line 2" in result.message
+
+    def test_ndjson_batch_pretty(self):
+        output, count = _process_ndjson_batch(1, ['{"a": 1}\n', "\n"], pretty=True)
+
+        assert output == '{\n  "a": 1\n}'
+        assert count == 1
+
+    @pytest.fixture
+    def json_tree(self, temp_dir):
+        root = Path(temp_dir) / "tree"
+        (root / "nested").mkdir(parents=True)
+        for i in range(3):
+            (root / f"doc{i}.json").write_text(json.dumps({"doc": i}))
+        (root / "nested" / "doc3.json").write_text(json.dumps({"doc": 3}))
+        (root / "notes.txt").write_text("not json")
+        return root
+
+    def output_docs(self, output):
+        return [
+            json.loads(line)["doc"]
+            for line in output.splitlines()
+            if line.startswith('{"doc"')
+        ]
+
+    def test_directory_input_processes_json_files(self, json_tree, capsys):
+        command = ProcessCommand([str(json_tree)])
+        result = command.execute()
+
+        captured = capsys.readouterr()
+        assert self.output_docs(captured.out) == [0, 1, 2, 3]
+        assert "Processed 4 files (0 failed)" in captured.out
+        assert len(command.results) == 4
+        assert result.success is True
+
+    def test_glob_input(self, json_tree, capsys):
+        result = ProcessCommand([str(json_tree / "doc*.json")]).execute()
+
+        captured = capsys.readouterr()
+        assert self.output_docs(captured.out) == [0, 1, 2]
+        assert result.success is True
+
+    def test_unmatched_glob_fails(self, json_tree):
+        result = ProcessCommand([str(json_tree / "*.yaml")]).execute()
+
+        assert result.success is False
+        assert "No files match" in result.message
+
+    @pytest.mark.parametrize("pool", ["thread", "process"])
+    def test_worker_pool_preserves_file_order(self, json_tree, pool, capsys):
+        result = ProcessCommand([str(json_tree)], workers=2, pool=pool).execute()
+
+        captured = capsys.readouterr()
+        assert self.output_docs(captured.out) == [0, 1, 2, 3]
+        assert result.success is True
+
+    def test_stops_at_first_bad_file(self, json_tree, capsys):
+        (json_tree / "doc1.json").write_text("{broken")
+
+        command = ProcessCommand([str(json_tree)])
+        result = command.execute()
+
+        captured = capsys.readouterr()
+        assert self.output_docs(captured.out) == [0]
+        assert "Invalid JSON" in captured.out
+        assert result.success is False
+
+    def test_keep_going_continues_past_bad_files(self, json_tree, capsys):
+        (json_tree / "doc1.json").write_text("{broken")
+
+        command = ProcessCommand([str(json_tree)], keep_going=True, stream=True)
+        result = command.execute()
+
+        captured = capsys.readouterr()
+        assert self.output_docs(captured.out) == [0, 2, 3]
+        assert "Processed 3 files (1 failed)" in result.message
+        assert [r.error is not None for r in command.results].count(True) == 1
+        assert result.success is False
+
+    def test_aggregate_stats(self, json_tree, capsys):
+        ProcessCommand([str(json_tree)], stats=True).execute()
+
+        captured = capsys.readouterr()
+        assert "Files: 4 processed, 0 failed" in captured.out
+        assert "Files/second:" in captured.out
+        assert "Throughput:" in captured.out
+        assert "doc0.json: 10 bytes, 1 records" in captured.out
+
+    def test_invalid_json_fails(self, temp_dir, capsys):
+        filepath = Path(temp_dir) / "invalid.json"
+        filepath.write_text('{"unterminated": [1, 2}')
+
+        for stream in (False, True):
+            result = ProcessCommand([str(filepath)], stream=stream).execute()
+
+            captured = capsys.readouterr()
+            assert "Invalid JSON" in captured.out
+            assert result.success is False
+
+    def test_missing_file_fails(self, temp_dir):
+        result = ProcessCommand([str(Path(temp_dir) / "missing.json")]).execute()
+
+        assert result.success is False
+        assert "File not found" in result.message
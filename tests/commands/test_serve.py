@@ -0,0 +1,178 @@
+import json
+import os
+import shutil
+import signal
+import socket
+import stat
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, "src")
+
+import pytest  # noqa: E402
+
+from basiccli.client import (  # noqa: E402
+    connect,
+    default_socket_path,
+    encode_request,
+)
+from basiccli.commands.serve import ServeCommand  # noqa: E402
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+
+
+class TestServeCommand:
+    @pytest.fixture
+    def temp_dir(self):
+        temp_dir = tempfile.mkdtemp()
+        yield temp_dir
+        shutil.rmtree(temp_dir)
+
+    @pytest.fixture
+    def env(self, temp_dir):
+        env = dict(os.environ)
+        src = str(Path("src").resolve())
+        env["PYTHONPATH"] = os.pathsep.join([src, env.get("PYTHONPATH", "")])
+        env["BASICCLI_SOCKET"] = str(Path(temp_dir) / "basiccli.sock")
+        return env
+
+    @pytest.fixture
+    def server(self, env):
+        process = subprocess.Popen(
+            [sys.executable, "-m", "basiccli.cli", "serve"],
+            env=env,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        assert "Listening on" in process.stdout.readline()
+        yield process
+        process.send_signal(signal.SIGTERM)
+        process.wait(timeout=10)
+
+    def run_client(self, env, *args, **kwargs):
+        return subprocess.run(
+            [sys.executable, "-m", "basiccli.client", *args],
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=30,
+            **kwargs,
+        )
+
+    def test_forwards_command_output(self, server, env):
+        result = self.run_client(env, "hello", "World", "--repeat", "2")
+
+        assert result.returncode == 0
+        assert result.stdout.count("World! Welcome to BasicCli") == 2
+
+    def test_forwards_json_output(self, server, env):
+        result = self.run_client(env, "version", "--json")
+
+        assert json.loads(result.stdout)["name"] == "BasicCli"
+
+    def test_forwards_exit_code_and_stderr(self, server, env):
+        result = self.run_client(env, "no-such-command")
+
+        assert result.returncode == 2
+        assert "No such command" in result.stderr
+
+    def test_runs_in_client_working_directory(self, server, env, temp_dir):
+        Path(temp_dir, "data.json").write_text('{"served": true}')
+
+        result = self.run_client(env, "process", "data.json", cwd=temp_dir)
+
+        assert result.returncode == 0
+        assert '{"served": true}' in result.stdout
+
+    def test_wrapper_script_keeps_working_directory(self, server, env, temp_dir):
+        Path(temp_dir, "data.json").write_text('{"wrapped": true}')
+        wrapper = Path("bin/basiccli-client").resolve()
+
+        result = subprocess.run(
+            [str(wrapper), "process", "data.json"],
+            env=env,
+            cwd=temp_dir,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert '{"wrapped": true}' in result.stdout
+
+    def test_removes_socket_on_shutdown(self, env):
+        process = subprocess.Popen(
+            [sys.executable, "-m", "basiccli.cli", "serve"],
+            env=env,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        process.stdout.readline()
+        assert Path(env["BASICCLI_SOCKET"]).exists()
+
+        process.send_signal(signal.SIGTERM)
+        process.wait(timeout=10)
+
+        assert not Path(env["BASICCLI_SOCKET"]).exists()
+
+    def test_refuses_to_replace_running_server(self, server, env):
+        command = ServeCommand(env["BASICCLI_SOCKET"], handler=lambda argv: 0)
+        result = command.execute()
+
+        assert result.success is False
+        assert "already listening" in result.message
+
+    def test_socket_is_owner_only(self, server, env):
+        mode = os.stat(env["BASICCLI_SOCKET"]).st_mode
+
+        assert stat.S_IMODE(mode) == 0o600
+
+    def test_client_falls_back_without_server(self, env):
+        result = self.run_client(env, "hello", "Fallback")
+
+        assert result.returncode == 0
+        assert "Fallback" in result.stdout
+
+
+class TestClient:
+    def test_default_socket_path_from_env(self, monkeypatch):
+        monkeypatch.setenv("BASICCLI_SOCKET", "/tmp/custom.sock")
+        assert default_socket_path() == "/tmp/custom.sock"
+
+    def test_default_socket_path_is_per_user(self, monkeypatch):
+        monkeypatch.delenv("BASICCLI_SOCKET", raising=False)
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        assert str(os.getuid()) in default_socket_path()
+
+    def test_encode_request_is_length_prefixed(self):
+        data = encode_request(["hello", "World"], "/tmp")
+        payload = json.loads(data[4:])
+
+        assert int.from_bytes(data[:4], "big") == len(data) - 4
+        assert payload == {"argv": ["hello", "World"], "cwd": "/tmp"}
+
+    @pytest.fixture
+    def listener(self, tmp_path):
+        path = str(tmp_path / "basiccli.sock")
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(path)
+        listener.listen(1)
+        yield path
+        listener.close()
+
+    def test_connect_to_own_server(self, listener):
+        sock = connect(listener)
+
+        assert sock is not None
+        sock.close()
+
+    def test_connect_ignores_server_of_another_user(
+        self, listener, monkeypatch, capsys
+    ):
+        other_uid = os.getuid() + 1
+        monkeypatch.setattr(os, "getuid", lambda: other_uid)
+
+        assert connect(listener) is None
+        assert "owned by uid" in capsys.readouterr().err
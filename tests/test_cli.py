@@ -0,0 +1,118 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+HEAVY_MODULES = [
+    "basiccli.commands.benchmark",
+    "basiccli.commands.hello",
+    "basiccli.commands.process",
+    "basiccli.commands.serve",
+    "basiccli.commands.version",
+    "basiccli.utils.logger",
+    "basiccli.utils.profiler",
+    "cProfile",
+    "csv",
+    "tempfile",
+    "yaml",
+    "concurrent.futures",
+]
+
+# Generous ceilings for what basiccli.cli adds on top of click itself: the
+# best of a few runs must stay under the time budget, and the count of extra
+# modules is deterministic
+IMPORT_BUDGET_US = 150_000
+IMPORT_BUDGET_RUNS = 3
+EXTRA_MODULE_BUDGET = 10
+
+
+def run_python(*args):
+    env = dict(os.environ)
+    src = str(Path("src").resolve())
+    env["PYTHONPATH"] = os.pathsep.join([src, env.get("PYTHONPATH", "")])
+    return subprocess.run(
+        [sys.executable, *args], env=env, capture_output=True, text=True, check=True
+    )
+
+
+def import_times(module):
+    """Cumulative import time in microseconds per module, from -X importtime"""
+    result = run_python("-X", "importtime", "-c", f"import {module}")
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.fixture(scope="module")
+def cli_imports():
+    return import_times("basiccli.cli")
+
+
+class TestCliImportTime:
+    @pytest.mark.parametrize("module", HEAVY_MODULES)
+    def test_cli_import_defers_module(self, cli_imports, module):
+        assert module not in cli_imports
+
+    def test_cli_import_within_budget(self, cli_imports):
+        overheads = [cli_imports["basiccli.cli"] - cli_imports["click"]]
+        for _ in range(IMPORT_BUDGET_RUNS - 1):
+            times = import_times("basiccli.cli")
+            overheads.append(times["basiccli.cli"] - times["click"])
+
+        assert min(overheads) < IMPORT_BUDGET_US
+
+    def test_cli_imports_few_modules_beyond_click(self, cli_imports):
+        click_imports = import_times("click")
+
+        assert len(set(cli_imports) - set(click_imports)) <= EXTRA_MODULE_BUDGET
+
+    def test_client_import_avoids_click(self):
+        client_imports = import_times("basiccli.client")
+
+        assert "click" not in client_imports
+        assert "basiccli.cli" not in client_imports
+
+    def test_command_imports_only_its_module(self):
+        result = run_python(
+            "-c",
+            "import sys; from basiccli.cli import run; run(['hello', 'Lazy']); "
+            "print(sorted(m for m in sys.modules if m.startswith('basiccli.')))",
+        )
+
+        assert "Lazy" in result.stdout
+        assert "basiccli.commands.hello" in result.stdout
+        assert "basiccli.commands.benchmark" not in result.stdout
+        assert "basiccli.commands.process" not in result.stdout
+
+
+class TestCliProfile:
+    def test_profile_writes_stats_and_summary(self, tmp_path):
+        prefix = tmp_path / "profiles" / "hello"
+        result = run_python(
+            "-m", "basiccli.cli", "--profile-output", str(prefix), "hello", "Profiled"
+        )
+
+        assert "Profiled" in result.stdout
+        assert "Ordered by: cumulative time" in result.stderr
+        assert (tmp_path / "profiles" / "hello.pstats").exists()
+        assert (tmp_path / "profiles" / "hello.collapsed").exists()
+
+    def test_profile_still_written_on_failure(self, tmp_path):
+        env = dict(os.environ)
+        env["PYTHONPATH"] = str(Path("src").resolve())
+        result = subprocess.run(
+            [sys.executable, "-m", "basiccli.cli", "--profile", "process", "none.json"],
+            cwd=tmp_path,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 1
+        assert (tmp_path / "basiccli-profile.pstats").exists()
@@ -1,6 +1,9 @@
+import hashlib
+import math
 import shutil
 import sys
 import tempfile
+from array import array
 from pathlib import Path
 
 sys.path.insert(0, "src")
@@ -259,3 +262,365 @@ class TestFileHandler:
 
         with pytest.raises(FileError, match="Invalid CSV"):
             FileHandler.read(filepath, format="csv")
+
+
+class TestCsvStreaming:
+    @pytest.fixture
+    def csv_file(self, tmp_path):
+        filepath = tmp_path / "rows.csv"
+        FileHandler.write(
+            filepath, [{"id": str(i), "name": f"user {i}"} for i in range(5)]
+        )
+        return filepath
+
+    def test_iter_csv_yields_dicts(self, csv_file):
+        rows = list(FileHandler.iter_csv(csv_file))
+
+        assert rows == FileHandler.read(csv_file)
+        assert rows[0] == {"id": "0", "name": "user 0"}
+
+    def test_iter_csv_tuples_share_header(self, csv_file):
+        reader = FileHandler.iter_csv(csv_file, as_tuples=True)
+
+        assert reader.header == ["id", "name"]
+        assert list(reader)[-1] == ("4", "user 4")
+
+    def test_iter_csv_batches(self, csv_file):
+        batches = list(FileHandler.iter_csv(csv_file, batch_size=2, as_tuples=True))
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert batches[1][0] == ("2", "user 2")
+
+    def test_iter_csv_closes_file(self, csv_file):
+        reader = FileHandler.iter_csv(csv_file)
+        list(reader)
+        assert reader._file.closed
+
+        with FileHandler.iter_csv(csv_file) as reader:
+            next(iter(reader))
+        assert reader._file.closed
+
+    def test_iter_csv_handles_quoted_newlines(self, tmp_path):
+        filepath = tmp_path / "quoted.csv"
+        filepath.write_text('id,note\r\n1,"two\nlines"\r\n2,plain\r\n')
+
+        assert [row["note"] for row in FileHandler.iter_csv(filepath)] == [
+            "two\nlines",
+            "plain",
+        ]
+
+    def test_iter_csv_skips_blank_lines(self, tmp_path):
+        filepath = tmp_path / "blank.csv"
+        filepath.write_text("a,b\n1,2\n\n3,4\n\n")
+
+        tuples = list(FileHandler.iter_csv(filepath, as_tuples=True))
+        dicts = list(FileHandler.iter_csv(filepath))
+
+        assert tuples == [("1", "2"), ("3", "4")]
+        assert len(dicts) == len(tuples)
+
+    def test_iter_csv_nonexistent_raises_error(self):
+        with pytest.raises(FileError, match="File not found"):
+            FileHandler.iter_csv("/nonexistent/rows.csv")
+
+    def test_write_csv_streams_generator(self, tmp_path):
+        filepath = tmp_path / "out.csv"
+        rows = ({"id": i, "square": i * i} for i in range(1000))
+
+        count = FileHandler.write_csv(filepath, rows)
+
+        assert count == 1000
+        assert FileHandler.read(filepath)[999] == {"id": "999", "square": "998001"}
+
+    def test_write_csv_sequences_with_fieldnames(self, tmp_path):
+        filepath = tmp_path / "out.csv"
+
+        FileHandler.write_csv(filepath, [(1, "a"), (2, "b")], fieldnames=["id", "v"])
+
+        assert filepath.read_bytes() == b"id,v\r\n1,a\r\n2,b\r\n"
+
+    def test_write_csv_round_trips_iter_csv_tuples(self, csv_file, tmp_path):
+        reader = FileHandler.iter_csv(csv_file, as_tuples=True)
+        filepath = tmp_path / "copy.csv"
+
+        FileHandler.write_csv(filepath, reader, fieldnames=reader.header)
+
+        assert filepath.read_bytes() == csv_file.read_bytes()
+
+    def test_write_csv_empty(self, tmp_path):
+        filepath = tmp_path / "empty.csv"
+
+        assert FileHandler.write_csv(filepath, iter([])) == 0
+        assert filepath.read_text() == ""
+
+    def test_write_csv_empty_with_fieldnames_writes_header(self, tmp_path):
+        filepath = tmp_path / "empty.csv"
+
+        assert FileHandler.write_csv(filepath, [], fieldnames=["id", "v"]) == 0
+        assert filepath.read_bytes() == b"id,v\r\n"
+
+    def test_invalid_row_leaves_existing_file_untouched(self, tmp_path):
+        filepath = tmp_path / "data.csv"
+        filepath.write_text("id\n42\n")
+
+        with pytest.raises(FileError):
+            FileHandler.write(filepath, [{"id": 1}, {"bad": 2}])
+
+        assert filepath.read_text() == "id\n42\n"
+        assert list(tmp_path.iterdir()) == [filepath]
+
+    def test_write_keeps_csv_error_message(self, tmp_path):
+        filepath = tmp_path / "bad.csv"
+
+        with pytest.raises(FileError) as excinfo:
+            FileHandler.write(filepath, [{"id": 1}, {"id": 2, "extra": 3}])
+
+        assert str(excinfo.value).count("Failed to write") == 1
+
+
+class TestReadColumns:
+    @pytest.fixture
+    def numeric_csv(self, tmp_path):
+        filepath = tmp_path / "metrics.csv"
+        FileHandler.write_csv(
+            filepath,
+            ((i, i * 0.5, f"host-{i % 3}") for i in range(25000)),
+            fieldnames=["id", "load", "host"],
+        )
+        return filepath
+
+    def test_infers_compact_columns(self, numeric_csv):
+        columns = FileHandler.read_columns(numeric_csv, use_numpy=False)
+
+        assert isinstance(columns["id"], array)
+        assert columns["id"].typecode == "q"
+        assert columns["load"].typecode == "d"
+        assert columns["host"][:3] == ["host-0", "host-1", "host-2"]
+        assert len(columns["id"]) == 25000
+        assert sum(columns["id"]) == sum(range(25000))
+        assert columns["load"][-1] == 24999 * 0.5
+
+    def test_explicit_dtypes(self, numeric_csv):
+        columns = FileHandler.read_columns(
+            numeric_csv, dtypes={"id": "float", "load": "str"}, use_numpy=False
+        )
+
+        assert columns["id"].typecode == "d"
+        assert columns["load"][1] == "0.5"
+
+    def test_widens_int_column_after_sample(self, tmp_path):
+        filepath = tmp_path / "mixed.csv"
+        FileHandler.write_csv(
+            filepath, [(1,), (2,), (2.5,), ("",)], fieldnames=["value"]
+        )
+
+        columns = FileHandler.read_columns(filepath, sample_size=2, use_numpy=False)
+
+        assert columns["value"].typecode == "d"
+        assert list(columns["value"][:3]) == [1.0, 2.0, 2.5]
+        assert math.isnan(columns["value"][3])
+
+    def test_invalid_value_for_declared_dtype(self, tmp_path):
+        filepath = tmp_path / "bad.csv"
+        FileHandler.write_csv(filepath, [(1,), ("x",)], fieldnames=["value"])
+
+        with pytest.raises(FileError, match="Invalid int value in column value"):
+            FileHandler.read_columns(filepath, dtypes={"value": "int"})
+
+    def test_out_of_range_int_widens_to_float(self, tmp_path):
+        filepath = tmp_path / "big.csv"
+        FileHandler.write_csv(
+            filepath, [(1,), (2,), (99999999999999999999,)], fieldnames=["value"]
+        )
+
+        inferred = FileHandler.read_columns(filepath, use_numpy=False)
+        widened = FileHandler.read_columns(filepath, sample_size=2, use_numpy=False)
+
+        for columns in (inferred, widened):
+            assert columns["value"].typecode == "d"
+            assert list(columns["value"]) == [1.0, 2.0, 1e20]
+
+    def test_out_of_range_int_for_declared_dtype(self, tmp_path):
+        filepath = tmp_path / "big.csv"
+        FileHandler.write_csv(
+            filepath, [(1,), (99999999999999999999,)], fieldnames=["value"]
+        )
+
+        with pytest.raises(FileError, match="Invalid int value in column value"):
+            FileHandler.read_columns(filepath, dtypes={"value": "int"})
+
+    @pytest.mark.parametrize("value", ["1_000", " 5", "5 ", "1_0.5"])
+    def test_loose_numeric_literals_stay_strings(self, tmp_path, value):
+        filepath = tmp_path / "loose.csv"
+        FileHandler.write_csv(filepath, [(1,), (value,)], fieldnames=["value"])
+
+        columns = FileHandler.read_columns(filepath, use_numpy=False)
+
+        assert columns["value"] == ["1", value]
+
+    @pytest.mark.parametrize("dtype", ["int", "float"])
+    def test_loose_numeric_literal_for_declared_dtype(self, tmp_path, dtype):
+        filepath = tmp_path / "loose.csv"
+        FileHandler.write_csv(filepath, [(1,), ("1_000",)], fieldnames=["value"])
+
+        with pytest.raises(
+            FileError, match=f"Invalid {dtype} value in column value: '1_000'"
+        ):
+            FileHandler.read_columns(filepath, dtypes={"value": dtype})
+
+    def test_non_numeric_value_names_inferred_type(self, tmp_path):
+        filepath = tmp_path / "mixed.csv"
+        FileHandler.write_csv(filepath, [(1,), (2,), ("x",)], fieldnames=["value"])
+
+        with pytest.raises(FileError, match=r"column value \(inferred type int\): 'x'"):
+            FileHandler.read_columns(filepath, sample_size=2)
+
+    def test_skips_blank_lines(self, tmp_path):
+        filepath = tmp_path / "blank.csv"
+        filepath.write_text("a,b\n1,2\n\n3,4\n\n")
+
+        columns = FileHandler.read_columns(filepath, use_numpy=False)
+
+        assert list(columns["a"]) == [1, 3]
+        assert list(columns["b"]) == [2, 4]
+
+    def test_ragged_rows_raise_error(self, tmp_path):
+        filepath = tmp_path / "ragged.csv"
+        filepath.write_text("a,b\n1,2\n3\n")
+
+        with pytest.raises(FileError, match="rows must have 2 fields"):
+            FileHandler.read_columns(filepath)
+
+    def test_unknown_dtype_column_raises_error(self, numeric_csv):
+        with pytest.raises(FileError, match="Unknown columns: missing"):
+            FileHandler.read_columns(numeric_csv, dtypes={"missing": "int"})
+
+    def test_uses_far_less_memory_than_rows(self, numeric_csv):
+        columns = FileHandler.read_columns(numeric_csv, use_numpy=False)
+        rows = FileHandler.read(numeric_csv)
+
+        numeric_bytes = sum(sys.getsizeof(columns[c]) for c in ["id", "load"])
+        row_bytes = sum(
+            sys.getsizeof(row) + sum(sys.getsizeof(row[c]) for c in ["id", "load"])
+            for row in rows
+        )
+        assert numeric_bytes * 10 < row_bytes
+
+    def test_numpy_arrays_when_available(self, numeric_csv):
+        numpy = pytest.importorskip("numpy")
+
+        columns = FileHandler.read_columns(numeric_csv)
+
+        assert isinstance(columns["id"], numpy.ndarray)
+        assert columns["id"].dtype == numpy.int64
+        assert columns["load"].sum() == sum(i * 0.5 for i in range(25000))
+
+
+class TestMappedFile:
+    @pytest.fixture
+    def log_file(self, tmp_path):
+        filepath = tmp_path / "app.log"
+        filepath.write_bytes(b"INFO start\nWARN disk 91%\nINFO done")
+        return filepath
+
+    def test_slices_are_views(self, log_file):
+        with FileHandler.open_mapped(log_file) as mapped:
+            head = mapped[:4]
+
+            assert len(mapped) == log_file.stat().st_size
+            assert isinstance(head, memoryview)
+            assert head == b"INFO"
+            head.release()
+
+    def test_lines(self, log_file):
+        with FileHandler.open_mapped(log_file) as mapped:
+            lines = [bytes(line) for line in mapped.lines()]
+            with_ends = [bytes(line) for line in mapped.lines(keepends=True)]
+
+        assert lines == [b"INFO start", b"WARN disk 91%", b"INFO done"]
+        assert b"".join(with_ends) == log_file.read_bytes()
+
+    def test_find_and_search(self, log_file):
+        with FileHandler.open_mapped(log_file) as mapped:
+            assert mapped.find(b"WARN") == 11
+            assert mapped.rfind(b"INFO") == 25
+            assert mapped.find(b"ERROR") == -1
+            assert [m.group(1) for m in mapped.search(rb"(\d+)%")] == [b"91"]
+
+    def test_read_text(self, log_file):
+        with FileHandler.open_mapped(log_file) as mapped:
+            assert mapped.read_text() == log_file.read_text()
+
+    def test_empty_file(self, tmp_path):
+        filepath = tmp_path / "empty.log"
+        filepath.write_bytes(b"")
+
+        with FileHandler.open_mapped(filepath) as mapped:
+            assert len(mapped) == 0
+            assert list(mapped.lines()) == []
+            assert mapped.find(b"x") == -1
+
+    def test_close_with_live_view_raises_error(self, log_file):
+        mapped = FileHandler.open_mapped(log_file)
+        line = next(mapped.lines())
+
+        with pytest.raises(BufferError):
+            mapped.close()
+        line.release()
+        mapped.close()
+
+    def test_nonexistent_raises_error(self):
+        with pytest.raises(FileError, match="File not found"):
+            FileHandler.open_mapped("/nonexistent/app.log")
+
+
+class TestChecksums:
+    @pytest.fixture
+    def data_file(self, tmp_path):
+        filepath = tmp_path / "data.bin"
+        filepath.write_bytes(bytes(range(256)) * 4099)
+        return filepath
+
+    @pytest.mark.parametrize("buffer_size", [None, 1, 4096, 10**7])
+    def test_checksum_matches_hashlib(self, data_file, buffer_size):
+        expected = hashlib.sha256(data_file.read_bytes()).hexdigest()
+
+        assert FileHandler.checksum(data_file, buffer_size=buffer_size) == expected
+
+    def test_checksum_many(self, tmp_path, data_file):
+        other = tmp_path / "other.txt"
+        other.write_text("other")
+        paths = [data_file, other]
+
+        digests = FileHandler.checksum_many(paths, algorithm="md5", workers=2)
+
+        assert list(digests) == [str(data_file), str(other)]
+        assert digests[str(other)] == hashlib.md5(b"other").hexdigest()
+        assert digests[str(data_file)] == FileHandler.checksum(data_file, "md5")
+
+    def test_checksum_many_missing_file_raises_error(self, tmp_path):
+        with pytest.raises(FileError, match="File not found"):
+            FileHandler.checksum_many([tmp_path / "missing.bin"])
+
+    def test_tree_checksum_hashes_chunk_digests(self, data_file):
+        content = data_file.read_bytes()
+        chunk_size = 100_000
+        digests = b"".join(
+            hashlib.sha256(content[i : i + chunk_size]).digest()
+            for i in range(0, len(content), chunk_size)
+        )
+
+        tree = FileHandler.tree_checksum(data_file, chunk_size=chunk_size, workers=4)
+
+        assert tree == hashlib.sha256(digests).hexdigest()
+        assert tree != FileHandler.tree_checksum(data_file, chunk_size=chunk_size * 2)
+
+    def test_tree_checksum_empty_file(self, tmp_path):
+        filepath = tmp_path / "empty.bin"
+        filepath.write_bytes(b"")
+
+        assert FileHandler.tree_checksum(filepath) == hashlib.sha256().hexdigest()
+
+    def test_tree_checksum_unsupported_algorithm(self, data_file):
+        with pytest.raises(ValueError, match="Unsupported algorithm"):
+            FileHandler.tree_checksum(data_file, algorithm="crc32")
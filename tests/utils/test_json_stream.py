@@ -0,0 +1,95 @@
+import json
+import sys
+from io import StringIO
+
+sys.path.insert(0, "src")
+
+import pytest  # noqa: E402
+
+from basiccli.utils.json_stream import JsonStreamError, stream_json  # noqa: E402
+
+
+def transcode(content, indent=None, chunk_size=4):
+    parts = []
+    entries = stream_json(
+        StringIO(content), parts.append, indent=indent, chunk_size=chunk_size
+    )
+    return "".join(parts), entries
+
+
+class TestStreamJson:
+    @pytest.fixture
+    def document(self):
+        return json.dumps(
+            {
+                "users": [
+                    {"id": 1, "name": "Ünïcode", "score": 1.50, "tags": []},
+                    {"id": 2, "name": 'quote " and \\', "active": False},
+                ],
+                "meta": {"total": 2, "ratio": 1e-7, "empty": {}},
+                "note": None,
+            },
+            ensure_ascii=False,
+        )
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 17, 65536])
+    def test_compact_output_matches_json_dumps(self, document, chunk_size):
+        output, _ = transcode(document, chunk_size=chunk_size)
+        assert output == json.dumps(json.loads(document))
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 65536])
+    def test_pretty_output_matches_json_dumps(self, document, chunk_size):
+        output, _ = transcode(document, indent=2, chunk_size=chunk_size)
+        assert output == json.dumps(json.loads(document), indent=2)
+
+    def test_normalizes_numbers_like_json_module(self):
+        content = "[1.50, -0, 1E2, 1e400, -1e400, NaN, 12345678901234567890]"
+        output, _ = transcode(content, chunk_size=2)
+        assert output == json.dumps(json.loads(content))
+
+    def test_counts_top_level_entries(self):
+        assert transcode('{"a": 1, "b": {"c": 2}}')[1] == 2
+        assert transcode("[1, [2, 3], {}]")[1] == 3
+        assert transcode('"scalar"')[1] == 0
+
+    def test_empty_containers(self):
+        assert transcode('{"a": [], "b": {}}', indent=2)[0] == (
+            '{\n  "a": [],\n  "b": {}\n}'
+        )
+
+    def test_writes_in_bounded_chunks(self, document):
+        parts = []
+        stream_json(StringIO(document), parts.append, chunk_size=16)
+
+        assert len(parts) > 1
+        assert max(len(part) for part in parts) < 16 + 64
+
+    @pytest.mark.parametrize(
+        "content",
+        ["", "{", '{"a"}', "[1,]", '{"a": 1,}', "[1 2]", "1 2", "tru", '"abc', "01"],
+    )
+    def test_invalid_json_raises_error(self, content):
+        with pytest.raises(JsonStreamError):
+            transcode(content, chunk_size=2)
+
+    def test_error_reports_offset(self):
+        with pytest.raises(JsonStreamError, match="offset 3"):
+            transcode("[1,]")
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7])
+    def test_escapes_split_across_chunks(self, chunk_size):
+        content = '["a\\u00e9b\\"c\\\\d\\n", "\\ud83d\\ude00", "plain"]'
+        output, _ = transcode(content, chunk_size=chunk_size)
+        assert output == json.dumps(json.loads(content))
+
+    @pytest.mark.parametrize(
+        "content", ['"bad \\x escape"', '"bad \\u12 escape"', '"tab\there"', '"ab\\']
+    )
+    def test_invalid_strings_raise_error(self, content):
+        with pytest.raises(JsonStreamError, match="Invalid string at offset 0"):
+            transcode(content, chunk_size=3)
+
+    def test_long_string_scanned_in_linear_time(self):
+        content = json.dumps({"blob": 'x\\u00e9"' * 250_000})
+        output, _ = transcode(content, chunk_size=1024)
+        assert output == json.dumps(json.loads(content))
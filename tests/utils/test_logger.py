@@ -1,6 +1,18 @@
+import gc
+import gzip
+import json
+import lzma
+import re
+import signal
+import subprocess
 import sys
 import tempfile
+import threading
+import time
+import weakref
+from datetime import datetime
 from io import StringIO
+from pathlib import Path
 from unittest.mock import MagicMock
 
 sys.path.insert(0, "src")
@@ -8,10 +20,14 @@ sys.path.insert(0, "src")
 import pytest  # noqa: E402
 
 from basiccli.utils.logger import (  # noqa: E402
+    AsyncLogger,
     FileLogger,
+    FlushPolicy,
     Logger,
     LogLevel,
     MultiLogger,
+    RotatingFileLogger,
+    format_timestamp,
 )
 
 
@@ -183,6 +199,195 @@ class TestFileLogger:
             assert "\033[" not in content
 
 
+class TestRotatingFileLogger:
+    @pytest.fixture
+    def log_file(self, tmp_path):
+        return tmp_path / "app.log"
+
+    def test_rotates_by_size(self, log_file):
+        logger = RotatingFileLogger(str(log_file), max_bytes=500, backup_count=None)
+        for i in range(40):
+            logger.info(f"message {i:02d}")
+        logger.close()
+
+        segments = logger.segments()
+        assert len(segments) >= 2
+        assert all(path.stat().st_size >= 500 for path in segments)
+        # Every record survives, in order, across segments and the live file
+        text = "".join(path.read_text() for path in segments + [log_file])
+        assert [line.split("| ")[-1] for line in text.splitlines()] == [
+            f"message {i:02d}" for i in range(40)
+        ]
+
+    def test_rotates_by_interval(self, log_file):
+        logger = RotatingFileLogger(str(log_file), interval=0.05)
+        logger.info("Before")
+        time.sleep(0.06)
+        logger.info("After")
+        logger.close()
+
+        (segment,) = logger.segments()
+        assert "Before" in segment.read_text()
+        assert "After" in log_file.read_text()
+
+    def test_keeps_backup_count_segments(self, log_file):
+        logger = RotatingFileLogger(str(log_file), backup_count=2)
+        for i in range(4):
+            logger.info(f"segment {i}")
+            logger.rotate()
+        logger.close()
+
+        segments = logger.segments()
+        assert len(segments) == 2
+        assert "segment 2" in segments[0].read_text()
+        assert "segment 3" in segments[1].read_text()
+
+    @pytest.mark.parametrize(
+        "compress,suffix,opener",
+        [("gzip", ".gz", gzip.open), ("lzma", ".xz", lzma.open)],
+    )
+    def test_compresses_in_background(self, log_file, compress, suffix, opener):
+        logger = RotatingFileLogger(str(log_file), compress=compress, backup_count=2)
+        for i in range(3):
+            logger.info(f"segment {i}")
+            logger.rotate()
+        logger.wait()
+
+        segments = logger.segments()
+        assert [path.suffix for path in segments] == [suffix, suffix]
+        with opener(segments[-1], "rt") as f:
+            assert "segment 2" in f.read()
+        logger.close()
+
+    def test_unknown_compression_raises_error(self, log_file):
+        with pytest.raises(ValueError, match="Unknown compression"):
+            RotatingFileLogger(str(log_file), compress="zip")
+
+
+class BlockingOutput(StringIO):
+    """StringIO whose writes wait until ``release`` is set"""
+
+    def __init__(self):
+        super().__init__()
+        self.writing = threading.Event()
+        self.release = threading.Event()
+
+    def write(self, text):
+        self.writing.set()
+        self.release.wait()
+        return super().write(text)
+
+
+class TestAsyncLogger:
+    @pytest.fixture
+    def output(self):
+        return StringIO()
+
+    def test_writes_records_in_order(self, output):
+        logger = AsyncLogger(output=output, use_colors=False)
+        for i in range(500):
+            logger.info(f"message {i}", {"i": i})
+        logger.close()
+
+        lines = output.getvalue().splitlines()
+        assert len(lines) == 500
+        assert lines[0].endswith("| message 0 | i=0")
+        assert lines[-1].endswith("| message 499 | i=499")
+
+    def test_closed_logger_can_be_collected(self, output):
+        logger = AsyncLogger(output=output, use_colors=False)
+        logger.close()
+        ref = weakref.ref(logger)
+        del logger
+        gc.collect()
+
+        assert ref() is None
+
+    def test_flush_waits_for_queued_records(self, output):
+        logger = AsyncLogger(output=output, use_colors=False)
+        logger.warn("Queued")
+        logger.flush()
+
+        assert "WARN  | Queued" in output.getvalue()
+        logger.close()
+
+    def test_level_filtering(self, output):
+        logger = AsyncLogger(output=output, use_colors=False)
+        logger.debug("Hidden")
+        logger.close()
+
+        assert output.getvalue() == ""
+
+    def test_progress_is_queued(self, output):
+        logger = AsyncLogger(output=output, use_colors=False)
+        logger.progress(2, 2, "Loading")
+        logger.close()
+
+        assert output.getvalue().startswith("\rLoading: [")
+        assert output.getvalue().endswith("(2/2)\n")
+
+    def test_drop_policy_discards_when_full(self):
+        output = BlockingOutput()
+        logger = AsyncLogger(
+            queue_size=2, overflow="drop", batch_size=1, output=output, use_colors=False
+        )
+        for i in range(50):
+            logger.info(f"message {i}")
+        dropped = logger.dropped
+        output.release.set()
+        logger.close()
+
+        assert dropped > 0
+        assert f"dropped={dropped}" in output.getvalue()
+
+    def test_errors_never_dropped(self):
+        output = BlockingOutput()
+        logger = AsyncLogger(
+            queue_size=1, overflow="drop", batch_size=1, output=output, use_colors=False
+        )
+        for i in range(5):
+            logger.info(f"message {i}")
+        threading.Timer(0.05, output.release.set).start()
+        logger.error("Must survive")
+        logger.close()
+
+        assert "Must survive" in output.getvalue()
+
+    def test_sample_policy_keeps_every_nth(self):
+        output = BlockingOutput()
+        logger = AsyncLogger(
+            queue_size=1,
+            overflow="sample",
+            sample_every=5,
+            batch_size=1,
+            output=output,
+            use_colors=False,
+        )
+        logger.info("message 0")
+        output.writing.wait()
+        logger.info("message 1")
+        # The queue is full from here on: 2-5 are dropped and 6 waits for space
+        threading.Timer(0.05, output.release.set).start()
+        for i in range(2, 7):
+            logger.info(f"message {i}")
+        logger.close()
+
+        assert logger.dropped == 4
+        assert "message 2" not in output.getvalue()
+        assert "message 6" in output.getvalue()
+
+    def test_unknown_overflow_policy_raises_error(self, output):
+        with pytest.raises(ValueError, match="Unknown overflow policy"):
+            AsyncLogger(overflow="spill", output=output)
+
+    def test_logs_after_close_written_directly(self, output):
+        logger = AsyncLogger(output=output, use_colors=False)
+        logger.close()
+        logger.info("Late")
+
+        assert "Late" in output.getvalue()
+
+
 class TestMultiLogger:
     @pytest.fixture
     def outputs(self):
@@ -198,11 +403,14 @@ class TestMultiLogger:
     @pytest.fixture
     def multi_logger(self, loggers):
         logger1, logger2 = loggers
-        return MultiLogger(logger1, logger2)
+        multi_logger = MultiLogger(logger1, logger2)
+        yield multi_logger
+        multi_logger.close()
 
     def test_logs_to_all_loggers(self, multi_logger, outputs):
         output1, output2 = outputs
         multi_logger.info("Multi message")
+        multi_logger.flush()
 
         assert "Multi message" in output1.getvalue()
         assert "Multi message" in output2.getvalue()
@@ -216,16 +424,398 @@ class TestMultiLogger:
 
         for level_name in ["debug", "info", "warn", "error", "fatal"]:
             getattr(multi_logger, level_name)(f"{level_name} message")
+            multi_logger.flush()
 
             assert level_name.upper() in output1.getvalue()
             assert level_name.upper() in output2.getvalue()
 
+    def test_closed_logger_can_be_collected(self, loggers):
+        multi_logger = MultiLogger(*loggers)
+        multi_logger.close()
+        ref = weakref.ref(multi_logger)
+        del multi_logger
+        gc.collect()
+
+        assert ref() is None
+
+    def test_closes_open_loggers_at_exit(self, tmp_path):
+        log_file = tmp_path / "app.log"
+        script = (
+            "import sys; sys.path.insert(0, 'src')\n"
+            "from basiccli.utils.logger import FileLogger, MultiLogger\n"
+            f"logger = MultiLogger(FileLogger({str(log_file)!r}))\n"
+            "logger.info('Written at exit')\n"
+        )
+
+        subprocess.run([sys.executable, "-c", script], check=True)
+
+        assert "Written at exit" in log_file.read_text()
+
     def test_delegates_with_timing(self, multi_logger, outputs):
         output1, output2 = outputs
 
         with multi_logger.with_timing("Task"):
             pass
+        multi_logger.flush()
+
+        for output in outputs:
+            assert "Starting: Task" in output.getvalue()
+            assert "Completed: Task" in output.getvalue()
+
+    def test_sinks_keep_their_own_level(self, multi_logger, loggers, outputs):
+        loggers[1].level = LogLevel.ERROR
+        multi_logger.info("Info only")
+        multi_logger.error("Both")
+        multi_logger.flush()
+
+        assert "Info only" in outputs[0].getvalue()
+        assert "Info only" not in outputs[1].getvalue()
+        assert "Both" in outputs[1].getvalue()
+
+    def test_sinks_keep_their_own_format(self):
+        text_output, json_output = StringIO(), StringIO()
+        multi_logger = MultiLogger(
+            Logger(output=text_output, use_colors=False),
+            Logger(output=json_output, format="json"),
+        )
+        multi_logger.warn("Disk %d%% full", 91)
+        multi_logger.close()
+
+        assert text_output.getvalue().endswith("WARN  | Disk 91% full\n")
+        assert json.loads(json_output.getvalue())["message"] == "Disk 91% full"
+
+    def test_formats_once_per_format(self, outputs):
+        calls = []
+
+        class RecordingLogger(Logger):
+            def _format_message(self, *args):
+                calls.append(args)
+                return super()._format_message(*args)
+
+        multi_logger = MultiLogger(
+            *(RecordingLogger(output=o, use_colors=False) for o in outputs)
+        )
+        multi_logger.info("Once")
+        multi_logger.close()
+
+        assert len(calls) == 1
+        assert outputs[0].getvalue() == outputs[1].getvalue()
+
+    def test_slow_sink_does_not_block_others(self, outputs):
+        slow = BlockingOutput()
+        fast = outputs[0]
+        multi_logger = MultiLogger(
+            Logger(output=slow, use_colors=False),
+            Logger(output=fast, use_colors=False),
+        )
+
+        multi_logger.info("First")
+        slow.writing.wait()
+        multi_logger.info("Second")
+        deadline = time.monotonic() + 2
+        while "Second" not in fast.getvalue() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert "Second" in fast.getvalue()
+        assert "Second" not in slow.getvalue()
+        slow.release.set()
+        multi_logger.close()
+        assert "Second" in slow.getvalue()
+
+    def test_progress_reaches_every_sink(self, multi_logger, outputs):
+        multi_logger.progress(1, 1, "Done")
+        multi_logger.flush()
+
+        for output in outputs:
+            assert output.getvalue().startswith("\rDone: [")
+
+    def test_logs_after_close_written_directly(self, multi_logger, outputs):
+        multi_logger.close()
+        multi_logger.info("Late")
+
+        assert "Late" in outputs[0].getvalue()
+        assert "Late" in outputs[1].getvalue()
+
+
+class CountingOutput(StringIO):
+    def __init__(self):
+        super().__init__()
+        self.flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+        super().flush()
+
+
+class TestFlushPolicy:
+    @pytest.fixture
+    def output(self):
+        return CountingOutput()
+
+    def test_default_flushes_every_record(self, output):
+        logger = Logger(output=output, use_colors=False)
+        logger.info("One")
+        logger.info("Two")
+
+        assert output.flushes == 2
+
+    def test_flushes_every_n_records(self, output):
+        logger = Logger(
+            output=output, use_colors=False, flush_policy=FlushPolicy(records=3)
+        )
+        for i in range(7):
+            logger.info(f"message {i}")
+
+        assert output.flushes == 2
+        logger.flush()
+        assert output.flushes == 3
+
+    def test_flushes_at_level(self, output):
+        policy = FlushPolicy(records=None, level=LogLevel.ERROR)
+        logger = Logger(output=output, use_colors=False, flush_policy=policy)
+        logger.info("Buffered")
+        logger.warn("Buffered")
+        assert output.flushes == 0
+
+        logger.error("Flushed")
+        assert output.flushes == 1
+
+    def test_interval_flushes_without_new_records(self, output):
+        policy = FlushPolicy(records=None, interval_ms=10)
+        logger = Logger(output=output, use_colors=False, flush_policy=policy)
+        logger.info("Pending")
+
+        deadline = time.monotonic() + 2
+        while output.flushes == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert output.flushes >= 1
+
+    def test_should_flush_after_interval(self):
+        policy = FlushPolicy(records=None, interval_ms=100)
+
+        assert not policy.should_flush(LogLevel.INFO, 5, time.monotonic())
+        assert policy.should_flush(LogLevel.INFO, 5, time.monotonic() - 1)
+
+    def test_async_logger_batches_flushes(self, output):
+        logger = AsyncLogger(
+            output=output, use_colors=False, flush_policy=FlushPolicy(records=None)
+        )
+        for i in range(100):
+            logger.info(f"message {i}")
+        logger.close()
+
+        assert len(output.getvalue().splitlines()) == 100
+        assert output.flushes == 1
+
+    def test_file_logger_flushes_buffer_on_sigterm(self, tmp_path):
+        log_file = tmp_path / "app.log"
+        script = (
+            "import os, signal, sys; sys.path.insert(0, 'src')\n"
+            "from basiccli.utils.logger import FileLogger, FlushPolicy\n"
+            f"logger = FileLogger({str(log_file)!r}, "
+            "flush_policy=FlushPolicy(records=1000))\n"
+            "logger.info('Buffered before SIGTERM')\n"
+            "os.kill(os.getpid(), signal.SIGTERM)\n"
+        )
+
+        completed = subprocess.run([sys.executable, "-c", script])
+
+        assert completed.returncode == -signal.SIGTERM
+        assert "Buffered before SIGTERM" in log_file.read_text()
+
+
+class TestJsonFormat:
+    @pytest.fixture
+    def output(self):
+        return StringIO()
+
+    @pytest.fixture
+    def logger(self, output):
+        return Logger(output=output, format="json")
+
+    def test_one_json_object_per_line(self, logger, output):
+        logger.info("First")
+        logger.warn("Second")
+
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert [r["level"] for r in records] == ["INFO", "WARN"]
+        assert [r["message"] for r in records] == ["First", "Second"]
+        assert datetime.fromisoformat(records[0]["timestamp"])
+
+    def test_metadata_field(self, logger, output):
+        logger.info("With metadata", {"count": 3, "tags": ["a", "b"], "ok": True})
+
+        record = json.loads(output.getvalue())
+        assert record["metadata"] == {"count": 3, "tags": ["a", "b"], "ok": True}
+
+    def test_omits_empty_metadata(self, logger, output):
+        logger.info("Plain")
+
+        assert "metadata" not in json.loads(output.getvalue())
+
+    def test_escapes_message(self, logger, output):
+        logger.info('Quote " newline \n unicode é')
+
+        lines = output.getvalue().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["message"] == 'Quote " newline \n unicode é'
+
+    def test_unserializable_metadata_uses_repr(self, logger, output):
+        logger.info("Path", {"path": Path("/tmp/x")})
+
+        record = json.loads(output.getvalue())
+        assert record["metadata"]["path"] == repr(Path("/tmp/x"))
+
+    def test_non_finite_floats_stay_strict_json(self, logger, output):
+        logger.info("Stats", {"mean": float("nan"), "max": [float("inf"), 1.5]})
+
+        record = json.loads(output.getvalue(), parse_constant=pytest.fail)
+        assert record["metadata"] == {"mean": "nan", "max": ["inf", 1.5]}
+
+    def test_circular_metadata_uses_repr(self, logger, output):
+        metadata = {"name": "loop"}
+        metadata["self"] = metadata
+
+        logger.info("Circular", metadata)
+
+        record = json.loads(output.getvalue())
+        assert record["metadata"]["name"] == "loop"
+        assert record["metadata"]["self"] == repr(metadata)
+
+    def test_no_colors_in_json(self):
+        tty_output = MagicMock()
+        tty_output.isatty.return_value = True
+        logger = Logger(output=tty_output, format="json")
+
+        logger.info("Message")
+
+        written = tty_output.write.call_args[0][0]
+        assert "\033[" not in written
+        assert json.loads(written)["message"] == "Message"
+
+    def test_async_logger_json(self, output):
+        logger = AsyncLogger(output=output, format="json")
+        logger.error("Queued", {"id": 1})
+        logger.close()
+
+        record = json.loads(output.getvalue())
+        assert record["level"] == "ERROR"
+        assert record["metadata"] == {"id": 1}
+
+    def test_unknown_format_raises_error(self, output):
+        with pytest.raises(ValueError, match="Unknown log format"):
+            Logger(output=output, format="xml")
+
+
+class TestFastPath:
+    @pytest.fixture
+    def output(self):
+        return StringIO()
+
+    @pytest.fixture
+    def logger(self, output):
+        return Logger(output=output, use_colors=False)
+
+    def test_lazy_format_arguments(self, logger, output):
+        logger.info("Loaded %d records from %s", 3, "users.json")
+
+        assert output.getvalue().endswith("| Loaded 3 records from users.json\n")
+
+    def test_lazy_format_with_metadata(self, logger, output):
+        logger.info("Loaded %d records", {"file": "users.json"}, 3)
+
+        assert output.getvalue().endswith("| Loaded 3 records | file='users.json'\n")
+
+    def test_none_is_a_format_argument(self, output):
+        logger = Logger(output=output, level=LogLevel.DEBUG, use_colors=False)
+        logger.debug("x=%s", None)
+
+        assert output.getvalue().endswith("| x=None\n")
+
+    def test_none_followed_by_more_format_arguments(self, logger, output):
+        logger.info("a=%s b=%s", None, 2)
+
+        assert output.getvalue().endswith("| a=None b=2\n")
+
+    def test_metadata_none_keyword_means_no_metadata(self, logger, output):
+        logger.info("Plain message", metadata=None)
+        logger.info("Plain message", None)
+
+        assert output.getvalue().splitlines()[0].endswith("| Plain message")
+        assert output.getvalue().splitlines()[1].endswith("| Plain message")
+
+    def test_dict_is_format_argument_with_placeholders(self, logger, output):
+        logger.info("x=%s", {"a": 1})
+        logger.info("user=%(name)s", {"name": "alice"})
+        logger.info("No placeholders", {"a": 1})
+
+        lines = output.getvalue().splitlines()
+        assert lines[0].endswith("| x={'a': 1}")
+        assert lines[1].endswith("| user=alice")
+        assert lines[2].endswith("| No placeholders | a=1")
+
+    def test_literal_percent_is_not_a_placeholder(self, logger, output):
+        logger.info("100%% done", {"step": 3})
+
+        assert output.getvalue().endswith("| 100%% done | step=3\n")
+
+    @pytest.mark.parametrize(
+        "message, args",
+        [("%d items", ("many",)), ("%s and %s", (1,)), ("%(missing)s", ({},))],
+    )
+    def test_formatting_errors_never_raise(self, logger, output, message, args):
+        logger.info(message, *args)
+
+        assert "formatting failed" in output.getvalue()
+        assert message in output.getvalue()
+
+    def test_none_format_argument_through_async_and_multi(self, output):
+        async_logger = AsyncLogger(output=output, use_colors=False)
+        multi_logger = MultiLogger(Logger(output=output, use_colors=False))
+        async_logger.info("async=%s", None)
+        async_logger.close()
+        multi_logger.info("multi=%s", None)
+        multi_logger.close()
+
+        assert "| async=None\n" in output.getvalue()
+        assert "| multi=None\n" in output.getvalue()
+
+    def test_disabled_level_skips_formatting(self, logger, output):
+        class Exploding:
+            def __str__(self):
+                raise AssertionError("formatted a disabled record")
+
+        logger.debug("Value %s", Exploding())
+
+        assert output.getvalue() == ""
+
+    def test_async_logger_formats_at_call_time(self, output):
+        logger = AsyncLogger(output=output, use_colors=False)
+        values = [1]
+        logger.info("Values %s", values)
+        values.append(2)
+        logger.close()
+
+        assert "Values [1]" in output.getvalue()
+
+    def test_format_timestamp_matches_isoformat(self):
+        created = time.time()
+
+        assert (
+            format_timestamp(created)[:19]
+            == datetime.fromtimestamp(created).isoformat()[:19]
+        )
+        assert re.fullmatch(
+            r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}", format_timestamp(created)
+        )
+
+    def test_format_timestamp_cache_per_second(self):
+        assert format_timestamp(1_000_000_000.25).endswith(":40.250000")
+        assert format_timestamp(1_000_000_001.5).endswith(":41.500000")
+        assert format_timestamp(1_000_000_000.75).endswith(":40.750000")
+
+    def test_toggling_colors_updates_prefixes(self, logger, output):
+        logger.use_colors = True
+        logger.warn("Colored")
 
-        output1_str = output1.getvalue()
-        assert "Starting: Task" in output1_str
-        assert "Completed: Task" in output1_str
+        assert output.getvalue().startswith(Logger.COLORS[LogLevel.WARN] + "[")
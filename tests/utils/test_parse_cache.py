@@ -0,0 +1,189 @@
+import os
+import sys
+
+sys.path.insert(0, "src")
+
+import pytest  # noqa: E402
+
+from basiccli.utils.file_handler import FileHandler  # noqa: E402
+from basiccli.utils.parse_cache import ParseCache  # noqa: E402
+
+
+class CountingLoader:
+    def __init__(self, value="parsed"):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+class TestParseCache:
+    @pytest.fixture
+    def config(self, tmp_path):
+        filepath = tmp_path / "config.yaml"
+        FileHandler.write(filepath, {"name": "app", "workers": 4})
+        return filepath
+
+    def test_hit_skips_parsing(self, config):
+        cache = ParseCache()
+        load = CountingLoader()
+
+        assert cache.get(config, "yaml", load) == "parsed"
+        assert cache.get(config, "yaml", load) == "parsed"
+
+        assert load.calls == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["hit_rate"] == 0.5
+
+    def test_modified_file_is_reparsed(self, config):
+        cache = ParseCache()
+        load = CountingLoader()
+        cache.get(config, "yaml", load)
+
+        config.write_text("name: changed\n")
+        stat = config.stat()
+        os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        cache.get(config, "yaml", load)
+
+        assert load.calls == 2
+
+    def test_checksum_key_survives_touch(self, config):
+        cache = ParseCache(key="checksum")
+        load = CountingLoader()
+        cache.get(config, "yaml", load)
+
+        os.utime(config, (1, 1))
+        cache.get(config, "yaml", load)
+
+        assert load.calls == 1
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = ParseCache(max_entries=2)
+        paths = []
+        for name in ["a", "b", "c"]:
+            path = tmp_path / f"{name}.json"
+            path.write_text("{}")
+            paths.append(path)
+
+        for path in paths[:2]:
+            cache.get(path, "json", CountingLoader())
+        cache.get(paths[0], "json", CountingLoader())
+        cache.get(paths[2], "json", CountingLoader())
+
+        load = CountingLoader()
+        cache.get(paths[0], "json", load)
+        cache.get(paths[1], "json", load)
+        assert load.calls == 1
+        assert cache.stats()["evictions"] == 2
+
+    def test_byte_limit(self, config):
+        cache = ParseCache(max_bytes=config.stat().st_size - 1)
+        load = CountingLoader()
+
+        cache.get(config, "yaml", load)
+        cache.get(config, "yaml", load)
+
+        assert load.calls == 2
+        assert cache.stats()["entries"] == 0
+
+    def test_disk_tier_shared_between_caches(self, config, tmp_path):
+        directory = tmp_path / "cache"
+        ParseCache(directory=directory).get(config, "yaml", CountingLoader({"x": 1}))
+
+        other = ParseCache(directory=directory)
+        load = CountingLoader()
+        assert other.get(config, "yaml", load) == {"x": 1}
+        assert load.calls == 0
+        assert other.stats()["disk_hits"] == 1
+
+    def test_corrupt_disk_entry_is_reparsed(self, config, tmp_path):
+        directory = tmp_path / "cache"
+        ParseCache(directory=directory).get(config, "yaml", CountingLoader())
+        for entry in directory.iterdir():
+            entry.write_bytes(b"not a pickle")
+
+        load = CountingLoader()
+        assert ParseCache(directory=directory).get(config, "yaml", load) == "parsed"
+        assert load.calls == 1
+
+    def test_changed_file_replaces_disk_entry(self, config, tmp_path):
+        directory = tmp_path / "cache"
+        cache = ParseCache(directory=directory)
+        cache.get(config, "yaml", CountingLoader("old"))
+
+        config.write_text("name: changed\n")
+        stat = config.stat()
+        os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        cache.get(config, "yaml", CountingLoader("new"))
+
+        load = CountingLoader()
+        assert len(list(directory.iterdir())) == 1
+        assert ParseCache(directory=directory).get(config, "yaml", load) == "new"
+        assert load.calls == 0
+
+    def test_disk_tier_evicts_least_recently_used(self, tmp_path):
+        directory = tmp_path / "cache"
+        cache = ParseCache(max_entries=0, directory=directory, max_disk_entries=2)
+        paths = []
+        for age, name in enumerate(["a", "b", "c"], start=1):
+            path = tmp_path / f"{name}.json"
+            path.write_text("{}")
+            paths.append(path)
+            before = set(directory.glob("*.pickle"))
+            cache.get(path, "json", CountingLoader())
+            for entry in set(directory.glob("*.pickle")) - before:
+                os.utime(entry, (age, age))
+
+        load = CountingLoader()
+        cache.get(paths[2], "json", load)
+        assert load.calls == 0
+        cache.get(paths[0], "json", load)
+        assert load.calls == 1
+        assert cache.stats()["disk_evictions"] == 2
+        assert len(list(directory.glob("*.pickle"))) == 2
+
+    def test_disk_byte_limit(self, config, tmp_path):
+        directory = tmp_path / "cache"
+        cache = ParseCache(directory=directory, max_disk_bytes=0)
+
+        cache.get(config, "yaml", CountingLoader())
+
+        assert list(directory.iterdir()) == []
+        assert cache.stats()["disk_evictions"] == 1
+
+    def test_clear_disk(self, config, tmp_path):
+        directory = tmp_path / "cache"
+        cache = ParseCache(directory=directory)
+        cache.get(config, "yaml", CountingLoader())
+
+        cache.clear()
+        assert len(list(directory.iterdir())) == 1
+
+        cache.clear(disk=True)
+        assert list(directory.iterdir()) == []
+        assert cache.stats()["entries"] == 0
+
+    def test_unknown_key_raises_error(self):
+        with pytest.raises(ValueError, match="Unknown cache key"):
+            ParseCache(key="inode")
+
+    def test_file_handler_read_with_cache(self, config):
+        cache = ParseCache()
+
+        first = FileHandler.read(config, cache=cache)
+        second = FileHandler.read(config, cache=cache)
+
+        assert first == {"name": "app", "workers": 4}
+        assert second is first
+        assert cache.stats()["hits"] == 1
+
+    def test_file_handler_text_not_cached(self, tmp_path):
+        filepath = tmp_path / "notes.txt"
+        filepath.write_text("notes")
+        cache = ParseCache()
+
+        assert FileHandler.read(filepath, cache=cache) == "notes"
+        assert cache.stats()["misses"] == 0
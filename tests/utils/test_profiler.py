@@ -0,0 +1,61 @@
+import pstats
+import sys
+import time
+
+sys.path.insert(0, "src")
+
+import pytest  # noqa: E402
+
+from basiccli.utils.profiler import Profiler  # noqa: E402
+
+
+def busy_wait(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def outer():
+    busy_wait(0.05)
+
+
+class TestProfiler:
+    @pytest.fixture
+    def profiler(self, tmp_path):
+        profiler = Profiler(tmp_path / "out" / "run")
+        profiler.start()
+        outer()
+        profiler.stop()
+        return profiler
+
+    def test_writes_pstats_file(self, profiler):
+        pstats_path, _ = profiler.write()
+
+        stats = pstats.Stats(str(pstats_path))
+        functions = {name for _, _, name in stats.stats}
+        assert "outer" in functions
+        assert "busy_wait" in functions
+
+    def test_writes_collapsed_stacks(self, profiler):
+        _, collapsed_path = profiler.write()
+
+        lines = collapsed_path.read_text().splitlines()
+        assert lines
+        stack, count = lines[0].rsplit(" ", 1)
+        assert int(count) > 0
+        assert any(f"{__name__}:outer;{__name__}:busy_wait" in line for line in lines)
+
+    def test_summary_sorted_by_cumulative_time(self, profiler):
+        summary = profiler.summary(limit=5)
+
+        assert "Ordered by: cumulative time" in summary
+        assert "busy_wait" in summary
+
+    def test_finish_reports_paths(self, tmp_path, capsys):
+        profiler = Profiler(tmp_path / "run")
+        profiler.start()
+        outer()
+        profiler.finish()
+
+        err = capsys.readouterr().err
+        assert f"Profile written to {tmp_path / 'run.pstats'}" in err